@@ -0,0 +1,255 @@
+# Benchmarks dos trechos críticos do Algoritmo Genético ( micro ) e da execução completa ( macro: gerações por segundo )
+# Utiliza ligas sintéticas de 20/40/80/128 Equipes geradas com semente fixa, registra o pico de memória de cada benchmark,
+# grava os resultados em JSON e compara-os com uma execução de referência ( baseline ) p/ identificar regressões
+#   python benchmark_ga.py --output benchmark.json
+#   python benchmark_ga.py --baseline benchmark.json --tolerance 0.20
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from datetime import datetime
+from typing import Callable, List
+import numpy as np
+import pandas as pd
+from genetic_algorithm import *
+from utils_tco import *
+from problem_context import generate_problem_context
+from solver import SolverConfig, solve
+from random_streams import RandomStreams
+
+SEED = 42
+
+# Métricas de cada benchmark e se o valor maior é melhor
+METRICS = {
+    "time_us": False,
+    "generations_per_second": True,
+    "peak_memory_kb": False,
+}
+
+def generate_synthetic_teams(n_teams: int, seed: int = SEED) -> list:
+    """
+    Gera uma liga sintética com o mesmo formato dos dados lidos do arquivo de Equipes ( generate_teams_list_by_file )
+    As Equipes são distribuídas no território brasileiro e, como no Campeonato real, cerca de 1/4 delas divide a Cidade com outra Equipe
+
+    Parâmetros:
+        n_teams (int): Quantidade de Equipes ( par )
+        seed (int): Semente do gerador de números aleatórios
+
+    Retorna:
+        Lista de dicionário de dados referentes as equipes participantes do Campeonato
+    """
+    rng = np.random.default_rng(seed)
+    code_len = get_code_len(n_teams)
+    n_shared = n_teams // 4
+    teams = []
+
+    for i in range(n_teams):
+        n_city = i // 2 if i < n_shared else i
+        if i < n_shared and i % 2:
+            latitude, longitude = teams[-1]["Latitude"], teams[-1]["Longitude"]
+        else:
+            latitude, longitude = rng.uniform(-30.0, -3.0), rng.uniform(-55.0, -35.0)
+        teams.append({"Codigo": f"{i + 1:0{code_len}}", "Nome do Time": f"Time {i + 1:0{code_len}}", "Cidade do Time": f"Cidade {n_city + 1:0{code_len}}",
+                      "Latitude": round(float(latitude), 4), "Longitude": round(float(longitude), 4)})
+
+    return teams
+
+def time_function(function: Callable, n_repeat: int = 5, n_number: int = None) -> float:
+    """
+    Mede o tempo de execução de uma função ( melhor de n_repeat medições, cada uma com n_number execuções )
+
+    Parâmetros:
+        function (Callable): Função sem parâmetros a ser medida
+        n_repeat (int): Nº de medições
+        n_number (int): Nº de execuções por medição ( None = ajustado p/ medições de ~0.2 s )
+
+    Retorna:
+        float: Tempo de uma execução ( microssegundos )
+    """
+    timer = timeit.Timer(function)
+    if n_number is None:
+        n_number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat=n_repeat, number=n_number)) / n_number * 1e6
+
+def measure_peak_memory(function: Callable) -> float:
+    """
+    Mede o pico de memória alocada ( Python e NumPy ) durante uma execução da função
+
+    Retorna:
+        float: Pico de memória ( KB )
+    """
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak / 1024
+
+def run_micro_benchmarks(n_teams: int, population_size: int, n_repeat: int = 5) -> dict:
+    """
+    Mede o tempo e o pico de memória das funções críticas do Algoritmo Genético em uma liga sintética
+
+    Parâmetros:
+        n_teams (int): Quantidade de Equipes da liga sintética
+        population_size (int): Tamanho da população ( avaliação em lote e ordenação )
+        n_repeat (int): Nº de medições de cada função
+
+    Retorna:
+        Dicionário com as métricas de cada benchmark
+    """
+    streams = RandomStreams(SEED)
+    crossover_rng, mutation_rng = streams.numpy("crossover"), streams.python("mutation")
+
+    teams = generate_synthetic_teams(n_teams)
+    context = generate_problem_context(teams)
+    population = generate_random_schedules(teams, population_size, streams.python("initialization"))
+    population_fitness = calculate_population_fitness(population, context)
+    population_list = list(population)
+    parent2_index = generate_game_index(population[1])
+
+    benchmarks = {
+        f"calculate_fitness/n{n_teams}": lambda: calculate_fitness(population[0], context),
+        f"calculate_population_fitness/n{n_teams}/p{population_size}": lambda: calculate_population_fitness(population, context),
+        f"order_crossover/n{n_teams}": lambda: order_crossover(population[0], population[1], parent2_index, crossover_rng),
+        # mutation_probability = 1 garante que a mutação sempre ocorre
+        f"mutate/n{n_teams}": lambda: mutate(population[0], 1.0, 0.1, context, mutation_rng),
+        f"sort_population/n{n_teams}/p{population_size}": lambda: sort_population(population_list, population_fitness),
+        f"generate_matrix_distances/n{n_teams}": lambda: generate_matrix_distances(teams),
+    }
+
+    results = {}
+    for name, function in benchmarks.items():
+        results[name] = {"time_us": time_function(function, n_repeat), "peak_memory_kb": measure_peak_memory(function)}
+
+    return results
+
+def run_macro_benchmark(n_teams: int, population_size: int, n_generations: int = 20) -> dict:
+    """
+    Mede as gerações por segundo de uma execução completa do Solver ( solve ) em uma liga sintética
+    A inicialização ( leitura das Equipes e população inicial ) não é considerada no tempo
+    O pico de memória é medido numa segunda execução, mais curta, pois o tracemalloc torna a execução mais lenta
+
+    Parâmetros:
+        n_teams (int): Quantidade de Equipes da liga sintética
+        population_size (int): Tamanho da população
+        n_generations (int): Nº de gerações
+
+    Retorna:
+        Dicionário com as métricas do benchmark
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        teams_file = os.path.join(directory, "teams.csv")
+        pd.DataFrame(generate_synthetic_teams(n_teams)).to_csv(teams_file, sep=";", encoding="ISO-8859-1", index=False)
+
+        config = SolverConfig(teams_file=teams_file, population_size=population_size, max_generations=max(n_generations, 2),
+                              seed=SEED, distance_cache_dir=None)
+        generation_times = []
+        solve(config, [lambda generation, population, population_fitness, result: generation_times.append(time.perf_counter())])
+
+        config.max_generations = min(config.max_generations, 5)
+        peak_memory_kb = measure_peak_memory(lambda: solve(config))
+
+    return {"generations_per_second": (len(generation_times) - 1) / (generation_times[-1] - generation_times[0]),
+            "peak_memory_kb": peak_memory_kb}
+
+def run_benchmarks(league_sizes: List[int], population_sizes: List[int], n_generations: int = 20, n_repeat: int = 5) -> dict:
+    """
+    Executa os benchmarks micro e macro p/ cada tamanho de liga e de população
+
+    Retorna:
+        Dicionário com os dados da execução ( metadata ) e as métricas de cada benchmark ( results )
+    """
+    results = {}
+    for n_teams in league_sizes:
+        for population_size in population_sizes:
+            for name, metrics in run_micro_benchmarks(n_teams, population_size, n_repeat).items():
+                results.setdefault(name, metrics)
+            results[f"generations/n{n_teams}/p{population_size}"] = run_macro_benchmark(n_teams, population_size, n_generations)
+            print(f"{n_teams} Equipes, população {population_size}: "
+                  f"{results[f'generations/n{n_teams}/p{population_size}']['generations_per_second']:.2f} gerações/s", file=sys.stderr)
+
+    metadata = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": SEED,
+        "league_sizes": league_sizes,
+        "population_sizes": population_sizes,
+        "n_generations": n_generations,
+    }
+
+    return {"metadata": metadata, "results": results}
+
+def compare_with_baseline(benchmark: dict, baseline: dict, tolerance: float = 0.20) -> List[dict]:
+    """
+    Compara os resultados com os de uma execução de referência
+
+    Parâmetros:
+        benchmark (dict): Resultado de run_benchmarks
+        baseline (dict): Resultado de referência ( mesmo formato )
+        tolerance (float): Piora relativa aceita antes de considerar regressão ( 0.20 = 20% )
+
+    Retorna:
+        Lista com a comparação de cada métrica presente nos 2 resultados ( benchmark, metric, baseline, current, change, regression )
+    """
+    comparison = []
+    for name, metrics in benchmark["results"].items():
+        baseline_metrics = baseline["results"].get(name, {})
+        for metric, value in metrics.items():
+            baseline_value = baseline_metrics.get(metric)
+            if not baseline_value:
+                continue
+            change = value / baseline_value - 1
+            worse = -change if METRICS[metric] else change
+            comparison.append({"benchmark": name, "metric": metric, "baseline": baseline_value, "current": value,
+                               "change": change, "regression": worse > tolerance})
+
+    return comparison
+
+def print_comparison(comparison: List[dict]):
+    for item in comparison:
+        flag = "REGRESSION" if item["regression"] else ""
+        print(f"{item['benchmark']:<45} {item['metric']:<24} {item['baseline']:>14.2f} {item['current']:>14.2f} {item['change']:>+8.1%} {flag}")
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks do Algoritmo Genético em ligas sintéticas")
+    parser.add_argument("--leagues", dest="league_sizes", type=int, nargs="+", default=[20, 40, 80, 128], help="nº de Equipes de cada liga sintética")
+    parser.add_argument("--population-sizes", type=int, nargs="+", default=[100, 400], help="tamanhos de população")
+    parser.add_argument("--generations", dest="n_generations", type=int, default=20, help="nº de gerações do benchmark macro")
+    parser.add_argument("--repeat", dest="n_repeat", type=int, default=5, help="nº de medições de cada função")
+    parser.add_argument("--output", help="arquivo .json a ser gravado com os resultados")
+    parser.add_argument("--baseline", help="arquivo .json com os resultados de referência")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="piora relativa aceita antes de considerar regressão")
+    args = parser.parse_args(argv)
+
+    benchmark = run_benchmarks(args.league_sizes, args.population_sizes, args.n_generations, args.n_repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(benchmark, file, indent=2)
+
+    if not args.baseline:
+        print(json.dumps(benchmark["results"], indent=2))
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    comparison = compare_with_baseline(benchmark, baseline, args.tolerance)
+    print_comparison(comparison)
+
+    return 1 if any(item["regression"] for item in comparison) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,24 +3,20 @@
 
 from utils_tco import *
 from genetic_algorithm import *
+from problem_context import generate_problem_context
 
 arq = "dados/Times_Brasileirao_2025_Serie_A.csv"
 sep = ";"
 encoding = "ISO-8859-1"
 teams = generate_teams_list_by_file(arq, sep, encoding)
 
-matrix_distances = generate_matrix_distances(teams)
-
-teams_distance_traveled = generate_teams_distance_traveled(matrix_distances)
+context = generate_problem_context(teams)
 
 print("\nCálculo das Distâncias das viagens apenas de ida por Equipe:\n")
-for team_code, distance in teams_distance_traveled.items():
-    team = search_team_by_code(teams, team_code)
-    print(f"Equipe {team_code} - {get_team_name(team)} : {distance} km percorridos")
+for team_code, team_name, distance in zip(context.teams_code, context.teams_name, context.teams_distance_traveled):
+    print(f"Equipe {team_code} - {team_name} : {distance} km percorridos")
 print("\n")
 
-city_n_teams = generate_city_n_teams(teams)
-
 arq_tabela_brasileirao_2025 = "dados/Tabela_Brasileirao_2025_Serie_A.csv"
 sep = ";"
 encoding = "ISO-8859-1"
@@ -28,5 +24,7 @@ tb2025 = generate_season_table_by_file(arq_tabela_brasileirao_2025, sep, encodin
 print("Codificação da Tabela da CBF - Brasileirão 2025 Série A - 1º Turno :\n")
 print(tb2025)
 print()
-tb2025_fitness = calculate_fitness(tb2025, teams, matrix_distances, city_n_teams, teams_distance_traveled)
-print(f"Fitness - Tabela da CBF - Brasileirão 2025 Série A - 1º Turno : {tb2025_fitness:.2f}")
\ No newline at end of file
+tb2025_fitness = calculate_fitness(encode_season(tb2025), context)
+print(f"Fitness - Tabela da CBF - Brasileirão 2025 Série A - 1º Turno : {tb2025_fitness:.2f}")
+tb2025_full_season_fitness = calculate_fitness(encode_season(tb2025), context, full_season=True)
+print(f"Fitness - Tabela da CBF - Brasileirão 2025 Série A - Turno e Returno ( espelhado ) : {tb2025_full_season_fitness:.2f}")
@@ -0,0 +1,85 @@
+# Gravação e leitura de pontos de continuação ( checkpoints ) da execução do Algoritmo Genético
+# O arquivo .npz contém a população ( Tabelas codificadas pelos índices das Equipes ), a aptidão de cada individuo,
+# o estado dos geradores de números aleatórios, o nº da geração, os parâmetros de execução e a série reduzida da melhor aptidão,
+# o suficiente p/ continuar a execução exatamente do ponto em que parou
+
+import json
+import os
+from dataclasses import dataclass
+import numpy as np
+
+CHECKPOINT_VERSION = 3
+
+@dataclass
+class Checkpoint:
+    """
+    Situação da execução ao final de uma geração
+
+    Atributos:
+        generation - Nº da última geração concluída
+        population - Array ( população x rodadas x jogos x 2 ) com a população da próxima geração
+        population_fitness - Aptidão de cada individuo da população
+        config - Parâmetros de execução ( dicionário com os campos de SolverConfig )
+        random_state - Estado dos geradores de números aleatórios de cada componente ( RandomStreams.get_state )
+        fitness_history - Série reduzida da melhor aptidão de cada geração ( DownsampledSeries.get_state )
+        cache_hits / cache_misses - Consultas atendidas / não atendidas pelo cache de aptidão
+        controller_state - Estado do controle da execução ( RunController.get_state: melhor aptidão, taxas de mutação adaptadas )
+    """
+    generation: int
+    population: np.ndarray
+    population_fitness: np.ndarray
+    config: dict
+    random_state: dict
+    fitness_history: dict
+    cache_hits: int = 0
+    cache_misses: int = 0
+    controller_state: dict = None
+
+def save_checkpoint(arq: str, checkpoint: Checkpoint):
+    """
+    Grava o checkpoint num arquivo .npz compactado
+    Grava num arquivo temporário e renomeia, p/ não deixar arquivo incompleto ( nem perder o checkpoint anterior ) em caso de interrupção
+
+    Parâmetros:
+        arq (str): Arquivo .npz a ser gravado
+        checkpoint (Checkpoint): Situação da execução
+    """
+    metadata = {
+        "version": CHECKPOINT_VERSION,
+        "generation": checkpoint.generation,
+        "config": checkpoint.config,
+        "random_state": checkpoint.random_state,
+        "cache_hits": checkpoint.cache_hits,
+        "cache_misses": checkpoint.cache_misses,
+        "controller_state": checkpoint.controller_state,
+        "fitness_history": checkpoint.fitness_history,
+    }
+
+    directory = os.path.dirname(arq)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_file = arq + f".{os.getpid()}.tmp.npz"
+    np.savez_compressed(temp_file,
+                        metadata=np.array(json.dumps(metadata)),
+                        population=np.asarray(checkpoint.population),
+                        population_fitness=np.asarray(checkpoint.population_fitness, dtype=np.float64))
+    os.replace(temp_file, arq)
+
+def load_checkpoint(arq: str) -> Checkpoint:
+    """
+    Lê um checkpoint gravado por save_checkpoint
+
+    Parâmetros:
+        arq (str): Arquivo .npz
+
+    Retorna:
+        Checkpoint com a situação da execução
+    """
+    with np.load(arq) as data:
+        metadata = json.loads(str(data["metadata"]))
+        if metadata["version"] != CHECKPOINT_VERSION:
+            raise ValueError(f"Versão de checkpoint não suportada: {metadata['version']}")
+
+        return Checkpoint(metadata["generation"], data["population"], data["population_fitness"], metadata["config"],
+                          metadata["random_state"], metadata["fitness_history"],
+                          metadata["cache_hits"], metadata["cache_misses"], metadata.get("controller_state"))
@@ -0,0 +1,49 @@
+# Diversidade da população
+# Mede a diversidade pela distância de Hamming média entre os mandos de campo de pares de individuos sorteados ( O(nº de pares) )
+
+import numpy as np
+
+def generate_population_home_patterns(population: np.ndarray) -> np.ndarray:
+    """
+    Gera a sequência de mandos de campo de cada Equipe em cada individuo
+
+    Parâmetros:
+        population (np.ndarray): Array ( população x rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+
+    Retorna:
+        np.ndarray: Array booleano ( população x rodadas x equipes ), True quando a Equipe é Mandante na rodada
+    """
+    population = np.asarray(population)
+    n_individuals, n_rounds, round_ngames, _ = population.shape
+    home = np.zeros((n_individuals, n_rounds, round_ngames * 2), dtype=bool)
+    np.put_along_axis(home, population[..., 0].astype(np.intp), True, axis=-1)
+    return home
+
+def estimate_population_diversity(population: np.ndarray, n_pairs: int = 100, rng: np.random.Generator = None) -> float:
+    """
+    Estima a distância de Hamming média entre os mandos de campo de 2 individuos da população, sorteando n_pairs pares distintos
+    O resultado varia de 0 ( população de cópias ) a ~0.5 ( mandos de campo independentes entre os individuos )
+
+    Parâmetros:
+        population: Array ( população x rodadas x jogos x 2 ) ou Lista de arrays ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        n_pairs (int): Nº de pares sorteados
+        rng (np.random.Generator): Gerador de números aleatórios ( None = módulo np.random )
+
+    Retorna:
+        float: Fração média de ( rodada, Equipe ) com mando de campo diferente entre os 2 individuos de cada par
+    """
+    if rng is None:
+        rng = np.random
+
+    n_individuals = len(population)
+    if n_individuals < 2 or n_pairs < 1:
+        return 0.00
+
+    # O 2º individuo de cada par é deslocado de 1 a P - 1 posições do 1º, portanto nunca é o mesmo individuo
+    first = rng.choice(n_individuals, size=n_pairs)
+    second = (first + 1 + rng.choice(n_individuals - 1, size=n_pairs)) % n_individuals
+
+    first_home = generate_population_home_patterns(np.stack([population[n] for n in first.tolist()]))
+    second_home = generate_population_home_patterns(np.stack([population[n] for n in second.tolist()]))
+
+    return float(np.mean(first_home != second_home))
@@ -3,19 +3,90 @@
 
 import pylab
 import matplotlib.pyplot as plt
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import matplotlib
 import pygame
 from typing import List, Tuple
+from functools import lru_cache
+import queue
 import random
+import threading
+import time
+import numpy as np
 from utils_tco import *
+from problem_context import ProblemContext
 
 matplotlib.use("Agg")
 
+# Tempo máximo ( segundos ) de espera pela thread de desenho ao fechar a janela
+CLOSE_TIMEOUT = 5.0
+
+class PlotRenderer:
+    """
+    Gráfico (Matplotlib) da evolução da aptidão, reutilizando a mesma figura e a mesma linha a cada desenho
+    A série desenhada tem tamanho limitado ( DownsampledSeries ) e a imagem é transferida ao Pygame sem cópias intermediárias ( buffer RGBA )
+    A figura é criada sem o pyplot, portanto não fica registrada ( nem acumulada ) no gerenciador de figuras
+
+    Parâmetros:
+        x_label (str): Rótulo do eixo X
+        y_label (str): Rótulo do eixo Y
+        figsize: Dimensões da figura ( polegadas )
+        dpi: Resolução da figura
+    """
+
+    def __init__(self, x_label: str = 'Geração', y_label: str = 'Fitness', figsize=(4, 4), dpi=100):
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+        self.axes.set_xlabel(x_label)
+        self.axes.set_ylabel(y_label)
+        self.line, = self.axes.plot([], [])
+        self.figure.tight_layout()
+
+    def _draw(self, x: list, y: list):
+        self.line.set_data(x, y)
+        self.axes.relim()
+        self.axes.autoscale_view()
+        self.canvas.draw()
+
+    def render(self, x: list, y: list) -> pygame.Surface:
+        """
+        Atualiza a linha e gera a imagem do gráfico
+
+        Parâmetros:
+            x (list): Valores do eixo X
+            y (list): Valores do eixo Y
+
+        Retorna:
+            pygame.Surface com a imagem do gráfico
+        """
+        self._draw(x, y)
+
+        return pygame.image.frombuffer(self.canvas.buffer_rgba(), self.canvas.get_width_height(), "RGBA")
+
+    def rasterize(self, x: list, y: list) -> Tuple[bytes, Tuple[int, int]]:
+        """
+        Atualiza a linha e gera a imagem do gráfico sem utilizar o Pygame ( pode ser executado em outra thread )
+
+        Parâmetros:
+            x (list): Valores do eixo X
+            y (list): Valores do eixo Y
+
+        Retorna:
+            Tupla com os bytes RGBA da imagem ( cópia ) e as suas dimensões ( largura, altura )
+        """
+        self._draw(x, y)
+
+        return bytes(self.canvas.buffer_rgba()), self.canvas.get_width_height()
+
+# Gráficos já criados por draw_plot ( um por par de rótulos )
+_plot_renderers = {}
+
 def draw_plot(screen: pygame.Surface, x: list, y: list, x_label: str = 'Geração', y_label: str = 'Fitness') -> None:
     """
     Mostra na Tela do Pygame gráfico (Matplotlib) com a evolução da aptidão a cada geração
+    A figura é criada na primeira chamada e reutilizada nas seguintes ( PlotRenderer )
 
     Parâmetros:
         screen (pygame.Surface): A superfície do Pygame para desenhar o gráfico
@@ -26,42 +97,38 @@ def draw_plot(screen: pygame.Surface, x: list, y: list, x_label: str = 'Geraçã
 
     @author: SérgioPolimante
     """
-    fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
-    ax.plot(x, y)
-    ax.set_ylabel(y_label)
-    ax.set_xlabel(x_label)
-    plt.tight_layout()
-
-    canvas = FigureCanvasAgg(fig)
-    canvas.draw()
-    renderer = canvas.get_renderer()
-    raw_data = renderer.tostring_rgb()
-
-    size = canvas.get_width_height()
-    surf = pygame.image.fromstring(raw_data, size, "RGB")
-    screen.blit(surf, (0, 0))
+    if (x_label, y_label) not in _plot_renderers:
+        _plot_renderers[(x_label, y_label)] = PlotRenderer(x_label, y_label)
+
+    screen.blit(_plot_renderers[(x_label, y_label)].render(x, y), (0, 0))
+
+@lru_cache(maxsize=None)
+def _get_font(font_size: int) -> pygame.font.Font:
+    return pygame.font.SysFont(None, font_size)
     
-def draw_team_games(screen, season: list, teams:list, rgb_color: Tuple[int, int, int], title_rgb_color: Tuple[int, int, int], x_offset=450, y_offset=20, font_size=20):
+def draw_team_games(screen, season: np.ndarray, context: ProblemContext, rgb_color: Tuple[int, int, int], title_rgb_color: Tuple[int, int, int], x_offset=450, y_offset=20, font_size=20, team_index: int = None, rng: random.Random = None):
     """
     Desenha a tabela dos jogos de um time escolhido aleatoriamente
     
     Parâmetros
         screen (pygame.Surface): Tela do pygame onde será desenhado o texto.
-        season (list): Lista com os jogos codificados
-        teams (list): Lista de Dicionários de Equipes
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        context (ProblemContext): Contexto com os dados das Equipes
         rgb_color (tuple): Tupla com os valores da cor (rgb) a ser usada p/ imprimir os jogos devem ser impressos
         title_rgb_color (tuple): Tupla com os valores da cor (rgb) a ser usada p/ imprimir o título com o nome da Equipe que terá seus jogos mostrados
         x_offset: Posição X inicial para desenhar o texto.
         y_offset: Posição Y inicial para desenhar o texto.
         font_size: Tamanho da fonte utilizada para desenhar o texto.
+        team_index: Índice do time a ser mostrado ( None = escolhido aleatoriamente )
+        rng (random.Random): Gerador de números aleatórios utilizado na escolha do time ( None = módulo random )
     """
     pygame.draw.rect(screen, rgb_color, (( x_offset - 10), ( y_offset - 10 ), 350, 420), 2) 
 
-    team = random.choice(teams)
-    team_code = team["Codigo"]
-    team_name = get_team_name(team)
+    if team_index is None:
+        team_index = (random if rng is None else rng).randrange(context.n_teams)
+    team_name = context.teams_name[team_index]
 
-    font = pygame.font.SysFont(None, font_size)  # Define a fonte
+    font = _get_font(font_size)  # Define a fonte ( criada uma única vez por tamanho )
     
     # Exibir título
     title_text = f"Tabela do {team_name}"
@@ -69,20 +136,150 @@ def draw_team_games(screen, season: list, teams:list, rgb_color: Tuple[int, int,
     screen.blit(title_surface, ((x_offset+50), y_offset))
     y_offset += font_size + 5  # Espaçamento após o título
 
-    # Iterar sobre os jogos do time e desenhá-los na tela
-    for i, current_round in enumerate(season, start=1):
-        for j in range(0, len(current_round), 4):
-            team1_code = current_round[j:j+2]
-            team2_code = current_round[j+2:j+4]
-            if ( team1_code == team_code ) or ( team2_code == team_code ):
-                if team1_code == team_code:
-                    team2 = search_team_by_code(teams, team2_code)
-                    text_game =  team_name + " x " + get_team_name(team2)
-                else:
-                    team1 = search_team_by_code(teams, team1_code)
-                    text_game =  get_team_name(team1) + " x " + team_name
-                text_round = f"Rodada {i}: {text_game}"
-                text_surface = font.render(text_round, True, rgb_color)
-                screen.blit(text_surface, (x_offset, y_offset))
-                y_offset += font_size  # Espaçamento entre as linhas
-                break
+    # Localiza o jogo do time em cada rodada e desenha-os na tela
+    n_rounds, n_games = np.nonzero((season[..., 0] == team_index) | (season[..., 1] == team_index))
+    for i, (team1_index, team2_index) in enumerate(season[n_rounds, n_games].tolist(), start=1):
+        text_game = context.teams_name[team1_index] + " x " + context.teams_name[team2_index]
+        text_round = f"Rodada {i}: {text_game}"
+        text_surface = font.render(text_round, True, rgb_color)
+        screen.blit(text_surface, (x_offset, y_offset))
+        y_offset += font_size  # Espaçamento entre as linhas
+
+class PygameObserver:
+    """
+    Observador do Solver ( solve ) que mostra numa janela do Pygame a evolução da aptidão e os jogos de um time da melhor solução
+    A janela, os eventos e o desenho na tela são tratados na thread que executa o Solver ( exigência do SDL em alguns sistemas );
+    apenas o gráfico ( Matplotlib, a etapa mais lenta ) é gerado em uma thread própria, alimentada por uma fila de 1 posição:
+    o Algoritmo Genético apenas deposita a série da aptidão ( descartando a anterior, se ainda não desenhada ), nunca aguarda o gráfico,
+    e a tela é redesenhada quando uma nova imagem do gráfico fica pronta
+    Uma nova série é enviada no máximo a cada redraw_generations gerações e redraw_interval_ms milissegundos ( e fps vezes por segundo )
+    A execução é encerrada ao fechar a janela, pressionar a tecla 'q' ou em caso de erro no gráfico ( relançado em close )
+
+    Parâmetros:
+        width, height: Dimensões da janela
+        fps: Nº máximo de desenhos por segundo
+        redraw_generations: Nº mínimo de gerações entre os desenhos
+        redraw_interval_ms: Tempo mínimo ( milissegundos ) entre os desenhos
+        rng: Gerador de números aleatórios utilizado na escolha do time ( None = random.Random não reproduzível ), por exemplo
+             RandomStreams( seed ).python( "render" ), independente dos geradores do Algoritmo Genético
+    """
+
+    def __init__(self, width: int = 800, height: int = 450, fps: int = 30, redraw_generations: int = 1, redraw_interval_ms: float = 250,
+                 rng: random.Random = None):
+        self.width, self.height = width, height
+        self.fps = fps
+        self.redraw_generations = redraw_generations
+        self.redraw_interval_ms = max(redraw_interval_ms, 1000 / fps)
+        self.running = True
+        self.rng = random.Random() if rng is None else rng
+
+        pygame.init()
+        self.screen = pygame.display.set_mode((self.width, self.height))
+        pygame.display.set_caption("TCO Solver using Pygame")
+
+        self._series = queue.Queue(maxsize=1)
+        self._images = queue.Queue(maxsize=1)
+        self._last_generation = None
+        self._last_time = 0.00
+        self._latest = None
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._plot_loop, name="PygameObserver", daemon=True)
+        self._thread.start()
+
+    def __call__(self, generation: int, population: list, population_fitness: np.ndarray, result) -> bool:
+        self._handle_events()
+        self._latest = (generation, result)
+
+        # A cópia da série reduzida ( tamanho limitado ) é feita apenas quando ela é enviada ao gráfico
+        now = time.perf_counter()
+        if (self._last_generation is None or (generation - self._last_generation >= self.redraw_generations
+                                              and (now - self._last_time) * 1000 >= self.redraw_interval_ms)):
+            self._last_generation, self._last_time = generation, now
+            self._put_latest(self._series, result.fitness_history.snapshot())
+
+        try:
+            image = self._images.get_nowait()
+        except queue.Empty:
+            image = None
+        if image is not None:
+            self._draw(image, result)
+
+        return self.running
+
+    def _handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_q:
+                    self.running = False
+
+    def _draw(self, image, result):
+        data, size = image
+        self.screen.fill((255, 255, 255))
+
+        # Mostra o gráfico com a evolução do valor de fitness da melhor solução X o nº da geração
+        self.screen.blit(pygame.image.frombuffer(data, size, "RGBA"), (0, 0))
+
+        # Mostra a sequência de jogos um dos times (escolhido aleatoriamente) extraída da Tabela da melhor solução encontrada na respectiva geração
+        draw_team_games(self.screen, result.best_solution, result.context, (0, 0, 0), (0, 0, 255), rng=self.rng)
+
+        pygame.display.flip()
+
+    @staticmethod
+    def _put_latest(items: queue.Queue, item):
+        try:
+            items.put_nowait(item)
+        except queue.Full:
+            # Descarta o item ainda não utilizado e deposita o mais recente
+            try:
+                items.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                items.put_nowait(item)
+            except queue.Full:
+                pass
+
+    def _plot_loop(self):
+        # Apenas o Matplotlib é utilizado nesta thread ( nenhuma chamada ao Pygame )
+        # Um erro no gráfico encerra a thread e a execução ( running = False ), sem bloquear o Algoritmo Genético; é relançado em close
+        try:
+            plot_renderer = PlotRenderer(y_label="Fitness - Sum of Penalties (points)")
+            while True:
+                series = self._series.get()
+                if series is None:
+                    break
+                self._put_latest(self._images, plot_renderer.rasterize(*series))
+        except Exception as error:
+            self._error = error
+            self.running = False
+
+    def close(self):
+        """
+        Desenha a situação da última geração, encerra a thread do gráfico e fecha a janela
+        Aguarda a thread no máximo CLOSE_TIMEOUT segundos e relança o erro ocorrido no gráfico, se houver
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._thread.is_alive():
+                if self._latest and self._latest[0] != self._last_generation:
+                    self._put_latest(self._series, self._latest[1].fitness_history.snapshot())
+                try:
+                    self._series.put(None, timeout=CLOSE_TIMEOUT)
+                except queue.Full:
+                    pass
+                self._thread.join(CLOSE_TIMEOUT)
+            try:
+                image = self._images.get_nowait()
+            except queue.Empty:
+                image = None
+            if image is not None and self._latest:
+                self._draw(image, self._latest[1])
+        finally:
+            pygame.quit()
+        if self._error:
+            raise self._error
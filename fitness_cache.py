@@ -0,0 +1,166 @@
+# Memorização (cache) dos valores de aptidão já calculados
+# Evita recalcular a aptidão de Tabelas repetidas ( elite mantida entre gerações, filhos idênticos gerados pelo cruzamento )
+
+from collections import OrderedDict
+import hashlib
+import numpy as np
+from problem_context import ProblemContext
+from genetic_algorithm import calculate_fitness, calculate_population_fitness
+
+def generate_population_keys(population: np.ndarray, n_teams: int) -> list:
+    """
+    Gera a chave canônica de cada Tabela da população
+    Os jogos de cada rodada são ordenados, pois a ordem dos jogos dentro da rodada não altera a Tabela ( nem a sua aptidão )
+
+    Parâmetros:
+        population (np.ndarray): Array ( população x rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        n_teams (int): Quantidade de Equipes participantes do Campeonato
+
+    Retorna:
+        Lista com a chave ( hash de 16 bytes ) de cada Tabela
+    """
+    population = np.asarray(population)
+    games = np.sort(population[..., 0].astype(np.int32) * n_teams + population[..., 1], axis=-1)
+    games = games.reshape(len(games), -1)
+
+    return [hashlib.blake2b(season_games.tobytes(), digest_size=16).digest() for season_games in games]
+
+def generate_schedule_key(season: np.ndarray, n_teams: int) -> bytes:
+    """
+    Gera a chave canônica de uma Tabela ( ver generate_population_keys )
+
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        n_teams (int): Quantidade de Equipes participantes do Campeonato
+
+    Retorna:
+        Chave ( hash de 16 bytes ) da Tabela
+    """
+    return generate_population_keys(np.asarray(season)[None], n_teams)[0]
+
+class FitnessCache:
+    """
+    Cache dos valores de aptidão com tamanho limitado e descarte do item usado há mais tempo ( LRU )
+
+    Atributos:
+        max_size - Nº máximo de Tabelas guardadas
+        evaluate_population - Função que avalia as Tabelas que não estão no cache ( padrão: calculate_population_fitness )
+        full_season - Aptidão do Campeonato completo ( turno e returno espelhado ) nas avaliações feitas pelo próprio cache
+        hits - Nº de consultas atendidas pelo cache
+        misses - Nº de consultas que precisaram calcular a aptidão ( inclui a 1ª consulta das Tabelas avaliadas fora do cache, ver store_population )
+    """
+
+    def __init__(self, context: ProblemContext, max_size: int = 100000, evaluate_population=None, full_season: bool = False):
+        self.context = context
+        self.max_size = max_size
+        self.full_season = full_season
+        self._evaluate_population = evaluate_population or (lambda population: calculate_population_fitness(population, context, full_season))
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._precomputed = set()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def hit_rate(self) -> float:
+        n_queries = self.hits + self.misses
+        return self.hits / n_queries if n_queries else 0.00
+
+    def _get(self, key: bytes):
+        """
+        Retorna a aptidão guardada ( None se não estiver no cache ), contando a consulta como atendida
+        A 1ª consulta de uma Tabela avaliada fora do cache ( store_population com precomputed ) é contada como não atendida
+        """
+        fitness = self._values.get(key)
+        if fitness is not None:
+            self._values.move_to_end(key)
+            if key in self._precomputed:
+                self._precomputed.discard(key)
+                self.misses += 1
+            else:
+                self.hits += 1
+        return fitness
+
+    def _put(self, key: bytes, fitness: float):
+        self._values[key] = fitness
+        self._values.move_to_end(key)
+        while len(self._values) > self.max_size:
+            self._precomputed.discard(self._values.popitem(last=False)[0])
+
+    def get_fitness(self, season: np.ndarray) -> float:
+        """
+        Retorna a aptidão de uma Tabela, calculando-a ( calculate_fitness ) apenas se ainda não estiver no cache
+
+        Parâmetros:
+            season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+
+        Retorna:
+            float: Total de penalidades
+        """
+        key = generate_schedule_key(season, self.context.n_teams)
+        fitness = self._get(key)
+        if fitness is not None:
+            return fitness
+
+        self.misses += 1
+        fitness = calculate_fitness(season, self.context, self.full_season)
+        self._put(key, fitness)
+        return fitness
+
+    def evaluate_population(self, population: np.ndarray) -> np.ndarray:
+        """
+        Retorna a aptidão de cada Tabela da população
+        As Tabelas que não estão no cache ( sem repetições ) são avaliadas de uma só vez ( calculate_population_fitness ou a função informada )
+
+        Parâmetros:
+            population (np.ndarray): Array ( população x rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+
+        Retorna:
+            np.ndarray: Total de penalidades de cada individuo da população
+        """
+        population = np.asarray(population)
+        keys = generate_population_keys(population, self.context.n_teams)
+        fitness = np.empty(len(keys))
+        missing = {}
+
+        for n_individual, key in enumerate(keys):
+            value = self._get(key)
+            if value is not None:
+                fitness[n_individual] = value
+            elif key in missing:
+                self.hits += 1
+                missing[key].append(n_individual)
+            else:
+                self.misses += 1
+                missing[key] = [n_individual]
+
+        if missing:
+            first_index = [individuals[0] for individuals in missing.values()]
+            missing_fitness = self._evaluate_population(population[first_index])
+            for (key, individuals), value in zip(missing.items(), missing_fitness.tolist()):
+                fitness[individuals] = value
+                self._put(key, value)
+
+        return fitness
+
+    def store_population(self, population: np.ndarray, population_fitness: np.ndarray, keys: list = None, precomputed: bool = False):
+        """
+        Guarda no cache a aptidão já conhecida de cada Tabela da população ( por exemplo, lida de um checkpoint )
+        Com precomputed ( aptidão calculada fora do cache, por exemplo pelos processos da geração paralela dos filhos ), a 1ª consulta
+        de cada Tabela ainda não guardada é contada como não atendida, como se a Tabela fosse avaliada nesse momento: os contadores
+        têm o mesmo significado com e sem avaliação paralela
+
+        Parâmetros:
+            population (np.ndarray): Array ( população x rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+            population_fitness (np.ndarray): Total de penalidades de cada individuo da população
+            keys (list): Chaves das Tabelas, se já calculadas ( None = calculadas à partir da população )
+            precomputed (bool): Aptidão calculada fora do cache
+        """
+        if keys is None:
+            keys = generate_population_keys(population, self.context.n_teams)
+        for key, value in zip(keys, np.asarray(population_fitness).tolist()):
+            if precomputed and key not in self._values:
+                self._precomputed.add(key)
+            self._put(key, value)
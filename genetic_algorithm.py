@@ -1,243 +1,401 @@
 # Description: This file contains the implementation of the genetic algorithm for the football scheduling problem.
 
 import random
-from typing import List, Tuple
+import numpy as np
+from typing import List, NamedTuple, Tuple
 from utils_tco import *
+from problem_context import ProblemContext
 
-def calculate_fitness(season: list, teams: list, matrix_distances: list, city_n_teams: list, teams_distance_traveled: list) -> float:
+def calculate_fitness(season: np.ndarray, context: ProblemContext, full_season: bool = False) -> float:
     """
     Calcula a aptidão da solução ( Tabela de 1 turno do Campeonato )
     O Cálculo é feito através da soma de penalidades que contrariam critérios que definem a confecção de uma Tabela Idealizada
     Quanto menor for soma, mais apta é a solução
 
+    Com full_season a aptidão é a do Campeonato completo ( turno e returno espelhado, ver generate_full_season ):
+    no returno as passagens entre rodadas repetem as do turno ( mandos invertidos em todas as rodadas e os mesmos adversários ),
+    portanto são aproveitadas do cálculo do turno, e apenas a passagem do turno p/ o returno e os jogos por Cidade
+    das rodadas do returno são calculados
+    A penalidade dos deslocamentos é simétrica no espelhamento: o returno percorre o total menos o deslocamento do turno,
+    e | total / 2 - ( total - turno ) | = | turno - total / 2 |, portanto a do returno é igual à do turno ( não há critério
+    de deslocamento na passagem do turno p/ o returno )
+
     Parâmetros:
-        season (list): Lista com os jogos codificados
-        teams (list): Lista de Dicionários de Equipes
-        matrix_distances (list): Matriz com os deslocamentos necessários p/ a realização de cada jogo entre as equipes participantes do Campeonato
-        city_n_teams (list): Lista contendo a Cidade e a respectiva quantidade de Equipes desta Cidade que participam do Campeonato
-        teams_distance_traveled - Lista com o Código de cada Equipe e o respectivo valor total dos deslocamentos em Km desta Equipe como Visitante durante o Campeonato
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo ( 1º turno )
+        context (ProblemContext): Contexto com os dados das Equipes, Cidades e deslocamentos do Campeonato
+        full_season (bool): Calcula a aptidão do Campeonato completo ( turno e returno )
 
     Retorna:
         float: Total de penalidades 
     """
-    fitness = 0
-    n_rounds = len(season)
-    n_teams = len(teams)
+    transition_fitness = 0
+    round_fitness = 0
+    n_teams = context.n_teams
+    teams_city_id = context.teams_city_id
+    matrix_distances = context.matrix_distances
 
     home = [''] * n_teams
-    last_opponent = [''] * n_teams
+    last_opponent = [-1] * n_teams
 
-    teams_season_distance_traveled = {f"{i:02}": 0 for i in range(1, (n_teams+1))}
+    teams_season_distance_traveled = np.zeros(n_teams)
+    season_games = season.tolist()
     
-    for n_round in range(n_rounds):
-        city_round_n_games = city_n_teams.copy()
-        for city in city_round_n_games:
-            city['JogosRodada'] = 0
-        round_games = generate_list_games(season[n_round], 4)
-        for game in round_games:
-            team1_code = game[:2]
-            team2_code = game[2:]
-            team1 = search_team_by_code(teams, team1_code)
-            team2 = search_team_by_code(teams, team2_code)
-            team1_city = get_team_city(team1)
-            team2_city = get_team_city(team2)
-            team1_index = int(team1_code) - 1
-            team2_index = int(team2_code) - 1
+    for round_games in season_games:
+        # Contadores de jogos por Cidade reiniciados a cada rodada
+        city_round_n_games = [0] * context.n_cities
+        for team1_index, team2_index in round_games:
             distance = matrix_distances[team2_index, team1_index]
-            teams_season_distance_traveled[team2_code] += distance
+            teams_season_distance_traveled[team2_index] += distance
             team1_last_home = home[team1_index]
             team1_last_opponent = last_opponent[team1_index]
             team2_last_home = home[team2_index]
             team2_last_opponent = last_opponent[team2_index]
-            fitness += calculate_penalty_last_home(team1_last_home, team2_last_home)
-            fitness += calculate_penalty_last_opponent(teams, team1_city, team1_last_opponent, team2_city, team2_last_opponent)
-            fitness += calculate_penalty_ideal_city_round_n_games(team1_city, city_round_n_games)
+            transition_fitness += calculate_penalty_last_home(team1_last_home, team2_last_home)
+            transition_fitness += calculate_penalty_last_opponent(context, team1_index, team1_last_opponent, team2_index, team2_last_opponent)
+            round_fitness += calculate_penalty_ideal_city_round_n_games(context, teams_city_id[team1_index], city_round_n_games)
             home[team1_index] = 1
             home[team2_index] = 0
-            last_opponent[team1_index] = team2_code
-            last_opponent[team2_index] = team1_code
+            last_opponent[team1_index] = team2_index
+            last_opponent[team2_index] = team1_index
     
-    fitness += calculate_penalty_balanced_travel(teams_distance_traveled, teams_season_distance_traveled)
+    travel_fitness = calculate_penalty_balanced_travel(context, teams_season_distance_traveled)
+
+    if not full_season:
+        return transition_fitness + round_fitness + travel_fitness
+
+    # Passagens entre as rodadas do returno: as mesmas do turno
+    transition_fitness *= 2
+
+    # Passagem do turno p/ o returno: 1ª rodada do turno com os mandos de campo invertidos
+    for team2_index, team1_index in season_games[0]:
+        transition_fitness += calculate_penalty_last_home(home[team1_index], home[team2_index])
+        transition_fitness += calculate_penalty_last_opponent(context, team1_index, last_opponent[team1_index], team2_index, last_opponent[team2_index])
+
+    # Jogos por Cidade nas rodadas do returno ( os Mandantes do returno são os Visitantes do turno )
+    for round_games in season_games:
+        city_round_n_games = [0] * context.n_cities
+        for team1_index, team2_index in round_games:
+            round_fitness += calculate_penalty_ideal_city_round_n_games(context, teams_city_id[team2_index], city_round_n_games)
+
+    # Deslocamentos do returno: a penalidade é igual à do turno ( simétrica no espelhamento )
+    travel_fitness *= 2
+
+    return transition_fitness + round_fitness + travel_fitness
+
+def calculate_population_fitness(population: np.ndarray, context: ProblemContext, full_season: bool = False) -> np.ndarray:
+    """
+    Calcula a aptidão de toda a população de uma só vez, com operações vetorizadas do NumPy
+    Os critérios e pesos são os mesmos de calculate_fitness:
+        - 500 pontos por Equipe que repete o mando de campo da rodada anterior
+        - 1000 pontos por Equipe que enfrenta equipes da sua cidade em 2 rodadas seguidas
+        - 300 pontos por jogo que ultrapassa o limite de jogos por rodada de cada Cidade
+        - diferença entre a distância percorrida no turno e metade da distância do Campeonato ( calculate_penalty_balanced_travel )
+    Com full_season a aptidão é a do Campeonato completo, aproveitando a situação das Equipes no turno ( ver calculate_fitness )
+
+    Parâmetros:
+        population (np.ndarray): Array ( população x rodadas x jogos x 2 ) com os índices das Equipes de cada jogo ( 1º turno )
+        context (ProblemContext): Contexto com os dados das Equipes, Cidades e deslocamentos do Campeonato
+        full_season (bool): Calcula a aptidão do Campeonato completo ( turno e returno )
+
+    Retorna:
+        np.ndarray: Total de penalidades de cada individuo da população
+    """
+    population = np.asarray(population)
+    n_population, n_rounds, round_ngames, _ = population.shape
+    n_teams = context.n_teams
+    n_cities = context.n_cities
+    teams_city_id = context.teams_city_id
+
+    home_index = population[..., 0].astype(np.intp)
+    away_index = population[..., 1].astype(np.intp)
+    population_index = np.arange(n_population)[:, None, None]
+    round_index = np.arange(n_rounds)[None, :, None]
+
+    # Situação de cada Equipe em cada rodada ( Mandante ou não e o adversário enfrentado )
+    home = np.zeros((n_population, n_rounds, n_teams), dtype=bool)
+    home[population_index, round_index, home_index] = True
+    opponent = np.empty((n_population, n_rounds, n_teams), dtype=np.intp)
+    opponent[population_index, round_index, home_index] = away_index
+    opponent[population_index, round_index, away_index] = home_index
+
+    # Repetição do mando de campo da rodada anterior
+    fitness = 500.00 * np.count_nonzero(home[:, 1:] == home[:, :-1], axis=(1, 2))
+
+    # Jogos contra equipes da mesma cidade em rodadas seguidas
+    opponent_same_city = context.same_city[np.arange(n_teams), opponent]
+    fitness += 1000.00 * np.count_nonzero(opponent_same_city[:, 1:] & opponent_same_city[:, :-1], axis=(1, 2))
+
+    if full_season:
+        # Passagens do returno ( as mesmas do turno ) e passagem do turno p/ o returno ( 1ª rodada com os mandos invertidos )
+        fitness *= 2
+        fitness += 500.00 * np.count_nonzero(home[:, -1] != home[:, 0], axis=1)
+        fitness += 1000.00 * np.count_nonzero(opponent_same_city[:, -1] & opponent_same_city[:, 0], axis=1)
+
+    # Nº de jogos por rodada em cada Cidade acima do ideal ( no returno os Mandantes são os Visitantes do turno )
+    for round_home_index in ((home_index, away_index) if full_season else (home_index,)):
+        city_key = (population_index * n_rounds + round_index) * n_cities + teams_city_id[round_home_index]
+        city_round_n_games = np.bincount(city_key.ravel(), minlength=n_population * n_rounds * n_cities).reshape(n_population, n_rounds, n_cities)
+        fitness += 300.00 * np.maximum(city_round_n_games - context.city_ideal_n_games, 0).sum(axis=(1, 2))
+
+    # Deslocamentos das Equipes Visitantes no turno ( com full_season, a penalidade do returno é igual à do turno, ver calculate_fitness )
+    distances = context.matrix_distances[away_index, home_index]
+    team_key = population_index[..., 0] * n_teams + away_index.reshape(n_population, -1)
+    teams_season_distance_traveled = np.bincount(team_key.ravel(), weights=distances.ravel(), minlength=n_population * n_teams).reshape(n_population, n_teams)
+    travel_fitness = np.abs(context.half_total_distance - teams_season_distance_traveled).sum(axis=1)
+    fitness += 2 * travel_fitness if full_season else travel_fitness
 
     return fitness
 
-def order_crossover(parent1: List[str], parent2: List[str], possible_games: List[str]) -> List[str]:
+class GameIndex(NamedTuple):
+    """
+    Índice da posição de cada jogo numa Tabela, endereçado pelo par de Equipes ( matrizes n x n )
+
+    Atributos:
+        round - Rodada em que as Equipes i e j se enfrentam ( simétrica )
+        slot - Posição do jogo dentro da rodada ( simétrica )
+        home - True se a Equipe i é Mandante no jogo contra a Equipe j
+    """
+    round: np.ndarray
+    slot: np.ndarray
+    home: np.ndarray
+
+def generate_game_index(season: np.ndarray) -> GameIndex:
+    """
+    Gera o índice par de Equipes -> ( rodada, posição, mando de campo ) de uma Tabela, em O(nº de jogos)
+
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+
+    Retorna:
+        GameIndex da Tabela
+    """
+    n_rounds, round_ngames, _ = season.shape
+    n_teams = round_ngames * 2
+    home_index = season[..., 0].astype(np.intp)
+    away_index = season[..., 1].astype(np.intp)
+    rounds = np.broadcast_to(np.arange(n_rounds)[:, None], home_index.shape)
+    slots = np.broadcast_to(np.arange(round_ngames)[None, :], home_index.shape)
+
+    game_round = np.zeros((n_teams, n_teams), dtype=np.intp)
+    game_slot = np.zeros((n_teams, n_teams), dtype=np.intp)
+    home = np.zeros((n_teams, n_teams), dtype=bool)
+    game_round[home_index, away_index] = game_round[away_index, home_index] = rounds
+    game_slot[home_index, away_index] = game_slot[away_index, home_index] = slots
+    home[home_index, away_index] = True
+
+    return GameIndex(game_round, game_slot, home)
+
+def order_crossover(parent1: np.ndarray, parent2: np.ndarray, parent2_index: GameIndex = None, rng: np.random.Generator = None) -> np.ndarray:
     """
     Combinar partes de duas boas tabelas para gerar uma nova tabela que mantenha boas características de ambas
     No cruzamento destes 2 indivíduos precisa-se manter as regras básicas atendidas, portanto o novo individuo
     será criado de forma que o mando de campo de metade dos jogos seja mantido de acordo com o primeiro indivíduo,
     e a outra metade de acordo com o segundo indivíduo
+    A Tabela filha mantém as rodadas do primeiro indivíduo; os jogos são percorridos numa ordem aleatória ( permutação das posições )
+    e os que têm mando de campo diferente no segundo indivíduo são invertidos, até a metade dos jogos do turno
 
     Parâmetros:
-        parent1 (List[str]): Sequência de jogos da Tabela Nº 1
-        parent2 (List[str]): Sequência de jogos da Tabela Nº 2
-        possible_games (List[str]): Lista com o código de todos os possíveis jogos
+        parent1 (np.ndarray): Array ( rodadas x jogos x 2 ) da Tabela Nº 1
+        parent2 (np.ndarray): Array ( rodadas x jogos x 2 ) da Tabela Nº 2
+        parent2_index (GameIndex): Índice dos jogos da Tabela Nº 2 ( calculado se não informado )
+        rng (np.random.Generator): Gerador de números aleatórios ( None = módulo np.random )
 
     Retorna
-        List[str]: A sequêcia de jogos da Tabela filha resultado do cruzamento
+        np.ndarray: A Tabela filha resultado do cruzamento
     """
-    
-    parent1_seq_games = "" 
-    for current_round in parent1:
-        parent1_seq_games += current_round
-    parent2_seq_games = "" 
-    for current_round in parent2:
-        parent2_seq_games += current_round
-    child_seq_games = parent1_seq_games
-    round_size = len(parent1[0])
-
-    n_games_half_season = len(possible_games) // 2 # Nº de jogos por turno
+
+    if rng is None:
+        rng = np.random
+    if parent2_index is None:
+        parent2_index = generate_game_index(parent2)
+
+    child = parent1.copy()
+    child_games = child.reshape(-1, 2)
+
+    n_games_half_season = len(child_games) # Nº de jogos por turno
     n_games_parent = n_games_half_season // 2 # Nº máximo de jogos a terem o mando de campo trocado entre os pais
-    n_changes = 0
 
-    remaining_games = possible_games.copy()
+    # Jogos do primeiro indivíduo cujo mando de campo é diferente no segundo
+    different_home = ~parent2_index.home[child_games[:, 0], child_games[:, 1]]
 
-    for _ in range(n_games_half_season):
+    # Percorre os jogos numa ordem aleatória e inverte o mando dos primeiros jogos diferentes
+    order = rng.permutation(n_games_half_season)
+    changes = order[different_home[order]][:n_games_parent]
+    child_games[changes] = child_games[changes, ::-1]
 
-        n_remaining_games = len(remaining_games)
-        if n_remaining_games == 0:
-            break
+    return child
 
-        game = remaining_games[random.randint(0, ( n_remaining_games - 1))]
-        team1_code = game[:2]
-        team2_code = game[2:]
-        game_inv = team2_code + team1_code
+def generate_team_slot_index(season: np.ndarray) -> np.ndarray:
+    """
+    Gera o índice Equipe -> posição do seu jogo em cada rodada, em O(nº de jogos)
 
-        if game_inserted(parent1_seq_games, game):
-            old_game = game
-        else:
-            old_game = game_inv
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
 
-        if game_inserted(parent2_seq_games, game):
-            new_game = game
-        else:
-            new_game = game_inv
+    Retorna:
+        np.ndarray: Array ( rodadas x equipes ) com a posição do jogo de cada Equipe em cada rodada
+    """
+    n_rounds, round_ngames, _ = season.shape
+    n_teams = round_ngames * 2
 
-        if new_game != old_game:
-            child_seq_games = change_game(child_seq_games, old_game, new_game)
-            n_changes += 1
-            if n_changes == n_games_parent:
-                break
+    # Posição ( linear ) de cada Equipe no array rodadas x equipes, na ordem dos jogos
+    positions = season.reshape(n_rounds, n_teams) + (np.arange(n_rounds) * n_teams)[:, None]
 
+    team_slot = np.empty(n_rounds * n_teams, dtype=np.intp)
+    team_slot[positions.ravel()] = np.tile(np.arange(n_teams) // 2, n_rounds)
 
-        remove_game(remaining_games, game)
-        remove_game(remaining_games, game_inv)
+    return team_slot.reshape(n_rounds, n_teams)
 
-    child = generate_list_games(child_seq_games, round_size)
+def swap_rounds(season: np.ndarray, team_slot: np.ndarray, n_round1: int, n_round2: int):
+    """
+    Troca a posição de 2 rodadas na Tabela ( altera a Tabela e o índice )
 
-    return child
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        team_slot (np.ndarray): Índice Equipe -> posição do jogo em cada rodada ( generate_team_slot_index )
+        n_round1, n_round2 (int): Rodadas a serem trocadas
+    """
+    for array in (season, team_slot):
+        round1 = array[n_round1].copy()
+        array[n_round1] = array[n_round2]
+        array[n_round2] = round1
 
-def mutate(solution:  List[str], mutation_probability: float, mutation_intensity: float, teams: List[dict]) ->  List[str]:
+def swap_round_home_away(season: np.ndarray, n_round: int):
+    """
+    Inverte o mando de campo de todos os jogos de uma rodada ( altera a Tabela, as posições dos jogos não mudam )
+
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        n_round (int): Rodada a ter o mando de campo invertido
+    """
+    season[n_round] = season[n_round, :, ::-1].copy()
+
+def swap_team_fixtures(season: np.ndarray, team_slot: np.ndarray, team1_index: int, team2_index: int):
+    """
+    Troca os jogos de 2 Equipes: cada uma passa a ter a sequência de adversários e de mandos de campo da outra ( altera a Tabela e o índice )
+    No jogo entre as duas Equipes apenas o mando de campo é invertido
+
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        team_slot (np.ndarray): Índice Equipe -> posição do jogo em cada rodada ( generate_team_slot_index )
+        team1_index, team2_index (int): Equipes a terem os jogos trocados
+    """
+    # Equivale a trocar os índices das 2 Equipes em toda a Tabela ( no jogo entre elas, o mando de campo fica invertido )
+    team1_games = season == team1_index
+    season[season == team2_index] = team1_index
+    season[team1_games] = team2_index
+    team_slot[:, [team1_index, team2_index]] = team_slot[:, [team2_index, team1_index]]
+
+def alternate_team_home_away(season: np.ndarray, team_slot: np.ndarray, team_index: int, home: int, fixed_teams: list):
+    """
+    Ajusta a sequência de jogos de uma Equipe de forma que ela seja Mandante numa rodada e Visitante na outra ( altera a Tabela )
+    Apenas os jogos da Equipe são visitados ( 1 por rodada, pelo índice )
+    Os jogos contra Equipes já ajustadas ( fixed_teams ) não são alterados, apenas definem o mando de campo esperado p/ a rodada seguinte
+
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        team_slot (np.ndarray): Índice Equipe -> posição do jogo em cada rodada ( generate_team_slot_index )
+        team_index (int): Equipe a ser ajustada
+        home (int): 1 se a Equipe deve ser Mandante no seu primeiro jogo ajustável, 0 se Visitante
+        fixed_teams (list): Lista indicando, pelo índice, as Equipes já ajustadas
+    """
+    for n_round, slot in enumerate(team_slot[:, team_index].tolist()):
+        team1_index, team2_index = season[n_round, slot].tolist()
+        team_is_home = team1_index == team_index
+        opponent = team2_index if team_is_home else team1_index
+
+        if fixed_teams[opponent]:
+            home = 1 if team_is_home else 0
+            continue
+
+        if team_is_home != (home == 1):
+            season[n_round, slot] = (team2_index, team1_index)
+        home = 1 - home
+
+def mutate(solution: np.ndarray, mutation_probability: float, mutation_intensity: float, context: ProblemContext, rng: random.Random = None) -> np.ndarray:
     """
     Verifica inicialmente se haverá ou não mutação de acordo com a probabilidade informada
     Realiza a troca de posição entre 2 rodadas na tabela (individuo), as rodadas a serem trocadas são selecionadas de forma aleatória
     De acordo com o parâmetro de intensidade da mutação se determina o nº de times a terem os seus jogos otimizados em relação ao mando de campo
         - seleciona os times de forma aleatória
         - ajusta a sequência de jogos deste time, de forma que ele seja o Mandante numa rodada e Visitante na outra
+    As alterações são feitas pelo índice Equipe -> posição do jogo em cada rodada, visitando apenas os jogos de cada time selecionado
 
     Parâmetros
-        solution (List[str]): O individuo (sequência de jogos) que sofrerá a mutação
+        solution (np.ndarray): O individuo ( array rodadas x jogos x 2 ) que sofrerá a mutação
         mutation_probability (float): A probabilidade de mutação 
         mutation_intensity (float): A intensidade desta mutação
-        teams (list): Lista de Dicionários de Equipes        
+        context (ProblemContext): Contexto com os dados do Campeonato
+        rng (random.Random): Gerador de números aleatórios ( None = módulo random )
 
     Retorna
-        List[str]: A sequêcia de jogos da Tabela resultado da mutação
+        np.ndarray: A Tabela resultado da mutação
     """
+    if rng is None:
+        rng = random
+
     mutated_solution = solution.copy()
-    n_changes = 0
 
     # Check if mutation should occur    
-    if random.random() < mutation_probability:
+    if rng.random() >= mutation_probability:
         return mutated_solution
-    
-    n_round1 = random.randint(0, (len(mutated_solution) - 1))
-    n_round2 = ""
-    while n_round2 != n_round1:
-        n_round2 = random.randint(0, (len(mutated_solution) - 1))
-    round1 = mutated_solution[n_round1]
-    round2 = mutated_solution[n_round2]
-    mutated_solution[n_round1] = round2
-    mutated_solution[n_round2] = round1
-
-    teams_code = [team["Codigo"] for team in teams]
-    n_mutations = int(len(teams_code) * mutation_intensity) 
-    remaining_teams = teams_code.copy()
+
+    team_slot = generate_team_slot_index(mutated_solution)
+
+    n_round1, n_round2 = rng.sample(range(len(mutated_solution)), 2)
+    swap_rounds(mutated_solution, team_slot, n_round1, n_round2)
+
+    n_teams = context.n_teams
+    n_mutations = int(n_teams * mutation_intensity) 
+    remaining_teams = list(range(n_teams))
+    fixed_teams = [False] * n_teams
 
     for _ in range(n_mutations):
-        team_code = remaining_teams[random.randint(0, (len(remaining_teams) - 1))]
-        home = random.randint(0, 1)
-        for n_round in range(len(mutated_solution)):
-
-            current_round = mutated_solution[n_round]
-            list_games = generate_list_games(current_round, 4)
-
-            for n_game in range(len(list_games)):
-
-                game = list_games[n_game]
-                team1_code = game[:2]
-                team2_code = game[2:]
-
-                if  ( team1_code != team_code ) and ( team2_code != team_code ):
-                    continue
-
-                if ( team1_code not in remaining_teams ) or ( team2_code not in remaining_teams ):
-                    if  ( team1_code == team_code ):
-                        home = 1
-                    else:
-                        home = 0                    
-                    continue
-
-                new_game = game
-                if ( team1_code == team_code ):
-                    if home == 1:
-                        home = 0
-                    else:
-                        new_game = team2_code + team1_code 
-                        home = 1
-
-                if ( team2_code == team_code ):
-                    if home == 1:
-                        new_game = team2_code + team1_code
-                        home = 0
-                    else:
-                        home = 1
-                if new_game != game:
-                    list_games[n_game] = new_game
-                    # n_changes += 1
-                    # print("Mutação: ", game, " -> ", new_game)
-                break
-
-            mutated_solution[n_round] = "".join(list_games)
-
-        remaining_teams.remove(team_code)
-
-    # print("Mutations: ", n_changes)
+        # Sorteia um time ainda não ajustado ( remoção em O(1), trocando com o último da lista )
+        n_team = rng.randint(0, (len(remaining_teams) - 1))
+        team_index = remaining_teams[n_team]
+        remaining_teams[n_team] = remaining_teams[-1]
+        remaining_teams.pop()
+
+        home = rng.randint(0, 1)
+        alternate_team_home_away(mutated_solution, team_slot, team_index, home, fixed_teams)
+        fixed_teams[team_index] = True
 
     return mutated_solution
 
-def sort_population(population: List[List[str]], fitness: List[float]) -> Tuple[List[List[str]], List[float]]:
+def rank_population(fitness: np.ndarray, n_best: int = None) -> np.ndarray:
     """
-    Ordena a população baseada nos valores de aptidão
+    Classifica a população pelos valores de aptidão, sem copiar as soluções
+    Quando apenas os n_best melhores individuos são necessários ( Elitismo ), utiliza ordenação parcial ( np.argpartition, O(P) )
+    e ordena somente estes individuos
 
     Parâmetros:
-        population (List[List[str]]): A população de soluções, aonde cada solução é uma sequência de jogos 
-        fitness (List[float]): Os valores correspondentes de cada solução na população
+        fitness (np.ndarray): Os valores de aptidão de cada solução na população
+        n_best (int): Nº de individuos a serem classificados ( None = toda a população )
 
     Retorna:
-        Tuple[List[List[str]], List[float]]: Tupla contendo a população ordenada e os valores correspondentes de aptidão
+        np.ndarray: Índices dos individuos em ordem crescente de aptidão ( o primeiro é a melhor solução )
     """
+    fitness = np.asarray(fitness)
 
-    # Combina as listas em pares
-    combined_lists = list(zip(population, fitness))
+    if n_best is None or n_best >= len(fitness):
+        return np.argsort(fitness, kind="stable")
 
-    # Ordena a lista de acordo com os valores de aptidão
-    sorted_combined_lists = sorted(combined_lists, key=lambda x: x[1])
+    best = np.argpartition(fitness, max(n_best, 1) - 1)[:max(n_best, 1)]
+    return best[np.argsort(fitness[best], kind="stable")]
 
-    # Separa os pares ordenados novamente em listas individuais
-    sorted_population, sorted_fitness = zip(*sorted_combined_lists)
+def sort_population(population: List[np.ndarray], fitness: List[float]) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    Ordena a população baseada nos valores de aptidão ( as soluções não são copiadas, apenas reordenadas )
 
-    return sorted_population, sorted_fitness
-    
+    Parâmetros:
+        population (List[np.ndarray]): A população de soluções, aonde cada solução é um array ( rodadas x jogos x 2 )
+        fitness (List[float]): Os valores correspondentes de cada solução na população
 
+    Retorna:
+        Tuple[List[np.ndarray], np.ndarray]: Tupla contendo a população ordenada e os valores correspondentes de aptidão
+    """
+    fitness = np.asarray(fitness)
+    order = rank_population(fitness)
 
+    return [population[n] for n in order.tolist()], fitness[order]
@@ -0,0 +1,159 @@
+# Histórico da execução do Algoritmo Genético
+# Grava um registro compacto por geração num arquivo .jsonl, apenas acrescentando linhas ( geração, estatísticas da aptidão, diversidade
+# e a chave da melhor Tabela ), com a Tabela completa somente quando a melhor aptidão melhora
+# Em memória fica apenas uma série reduzida ( DownsampledSeries ) da melhor aptidão, de tamanho limitado, p/ a visualização
+
+import json
+import os
+from typing import List
+import numpy as np
+from fitness_cache import generate_schedule_key
+
+class DownsampledSeries:
+    """
+    Série ( x, y ) com nº máximo de pontos
+    Ao atingir max_points, descarta 1 a cada 2 pontos e passa a guardar 1 a cada 2 valores recebidos ( stride dobra ),
+    portanto a memória e o custo do desenho não dependem do nº de gerações
+    O último valor recebido é sempre mantido ( last ), p/ que a série desenhada termine na geração atual
+
+    Parâmetros:
+        max_points (int): Nº máximo de pontos guardados
+    """
+
+    def __init__(self, max_points: int = 1000):
+        self.max_points = max(max_points, 2)
+        self.stride = 1
+        self.x = []
+        self.y = []
+        self.last = None
+        self._n_values = 0
+
+    def __len__(self) -> int:
+        """
+        Nº de valores recebidos ( não o de pontos guardados )
+        """
+        return self._n_values
+
+    def append(self, x, y):
+        """
+        Acrescenta um valor à série ( O(1) amortizado )
+        """
+        if self._n_values % self.stride == 0:
+            self.x.append(x)
+            self.y.append(y)
+            if len(self.x) >= self.max_points:
+                self.x = self.x[::2]
+                self.y = self.y[::2]
+                self.stride *= 2
+        self.last = (x, y)
+        self._n_values += 1
+
+    def snapshot(self):
+        """
+        Retorna cópias dos pontos guardados, terminando no último valor recebido ( p/ desenho em outra thread )
+
+        Retorna:
+            Tupla com as listas de valores x e y
+        """
+        x, y = list(self.x), list(self.y)
+        if self.last is not None and (not x or x[-1] != self.last[0]):
+            x.append(self.last[0])
+            y.append(self.last[1])
+        return x, y
+
+    def get_state(self) -> dict:
+        """
+        Retorna o estado da série ( dicionário serializável em JSON, gravado no checkpoint )
+        """
+        return {"max_points": self.max_points, "stride": self.stride, "n_values": self._n_values,
+                "x": [int(x) for x in self.x], "y": [float(y) for y in self.y],
+                "last": None if self.last is None else [int(self.last[0]), float(self.last[1])]}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "DownsampledSeries":
+        """
+        Recria a série à partir do estado gravado por get_state
+        """
+        series = cls(state["max_points"])
+        series.stride = state["stride"]
+        series._n_values = state["n_values"]
+        series.x = list(state["x"])
+        series.y = list(state["y"])
+        series.last = None if state["last"] is None else tuple(state["last"])
+        return series
+
+def read_history(arq: str) -> List[dict]:
+    """
+    Lê os registros gravados por HistoryWriter
+
+    Parâmetros:
+        arq (str): Arquivo .jsonl
+
+    Retorna:
+        Lista com os registros de cada geração ( em "schedule", quando presente, a Tabela como lista rodadas x jogos x 2 )
+    """
+    with open(arq, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+class HistoryWriter:
+    """
+    Grava o histórico da execução num arquivo .jsonl, um registro por geração:
+        generation, best_fitness, mean_fitness, std_fitness, diversity, best_key ( chave canônica da melhor Tabela, hexadecimal )
+        e schedule ( a melhor Tabela, índices das Equipes ) apenas nas gerações em que a melhor aptidão melhora
+
+    Parâmetros:
+        arq (str): Arquivo .jsonl
+        resume_generation (int): Continua o histórico de uma execução retomada à partir desta geração ( os registros posteriores,
+                                 gravados após o checkpoint, são descartados ); None = inicia um novo arquivo
+    """
+
+    def __init__(self, arq: str, resume_generation: int = None):
+        self.best_fitness = None
+
+        directory = os.path.dirname(arq)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if resume_generation is not None and os.path.exists(arq):
+            records = [record for record in read_history(arq) if record["generation"] <= resume_generation]
+            temp_file = arq + f".{os.getpid()}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as file:
+                for record in records:
+                    file.write(json.dumps(record) + "\n")
+            os.replace(temp_file, arq)
+            if records:
+                self.best_fitness = min(record["best_fitness"] for record in records)
+            self._file = open(arq, "a", encoding="utf-8")
+        else:
+            self._file = open(arq, "w", encoding="utf-8")
+
+    def write(self, generation: int, population_fitness: np.ndarray, best_solution: np.ndarray, diversity: float = None):
+        """
+        Grava o registro da geração
+
+        Parâmetros:
+            generation (int): Nº da geração
+            population_fitness (np.ndarray): Aptidão de cada individuo da população
+            best_solution (np.ndarray): Array ( rodadas x jogos x 2 ) da melhor Tabela da geração
+            diversity (float): Diversidade da população ( None = não medida )
+        """
+        population_fitness = np.asarray(population_fitness)
+        best_fitness = float(population_fitness.min())
+
+        record = {
+            "generation": generation,
+            "best_fitness": best_fitness,
+            "mean_fitness": float(population_fitness.mean()),
+            "std_fitness": float(population_fitness.std()),
+            "diversity": diversity,
+            "best_key": generate_schedule_key(best_solution, best_solution.shape[1] * 2).hex(),
+        }
+        if self.best_fitness is None or best_fitness < self.best_fitness:
+            self.best_fitness = best_fitness
+            record["schedule"] = np.asarray(best_solution).tolist()
+
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,206 @@
+# Cálculo incremental (delta) da aptidão
+# Guarda o estado por rodada e por Equipe de uma Tabela já avaliada, de forma que a aptidão de uma Tabela derivada dela
+# ( cruzamento, mutação, busca local ) seja obtida recalculando apenas as rodadas alteradas e suas fronteiras
+
+from dataclasses import dataclass, field
+from typing import List
+import numpy as np
+from problem_context import ProblemContext
+
+@dataclass
+class FitnessState:
+    """
+    Estado da avaliação de uma Tabela ( 1 turno do Campeonato, ou o Campeonato completo com o returno espelhado )
+    A situação das Equipes em cada rodada é guardada em máscaras de bits ( bit i = Equipe de índice i )
+    No Campeonato completo a situação do returno é derivada da do turno, apenas a penalidade por Cidade de cada rodada do returno é guardada
+
+    Atributos:
+        season - Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        home_mask - Equipes Mandantes em cada rodada
+        classic_mask - Equipes que enfrentam adversário da mesma Cidade em cada rodada
+        round_penalty - Penalidade de cada rodada pelo nº de jogos por Cidade acima do ideal
+        transition_penalty - Penalidade da passagem da rodada anterior p/ cada rodada ( mando de campo repetido e clássicos seguidos )
+        teams_season_distance_traveled - Total de deslocamentos de cada Equipe como Visitante no turno
+        fitness - Total de penalidades
+        full_season - Avaliação do Campeonato completo ( turno e returno )
+        mirror_round_penalty - Penalidade de cada rodada do returno pelo nº de jogos por Cidade acima do ideal ( apenas no Campeonato completo )
+    """
+    season: np.ndarray
+    home_mask: List[int]
+    classic_mask: List[int]
+    round_penalty: List[float]
+    transition_penalty: List[float]
+    teams_season_distance_traveled: List[float]
+    fitness: float
+    full_season: bool = False
+    mirror_round_penalty: List[float] = field(default_factory=list)
+
+def _calculate_round(round_games: list, context: ProblemContext, full_season: bool = False):
+    """
+    Calcula a situação das Equipes e a penalidade pelo nº de jogos por Cidade de uma rodada ( e da rodada espelhada do returno )
+
+    Parâmetros:
+        round_games (list): Lista com os jogos ( Mandante, Visitante ) da rodada
+        context (ProblemContext): Contexto com os dados do Campeonato
+        full_season (bool): Calcula também a penalidade da rodada espelhada do returno
+
+    Retorna:
+        Tupla com a máscara das Equipes Mandantes, a máscara das Equipes em clássicos, a penalidade da rodada e a da rodada espelhada
+    """
+    same_city_mask = context.same_city_mask
+    teams_city = context.teams_city_list
+    city_ideal_n_games = context.city_ideal_n_games_list
+
+    home_mask = 0
+    classic_mask = 0
+    penalty = 0.00
+    mirror_penalty = 0.00
+    city_round_n_games = {}
+    mirror_city_round_n_games = {}
+
+    for team1_index, team2_index in round_games:
+        home_mask |= 1 << team1_index
+        if (same_city_mask[team1_index] >> team2_index) & 1:
+            classic_mask |= (1 << team1_index) | (1 << team2_index)
+        city = teams_city[team1_index]
+        n_games = city_round_n_games.get(city, 0) + 1
+        city_round_n_games[city] = n_games
+        if n_games > city_ideal_n_games[city]:
+            penalty += 300
+        if full_season:
+            city = teams_city[team2_index]
+            n_games = mirror_city_round_n_games.get(city, 0) + 1
+            mirror_city_round_n_games[city] = n_games
+            if n_games > city_ideal_n_games[city]:
+                mirror_penalty += 300
+
+    return home_mask, classic_mask, penalty, mirror_penalty
+
+def _calculate_transition(state: FitnessState, n_round: int, n_teams: int) -> float:
+    """
+    Calcula a penalidade da passagem da rodada anterior p/ a rodada informada
+        - 500 pontos por Equipe que repete o mando de campo
+        - 1000 pontos por Equipe que enfrenta adversário da mesma Cidade nas 2 rodadas
+
+    Parâmetros:
+        state (FitnessState): Estado da avaliação da Tabela
+        n_round (int): Índice da rodada ( >= 1 )
+        n_teams (int): Quantidade de Equipes participantes do Campeonato
+
+    Retorna:
+        float: Penalidade da passagem
+    """
+    n_breaks = n_teams - (state.home_mask[n_round] ^ state.home_mask[n_round - 1]).bit_count()
+    n_classics = (state.classic_mask[n_round] & state.classic_mask[n_round - 1]).bit_count()
+    return 500.00 * n_breaks + 1000.00 * n_classics
+
+def _calculate_total(state: FitnessState, context: ProblemContext):
+    """
+    Totaliza as penalidades do estado ( atualiza o estado )
+    No Campeonato completo as passagens do returno repetem as do turno, e a passagem do turno p/ o returno
+    compara a última rodada do turno com a primeira rodada do turno com os mandos invertidos
+    A penalidade dos deslocamentos do returno é igual à do turno ( simétrica no espelhamento, ver calculate_fitness )
+
+    Parâmetros:
+        state (FitnessState): Estado da avaliação da Tabela
+        context (ProblemContext): Contexto com os dados do Campeonato
+    """
+    half_total_distance = context.half_total_distance.tolist()
+    travel_penalty = sum(abs(half_distance - distance) for half_distance, distance in zip(half_total_distance, state.teams_season_distance_traveled))
+    state.fitness = sum(state.transition_penalty) + sum(state.round_penalty) + travel_penalty
+
+    if state.full_season:
+        n_teams = context.n_teams
+        all_teams = (1 << n_teams) - 1
+        n_breaks = n_teams - (state.home_mask[-1] ^ (all_teams ^ state.home_mask[0])).bit_count()
+        n_classics = (state.classic_mask[-1] & state.classic_mask[0]).bit_count()
+        state.fitness += (sum(state.transition_penalty) + 500.00 * n_breaks + 1000.00 * n_classics
+                          + sum(state.mirror_round_penalty) + travel_penalty)
+
+def generate_fitness_state(season: np.ndarray, context: ProblemContext, full_season: bool = False) -> FitnessState:
+    """
+    Avalia uma Tabela completa e guarda o estado por rodada e por Equipe p/ avaliações incrementais posteriores
+    O valor de aptidão é o mesmo calculado por calculate_fitness
+
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo ( 1º turno )
+        context (ProblemContext): Contexto com os dados do Campeonato
+        full_season (bool): Avalia o Campeonato completo ( turno e returno espelhado )
+
+    Retorna:
+        FitnessState com o estado da avaliação
+    """
+    n_teams = context.n_teams
+    distance_rows = context.distance_rows
+    season_games = season.tolist()
+
+    state = FitnessState(season, [], [], [], [0.00] * len(season_games), [0.00] * n_teams, 0.00, full_season)
+
+    for round_games in season_games:
+        home_mask, classic_mask, penalty, mirror_penalty = _calculate_round(round_games, context, full_season)
+        state.home_mask.append(home_mask)
+        state.classic_mask.append(classic_mask)
+        state.round_penalty.append(penalty)
+        state.mirror_round_penalty.append(mirror_penalty)
+        for team1_index, team2_index in round_games:
+            state.teams_season_distance_traveled[team2_index] += distance_rows[team2_index][team1_index]
+
+    for n_round in range(1, len(season_games)):
+        state.transition_penalty[n_round] = _calculate_transition(state, n_round, n_teams)
+
+    _calculate_total(state, context)
+
+    return state
+
+def calculate_fitness_delta(parent_state: FitnessState, child: np.ndarray, context: ProblemContext, changed_rounds=None) -> FitnessState:
+    """
+    Avalia uma Tabela derivada de outra já avaliada, recalculando apenas as rodadas alteradas, as passagens de/para estas rodadas
+    e o deslocamento das Equipes envolvidas nos jogos alterados ( no mesmo modo, turno ou Campeonato completo, da Tabela de origem )
+    Troca de posição entre rodadas e inversões de mando de campo são descritas pelas rodadas em que ocorreram
+    O resultado é o mesmo de uma avaliação completa ( a menos de arredondamentos de ponto flutuante no deslocamento )
+
+    Parâmetros:
+        parent_state (FitnessState): Estado da avaliação da Tabela de origem ( não é alterado )
+        child (np.ndarray): Array ( rodadas x jogos x 2 ) da Tabela derivada
+        context (ProblemContext): Contexto com os dados do Campeonato
+        changed_rounds: Índices das rodadas alteradas ( se não informado, obtido pela comparação das Tabelas )
+
+    Retorna:
+        FitnessState com o estado da avaliação da Tabela derivada
+    """
+    if changed_rounds is None:
+        changed_rounds = np.flatnonzero(np.any(child != parent_state.season, axis=(1, 2))).tolist()
+    changed_rounds = sorted(set(changed_rounds))
+
+    state = FitnessState(child, parent_state.home_mask.copy(), parent_state.classic_mask.copy(), parent_state.round_penalty.copy(),
+                         parent_state.transition_penalty.copy(), parent_state.teams_season_distance_traveled.copy(), parent_state.fitness,
+                         parent_state.full_season, parent_state.mirror_round_penalty.copy())
+    if not changed_rounds:
+        return state
+
+    n_teams = context.n_teams
+    n_rounds = len(child)
+    distance_rows = context.distance_rows
+    travel = state.teams_season_distance_traveled
+    boundaries = set()
+
+    for n_round in changed_rounds:
+        # Retira o deslocamento dos jogos antigos e soma o dos novos
+        for team1_index, team2_index in parent_state.season[n_round].tolist():
+            travel[team2_index] -= distance_rows[team2_index][team1_index]
+        round_games = child[n_round].tolist()
+        for team1_index, team2_index in round_games:
+            travel[team2_index] += distance_rows[team2_index][team1_index]
+
+        (state.home_mask[n_round], state.classic_mask[n_round], state.round_penalty[n_round],
+         state.mirror_round_penalty[n_round]) = _calculate_round(round_games, context, state.full_season)
+        boundaries.add(n_round)
+        boundaries.add(n_round + 1)
+
+    for n_round in boundaries:
+        if 1 <= n_round < n_rounds:
+            state.transition_penalty[n_round] = _calculate_transition(state, n_round, n_teams)
+
+    _calculate_total(state, context)
+
+    return state
@@ -0,0 +1,175 @@
+# Geração construtiva da População Inicial com o nº mínimo de quebras de mando de campo
+# A Tabela canônica ( método do círculo / tabelas de Berger, com mandos alternados ) tem n - 2 quebras, o mínimo possível num turno
+# As variantes preservam este mínimo: inversão da ordem das rodadas, rotação das rodadas ( apenas os deslocamentos que mantêm o mínimo ),
+# inversão de todos os mandos e a atribuição das Equipes às posições da Tabela canônica
+# As Equipes da mesma Cidade recebem posições com sequências de mandos complementares ( quando uma é Mandante a outra é Visitante ),
+# limitando o nº de jogos por Cidade em cada rodada
+
+import random
+from typing import List, Tuple
+import numpy as np
+from problem_context import ProblemContext
+from utils_tco import get_schedule_dtype
+from genetic_algorithm import calculate_population_fitness
+
+def generate_canonical_schedule(n_teams: int) -> np.ndarray:
+    """
+    Gera a Tabela canônica de um turno com o nº mínimo de quebras ( n - 2 )
+    As posições 0 .. n - 2 giram num círculo e a posição n - 1 é fixa; na rodada r a posição fixa enfrenta a posição r
+    e as posições r + k e r - k ( módulo n - 1 ) se enfrentam, com os mandos alternados por rodada e por k
+
+    Parâmetros:
+        n_teams (int): Quantidade de Equipes ( par )
+
+    Retorna:
+        np.ndarray: Array ( rodadas x jogos x 2 ) com as posições ( 0 .. n - 1 ) Mandante e Visitante de cada jogo
+    """
+    if n_teams % 2 != 0:
+        raise ValueError("O número de times deve ser par!")
+
+    n_rounds = n_teams - 1
+    round_ngames = n_teams // 2
+    schedule = np.empty((n_rounds, round_ngames, 2), dtype=get_schedule_dtype(n_teams))
+
+    for n_round in range(n_rounds):
+        schedule[n_round, 0] = (n_teams - 1, n_round) if n_round % 2 else (n_round, n_teams - 1)
+        for k in range(1, round_ngames):
+            slot1, slot2 = (n_round + k) % n_rounds, (n_round - k) % n_rounds
+            schedule[n_round, k] = (slot1, slot2) if k % 2 else (slot2, slot1)
+
+    return schedule
+
+def generate_home_patterns(schedule: np.ndarray) -> np.ndarray:
+    """
+    Gera a sequência de mandos de campo de cada posição ( ou Equipe )
+
+    Retorna:
+        np.ndarray: Array booleano ( rodadas x equipes ), True quando a posição é Mandante na rodada
+    """
+    n_rounds, round_ngames, _ = schedule.shape
+    home = np.zeros((n_rounds, round_ngames * 2), dtype=bool)
+    home[np.arange(n_rounds)[:, None], schedule[..., 0]] = True
+    return home
+
+def count_breaks(schedule: np.ndarray) -> int:
+    """
+    Conta as quebras da Tabela, isto é, as vezes em que uma Equipe repete o mando de campo em 2 rodadas seguidas
+    """
+    home = generate_home_patterns(schedule)
+    return int(np.count_nonzero(home[1:] == home[:-1]))
+
+def generate_complementary_slot_pairs(schedule: np.ndarray) -> Tuple[List[Tuple[int, int]], List[int]]:
+    """
+    Agrupa as posições da Tabela em pares com sequências de mandos complementares
+
+    Retorna:
+        Tupla com a lista de pares de posições complementares e a lista das posições sem par
+    """
+    home = generate_home_patterns(schedule)
+    patterns = {tuple(column): slot for slot, column in enumerate(home.T.tolist())}
+    pairs, unpaired, used = [], [], set()
+
+    for slot, column in enumerate(home.T.tolist()):
+        if slot in used:
+            continue
+        other = patterns.get(tuple(not home_game for home_game in column))
+        if other is None or other in used or other == slot:
+            unpaired.append(slot)
+            used.add(slot)
+            continue
+        pairs.append((slot, other))
+        used.update((slot, other))
+
+    return pairs, unpaired
+
+def get_minimum_break_shifts(schedule: np.ndarray) -> List[int]:
+    """
+    Informa os deslocamentos ( rotação da ordem das rodadas ) que mantêm o nº de quebras da Tabela
+    """
+    n_breaks = count_breaks(schedule)
+    return [shift for shift in range(len(schedule)) if count_breaks(np.roll(schedule, shift, axis=0)) == n_breaks]
+
+def assign_teams_to_slots(context: ProblemContext, slot_pairs: List[Tuple[int, int]], unpaired_slots: List[int], rng: random.Random) -> np.ndarray:
+    """
+    Sorteia a posição de cada Equipe na Tabela canônica
+    As Equipes da mesma Cidade são agrupadas 2 a 2 e cada dupla recebe um par de posições complementares;
+    as demais Equipes ocupam as posições restantes
+
+    Parâmetros:
+        context (ProblemContext): Contexto com os dados do Campeonato
+        slot_pairs (list): Pares de posições complementares ( generate_complementary_slot_pairs )
+        unpaired_slots (list): Posições sem par
+        rng (random.Random): Gerador de números aleatórios
+
+    Retorna:
+        np.ndarray: Índice da Equipe atribuída a cada posição
+    """
+    slot_pairs = list(slot_pairs)
+    rng.shuffle(slot_pairs)
+
+    city_teams = {}
+    for team_index, city_id in enumerate(context.teams_city_list):
+        city_teams.setdefault(city_id, []).append(team_index)
+    cities = list(city_teams.values())
+    rng.shuffle(cities)
+
+    team_of_slot = np.empty(context.n_teams, dtype=np.intp)
+    remaining_teams = []
+
+    for teams in cities:
+        rng.shuffle(teams)
+        while len(teams) >= 2 and slot_pairs:
+            slot1, slot2 = slot_pairs.pop()
+            team_of_slot[slot1], team_of_slot[slot2] = teams.pop(), teams.pop()
+        remaining_teams += teams
+
+    remaining_slots = [slot for slot_pair in slot_pairs for slot in slot_pair] + list(unpaired_slots)
+    rng.shuffle(remaining_teams)
+    team_of_slot[remaining_slots] = remaining_teams
+
+    return team_of_slot
+
+def generate_constructive_schedules(context: ProblemContext, population_size: int, n_candidates: int = 1, full_season: bool = False,
+                                    rng: random.Random = None) -> np.ndarray:
+    """
+    Gera uma População de Tabelas com o nº mínimo de quebras, variantes aleatórias da Tabela canônica
+    Cada individuo é o melhor ( menor aptidão ) entre n_candidates variantes sorteadas: mais candidatos geram uma população
+    melhor adaptada, porém menos diversa
+
+    Parâmetros:
+        context (ProblemContext): Contexto com os dados do Campeonato
+        population_size (int): O tamanho da população, i.e., o número de Tabelas a serem criadas
+        n_candidates (int): Nº de variantes sorteadas p/ cada individuo
+        full_season (bool): Escolhe os candidatos pela aptidão do Campeonato completo ( turno e returno espelhado )
+        rng (random.Random): Gerador de números aleatórios ( None = módulo random )
+
+    Retorna:
+        Array ( população x rodadas x jogos x 2 ) com os índices das Equipes
+    """
+    if rng is None:
+        rng = random
+
+    canonical_schedule = generate_canonical_schedule(context.n_teams)
+    slot_pairs, unpaired_slots = generate_complementary_slot_pairs(canonical_schedule)
+    shifts = get_minimum_break_shifts(canonical_schedule)
+    dtype = get_schedule_dtype(context.n_teams)
+    n_candidates = max(n_candidates, 1)
+
+    population = np.empty((population_size,) + canonical_schedule.shape, dtype=dtype)
+
+    for n_individual in range(population_size):
+        candidates = np.empty((n_candidates,) + canonical_schedule.shape, dtype=dtype)
+        for n_candidate in range(n_candidates):
+            schedule = np.roll(canonical_schedule, rng.choice(shifts), axis=0)
+            if rng.random() < 0.5:
+                schedule = schedule[::-1]
+            if rng.random() < 0.5:
+                schedule = schedule[..., ::-1]
+            candidates[n_candidate] = assign_teams_to_slots(context, slot_pairs, unpaired_slots, rng)[schedule]
+
+        if n_candidates == 1:
+            population[n_individual] = candidates[0]
+        else:
+            population[n_individual] = candidates[np.argmin(calculate_population_fitness(candidates, context, full_season))]
+
+    return population
@@ -0,0 +1,258 @@
+# Modelo de ilhas: K populações independentes, cada uma evoluindo em seu próprio processo
+# A cada M gerações os melhores individuos de cada ilha migram p/ as ilhas vizinhas ( topologia em anel ou totalmente conectada )
+#   python islands.py --islands 4 --migration-interval 25 --migrants 2 --topology ring --max-generations 2000 --seed 42
+
+import multiprocessing
+import os
+import queue
+import sys
+from dataclasses import dataclass, field, replace
+from typing import List, Optional
+import numpy as np
+from genetic_algorithm import rank_population
+from utils_tco import *
+from fitness_cache import FitnessCache
+from random_streams import RandomStreams
+from run_controller import RunController
+from history import DownsampledSeries, HistoryWriter
+from solver import (SolverConfig, build_parser, config_from_args, validate_config, load_problem, generate_initial_population, evolve_population, improve_population,
+                    get_output_season)
+
+TOPOLOGIES = ("ring", "full")
+
+# Parâmetros do Solver não utilizados pelo modelo de ilhas ( campo de SolverConfig, opção da linha de comando )
+UNSUPPORTED_FIELDS = (("checkpoint_file", "--checkpoint"), ("checkpoint_interval", "--checkpoint-interval"), ("resume", "--resume"),
+                      ("parallel_evaluation", "--parallel"), ("n_workers", "--workers"), ("chunk_size", "--chunk-size"),
+                      ("telemetry_file", "--telemetry"), ("patience", "--patience"), ("target_fitness", "--target-fitness"),
+                      ("time_limit", "--time-limit"), ("min_diversity", "--min-diversity"))
+
+# Intervalo ( segundos ) entre as verificações dos processos das ilhas enquanto o resultado é aguardado
+RESULT_POLL_INTERVAL = 1.0
+
+@dataclass
+class IslandConfig:
+    """
+    Parâmetros do modelo de ilhas
+
+    Atributos:
+        n_islands - Nº de ilhas ( processos )
+        migration_interval - Nº de gerações entre as migrações
+        n_migrants - Nº de individuos ( os melhores ) enviados por cada ilha a cada vizinha
+        topology - "ring" ( cada ilha envia p/ a seguinte ) ou "full" ( cada ilha envia p/ todas as outras )
+    """
+    n_islands: int = 4
+    migration_interval: int = 25
+    n_migrants: int = 2
+    topology: str = "ring"
+
+@dataclass
+class IslandResult:
+    """
+    Resultado de uma ilha e do modelo de ilhas
+
+    Atributos:
+        island - Nº da ilha ( na consolidação, a ilha que encontrou a melhor Tabela )
+        best_solution - Melhor Tabela encontrada ( array rodadas x jogos x 2 )
+        best_fitness - Aptidão da melhor Tabela
+        n_generations - Nº de gerações executadas
+        fitness_history - Série reduzida ( tamanho limitado ) da melhor aptidão de cada geração
+        islands - Resultado de cada ilha ( apenas na consolidação )
+        seed - Semente utilizada ( apenas na consolidação, reproduz a execução quando informada em SolverConfig.seed )
+    """
+    island: int
+    best_solution: np.ndarray
+    best_fitness: float
+    n_generations: int
+    fitness_history: DownsampledSeries = field(default_factory=DownsampledSeries)
+    islands: List["IslandResult"] = field(default_factory=list)
+    seed: Optional[int] = None
+
+def validate_island_config(island_config: IslandConfig):
+    """
+    Verifica os parâmetros do modelo de ilhas, gerando ValueError se algum for inválido
+    """
+    if island_config.n_islands < 1:
+        raise ValueError(f"O nº de ilhas deve ser maior que 0: {island_config.n_islands}")
+    if island_config.migration_interval < 1:
+        raise ValueError(f"O nº de gerações entre as migrações deve ser maior que 0: {island_config.migration_interval}")
+    if island_config.n_migrants < 0:
+        raise ValueError(f"O nº de migrantes não pode ser negativo: {island_config.n_migrants}")
+    if island_config.topology not in TOPOLOGIES:
+        raise ValueError(f"Topologia inválida: {island_config.topology}")
+
+def get_island_neighbours(island: int, island_config: IslandConfig) -> List[int]:
+    """
+    Informa as ilhas que recebem os migrantes de uma ilha, de acordo com a topologia
+
+    Parâmetros:
+        island (int): Nº da ilha
+        island_config (IslandConfig): Parâmetros do modelo de ilhas
+
+    Retorna:
+        Lista com o nº das ilhas vizinhas
+    """
+    n_islands = island_config.n_islands
+    if n_islands < 2:
+        return []
+    if island_config.topology == "ring":
+        return [(island + 1) % n_islands]
+    if island_config.topology == "full":
+        return [other for other in range(n_islands) if other != island]
+    raise ValueError(f"Topologia inválida: {island_config.topology}")
+
+def get_island_history_file(history_file: str, island: int) -> str:
+    """
+    Informa o arquivo de histórico de uma ilha ( historico.jsonl -> historico.island0.jsonl )
+    """
+    root, ext = os.path.splitext(history_file)
+    return f"{root}.island{island}{ext or '.jsonl'}"
+
+def _run_island(island: int, config: SolverConfig, island_config: IslandConfig, streams: RandomStreams, inboxes: list, results):
+    """
+    Evolui a população de uma ilha ( executado em um processo próprio )
+    Os critérios de parada do RunController não são aplicados ( todas as ilhas executam o mesmo nº de gerações ), apenas a adaptação da mutação
+    A migração é síncrona: a ilha aguarda os migrantes de todas as ilhas que enviam p/ ela e cada ilha tem os seus próprios geradores
+    de números aleatórios ( streams ), o que torna o resultado reproduzível independente da ordem de execução dos processos
+    """
+    teams, context = load_problem(config)
+    population = generate_initial_population(config, teams, context, streams)
+    fitness_cache = FitnessCache(context, config.fitness_cache_size, full_season=config.full_season)
+
+    neighbours = get_island_neighbours(island, island_config)
+    n_senders = sum(island in get_island_neighbours(other, island_config) for other in range(island_config.n_islands))
+    fitness_history = DownsampledSeries(config.history_points)
+    history = HistoryWriter(get_island_history_file(config.history_file, island)) if config.history_file else None
+    controller = RunController(config.mutation_probability, config.mutation_intensity, adaptive_mutation=config.adaptive_mutation,
+                               adaptation_window=config.adaptation_window)
+
+    for generation in range(1, config.max_generations + 1):
+
+        population_fitness = fitness_cache.evaluate_population(np.stack(population))
+        improve_population(population, population_fitness, config, context, fitness_cache, streams)
+        order = rank_population(population_fitness)
+        fitness_history.append(generation, float(population_fitness[order[0]]))
+        if history:
+            history.write(generation, population_fitness, population[order[0]])
+        controller.update(generation, population_fitness)
+
+        if generation == config.max_generations:
+            break
+
+        if generation % island_config.migration_interval == 0 and neighbours:
+            # Envia cópias dos melhores individuos às ilhas vizinhas
+            migrants = [(population[n], population_fitness[n]) for n in order[:island_config.n_migrants].tolist()]
+            for neighbour in neighbours:
+                inboxes[neighbour].put((island, migrants))
+
+            # Recebe os migrantes ( ordenados pela ilha de origem ) e substitui os piores individuos
+            received = sorted((inboxes[island].get() for _ in range(n_senders)), key=lambda message: message[0])
+            received = [migrant for _, migrants in received for migrant in migrants][:len(population) - 1]
+            for n, (migrant, migrant_fitness) in zip(order[::-1].tolist(), received):
+                population[n] = migrant
+                population_fitness[n] = migrant_fitness
+            order = rank_population(population_fitness)
+
+        population = evolve_population(population, population_fitness, config, context, order, streams=streams,
+                                       mutation_probability=controller.mutation_probability, mutation_intensity=controller.mutation_intensity, generation=generation)
+
+    if history:
+        history.close()
+
+    best = order[0]
+    results.put(IslandResult(island, population[best], population_fitness[best], generation, fitness_history))
+
+def solve_islands(config: SolverConfig, island_config: IslandConfig) -> IslandResult:
+    """
+    Executa o modelo de ilhas e consolida o resultado, escolhendo a melhor Tabela entre todas as ilhas
+
+    Parâmetros:
+        config (SolverConfig): Parâmetros de execução de cada ilha ( os campos de UNSUPPORTED_FIELDS, como checkpoint, telemetria,
+                               avaliação paralela e critérios de parada, não são utilizados )
+        island_config (IslandConfig): Parâmetros do modelo de ilhas
+
+    Retorna:
+        IslandResult com a melhor Tabela e o resultado de cada ilha
+    """
+    validate_config(config)
+    validate_island_config(island_config)
+
+    # Geradores independentes p/ cada ilha, derivados da semente da execução ( sorteada uma única vez, se não informada )
+    streams = RandomStreams(config.seed)
+    config = replace(config, seed=streams.seed)
+    island_streams = streams.spawn(island_config.n_islands)
+
+    mp_context = multiprocessing.get_context()
+    inboxes = [mp_context.Queue() for _ in range(island_config.n_islands)]
+    results = mp_context.Queue()
+    processes = [mp_context.Process(target=_run_island, args=(island, config, island_config, island_streams[island], inboxes, results))
+                 for island in range(island_config.n_islands)]
+
+    for process in processes:
+        process.start()
+
+    # Aguarda o resultado de cada ilha verificando periodicamente os processos: se uma ilha termina com erro, as demais
+    # ( que aguardariam os seus migrantes indefinidamente ) são encerradas
+    received = {}
+    try:
+        while len(received) < len(processes):
+            try:
+                island_result = results.get(timeout=RESULT_POLL_INTERVAL)
+                received[island_result.island] = island_result
+            except queue.Empty:
+                for island, process in enumerate(processes):
+                    if island not in received and process.exitcode not in (None, 0):
+                        raise RuntimeError(f"A ilha {island} foi encerrada com erro ( exitcode {process.exitcode} )")
+    except BaseException:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        raise
+    finally:
+        for process in processes:
+            process.join()
+    island_results = [received[island] for island in range(island_config.n_islands)]
+
+    best = min(island_results, key=lambda result: result.best_fitness)
+    result = IslandResult(best.island, best.best_solution, best.best_fitness, best.n_generations, best.fitness_history, island_results, config.seed)
+
+    if config.output_file:
+        teams = generate_teams_list_by_file(config.teams_file, config.sep, config.encoding)
+        generate_tco_file(decode_season(get_output_season(config, result.best_solution)), config.output_file, config.sep, config.encoding, teams)
+
+    return result
+
+def main(argv: List[str] = None) -> int:
+    default = IslandConfig()
+    parser = build_parser()
+    parser.description = "Gera Tabela Otimizada de Jogos de Campeonato Esportivo utilizando Algoritmo Genético com modelo de ilhas"
+    parser.add_argument("--islands", dest="n_islands", type=int, default=default.n_islands, help="nº de ilhas ( processos )")
+    parser.add_argument("--migration-interval", type=int, default=default.migration_interval, help="nº de gerações entre as migrações")
+    parser.add_argument("--migrants", dest="n_migrants", type=int, default=default.n_migrants, help="nº de individuos enviados a cada ilha vizinha")
+    parser.add_argument("--topology", choices=TOPOLOGIES, default=default.topology, help="topologia da migração")
+    args = vars(parser.parse_args(argv))
+
+    unsupported = [option for name, option in UNSUPPORTED_FIELDS if args[name] != parser.get_default(name)]
+    if unsupported:
+        parser.error(f"Opções não suportadas pelo modelo de ilhas: {', '.join(unsupported)}")
+
+    config = config_from_args(args)
+    island_config = IslandConfig(args["n_islands"], args["migration_interval"], args["n_migrants"], args["topology"])
+    try:
+        validate_config(config)
+        validate_island_config(island_config)
+    except ValueError as error:
+        parser.error(str(error))
+
+    result = solve_islands(config, island_config)
+
+    for island_result in result.islands:
+        print(f"Island {island_result.island}: Best fitness = {island_result.best_fitness:.2f}")
+    print(f"Best fitness = {result.best_fitness:.2f} ( island {result.island} ) after {result.n_generations} generations")
+    print(f"Seed = {result.seed}")
+    if config.output_file:
+        print(f"Tabela gravada em {config.output_file}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
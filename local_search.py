@@ -0,0 +1,132 @@
+# Busca local ( algoritmo memético ): melhora as melhores Tabelas de cada geração por descida de primeira melhoria
+# Vizinhança: troca de posição entre 2 rodadas, inversão do mando de campo de um jogo, inversão do mando de campo de uma rodada
+# e troca dos jogos de 2 Equipes
+# Cada movimento é avaliado pelo cálculo incremental da aptidão ( apenas as rodadas alteradas e suas fronteiras são recalculadas )
+
+import random
+import time
+from typing import List, Tuple
+import numpy as np
+from problem_context import ProblemContext
+from genetic_algorithm import generate_team_slot_index, swap_rounds, swap_round_home_away, swap_team_fixtures
+from incremental_fitness import FitnessState, generate_fitness_state, calculate_fitness_delta
+
+# Movimentos da vizinhança
+MOVES = ("swap_rounds", "flip_game", "flip_round", "swap_teams")
+
+# Melhoria mínima p/ aceitar um movimento ( evita aceitar diferenças de arredondamento do cálculo incremental )
+MIN_IMPROVEMENT = 1e-6
+
+def generate_neighbourhood(n_rounds: int, n_teams: int, moves: Tuple[str, ...] = MOVES) -> List[tuple]:
+    """
+    Gera todos os movimentos da vizinhança de uma Tabela
+
+    Parâmetros:
+        n_rounds (int): Nº de rodadas
+        n_teams (int): Quantidade de Equipes participantes do Campeonato
+        moves (tuple): Tipos de movimento considerados ( ver MOVES )
+
+    Retorna:
+        Lista de movimentos ( tipo, parâmetro 1, parâmetro 2 ):
+            ( "swap_rounds", rodada 1, rodada 2 ), ( "flip_game", rodada, posição do jogo ), ( "flip_round", rodada, 0 ),
+            ( "swap_teams", Equipe 1, Equipe 2 )
+    """
+    neighbourhood = []
+    if "swap_rounds" in moves:
+        neighbourhood += [("swap_rounds", n_round1, n_round2) for n_round1 in range(n_rounds) for n_round2 in range(n_round1 + 1, n_rounds)]
+    if "flip_game" in moves:
+        neighbourhood += [("flip_game", n_round, n_game) for n_round in range(n_rounds) for n_game in range(n_teams // 2)]
+    if "flip_round" in moves:
+        neighbourhood += [("flip_round", n_round, 0) for n_round in range(n_rounds)]
+    if "swap_teams" in moves:
+        neighbourhood += [("swap_teams", team1_index, team2_index) for team1_index in range(n_teams) for team2_index in range(team1_index + 1, n_teams)]
+
+    return neighbourhood
+
+def apply_move(season: np.ndarray, team_slot: np.ndarray, move: tuple) -> list:
+    """
+    Aplica um movimento à Tabela ( altera a Tabela e o índice Equipe -> posição do jogo em cada rodada )
+
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+        team_slot (np.ndarray): Índice Equipe -> posição do jogo em cada rodada ( generate_team_slot_index )
+        move (tuple): Movimento ( ver generate_neighbourhood )
+
+    Retorna:
+        Lista com as rodadas alteradas
+    """
+    move_type, parameter1, parameter2 = move
+
+    if move_type == "swap_rounds":
+        swap_rounds(season, team_slot, parameter1, parameter2)
+        return [parameter1, parameter2]
+    if move_type == "flip_game":
+        season[parameter1, parameter2] = season[parameter1, parameter2, ::-1].copy()
+        return [parameter1]
+    if move_type == "flip_round":
+        swap_round_home_away(season, parameter1)
+        return [parameter1]
+    if move_type == "swap_teams":
+        # As 2 Equipes jogam em todas as rodadas, portanto todas são alteradas
+        swap_team_fixtures(season, team_slot, parameter1, parameter2)
+        return list(range(len(season)))
+    raise ValueError(f"Movimento inválido: {move_type}")
+
+def local_search(season: np.ndarray, context: ProblemContext, max_moves: int = None, deadline: float = None, full_season: bool = False,
+                 rng: random.Random = None, moves: Tuple[str, ...] = MOVES) -> FitnessState:
+    """
+    Descida de primeira melhoria: percorre a vizinhança numa ordem aleatória e aceita o primeiro movimento que reduz a aptidão,
+    continuando a partir do movimento seguinte, até que nenhum movimento da vizinhança melhore a Tabela ( ótimo local )
+    ou até esgotar o nº de movimentos avaliados ou o tempo
+
+    Parâmetros:
+        season (np.ndarray): Array ( rodadas x jogos x 2 ) da Tabela ( não é alterado )
+        context (ProblemContext): Contexto com os dados do Campeonato
+        max_moves (int): Nº máximo de movimentos avaliados ( None = sem limite )
+        deadline (float): Instante ( time.perf_counter ) em que a busca é encerrada ( None = sem limite )
+        full_season (bool): Avalia o Campeonato completo ( turno e returno espelhado )
+        rng (random.Random): Gerador de números aleatórios ( None = módulo random )
+        moves (tuple): Tipos de movimento considerados ( ver MOVES )
+
+    Retorna:
+        FitnessState com a melhor Tabela encontrada e a sua aptidão
+    """
+    if rng is None:
+        rng = random
+
+    state = generate_fitness_state(season.copy(), context, full_season)
+    team_slot = generate_team_slot_index(state.season)
+
+    neighbourhood = generate_neighbourhood(len(season), context.n_teams, moves)
+    rng.shuffle(neighbourhood)
+
+    n_moves = 0
+    n_move = 0
+    n_without_improvement = 0
+    improved = False
+
+    while n_without_improvement < len(neighbourhood):
+        if (max_moves is not None and n_moves >= max_moves) or (deadline is not None and time.perf_counter() >= deadline):
+            break
+
+        move = neighbourhood[n_move]
+        n_move = (n_move + 1) % len(neighbourhood)
+
+        child = state.season.copy()
+        child_team_slot = team_slot.copy()
+        changed_rounds = apply_move(child, child_team_slot, move)
+        child_state = calculate_fitness_delta(state, child, context, changed_rounds)
+        n_moves += 1
+
+        if child_state.fitness < state.fitness - MIN_IMPROVEMENT:
+            state, team_slot = child_state, child_team_slot
+            n_without_improvement = 0
+            improved = True
+        else:
+            n_without_improvement += 1
+
+    # Reavalia a Tabela final, eliminando os arredondamentos acumulados pelo cálculo incremental
+    if improved:
+        state = generate_fitness_state(state.season, context, full_season)
+
+    return state
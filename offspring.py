@@ -0,0 +1,107 @@
+# Geração dos filhos de uma geração em blocos independentes ( cruzamento seguido ou não de mutação )
+# Os pares de pais sorteados pela seleção são divididos em blocos de tamanho fixo e cada bloco tem os seus próprios geradores
+# de números aleatórios, derivados da semente, da geração e do nº do bloco
+# Assim o resultado não depende de quantos processos geram os blocos, nem da ordem de execução: a geração serial ( solver.py )
+# e a paralela ( ParallelEvaluator.generate_offspring ) produzem os mesmos filhos
+
+from typing import List, Optional, Tuple
+import numpy as np
+from genetic_algorithm import mutate, order_crossover, generate_game_index
+from problem_context import ProblemContext
+from fitness_cache import generate_schedule_key
+from random_streams import RandomStreams
+from telemetry import Telemetry
+
+# Componentes cujos geradores são utilizados na geração dos filhos
+OFFSPRING_COMPONENTS = ("crossover", "mutation")
+
+def get_offspring_spawn_key(streams: RandomStreams, generation: int, n_chunk: int) -> Tuple[int, ...]:
+    """
+    Informa a identificação dos geradores de um bloco de filhos ( derivados dos geradores da execução / ilha )
+    """
+    return streams.spawn_key + (2, generation, n_chunk)
+
+def get_offspring_streams(streams: RandomStreams, generation: int, n_chunk: int) -> Optional[RandomStreams]:
+    """
+    Cria os geradores de números aleatórios de um bloco de filhos ( None = sem geradores, módulos random / np.random )
+
+    Parâmetros:
+        streams (RandomStreams): Geradores da execução / ilha
+        generation (int): Nº da geração
+        n_chunk (int): Nº do bloco de filhos
+
+    Retorna:
+        RandomStreams com os geradores de OFFSPRING_COMPONENTS
+    """
+    if streams is None:
+        return None
+    return RandomStreams(streams.seed, get_offspring_spawn_key(streams, generation, n_chunk), OFFSPRING_COMPONENTS)
+
+def split_parents(parents: np.ndarray, chunk_size: int) -> List[np.ndarray]:
+    """
+    Divide os pares de pais em blocos de chunk_size filhos ( o último pode ser menor )
+    """
+    chunk_size = max(chunk_size, 1)
+    return [parents[start:start + chunk_size] for start in range(0, len(parents), chunk_size)]
+
+def generate_offspring(population: List[np.ndarray], parents: np.ndarray, context: ProblemContext, mutation_probability: float,
+                       mutation_intensity: float, streams: RandomStreams = None, population_keys: set = None, duplicate_retries: int = 0,
+                       telemetry: Telemetry = None) -> Tuple[List[np.ndarray], Optional[list]]:
+    """
+    Gera os filhos de um bloco de pares de pais: cada filho é gerado pelo cruzamento dos pais seguido ( ou não ) de mutação
+    Com population_keys, aplica nova mutação aos filhos idênticos a um individuo já inserido ( pela chave canônica da Tabela )
+
+    Parâmetros:
+        population (List[np.ndarray]): População ( ou apenas os pais do bloco )
+        parents (np.ndarray): Array ( filhos x 2 ) com os índices dos pais de cada filho em population
+        context (ProblemContext): Contexto com os dados do Campeonato
+        mutation_probability, mutation_intensity (float): Taxas de mutação
+        streams (RandomStreams): Geradores do bloco ( get_offspring_streams, None = módulos random / np.random )
+        population_keys (set): Chaves dos individuos já inseridos ( None = não rejeita repetidos ); não é alterado
+        duplicate_retries (int): Nº máximo de novas mutações de um filho repetido ( esgotadas, o filho é mantido )
+        telemetry (Telemetry): Telemetria que mede as etapas de cruzamento e mutação ( None = não mede )
+
+    Retorna:
+        Tupla com a Lista de filhos e a Lista das suas chaves ( None sem population_keys )
+    """
+    if telemetry is None:
+        telemetry = Telemetry()
+
+    crossover_rng, mutation_rng = None, None
+    if streams is not None:
+        crossover_rng, mutation_rng = streams.numpy("crossover"), streams.python("mutation")
+
+    # Índice dos jogos de cada individuo escolhido como segundo pai, calculado uma única vez por bloco
+    game_indices = {}
+
+    children = []
+    children_keys = None
+    if population_keys is not None:
+        population_keys = set(population_keys)
+        children_keys = []
+
+    for n_parent1, n_parent2 in np.asarray(parents).tolist():
+
+        # cria novo individuo à partir do cruzamento dos 2 indivíduos escolhidos anteriormente
+        with telemetry.stage("crossover"):
+            if n_parent2 not in game_indices:
+                game_indices[n_parent2] = generate_game_index(population[n_parent2])
+            child1 = order_crossover(population[n_parent1], population[n_parent2], game_indices[n_parent2], crossover_rng)
+
+        # realiza ou não mutação no novo individuo
+        with telemetry.stage("mutation"):
+            child1 = mutate(child1, mutation_probability, mutation_intensity, context, mutation_rng)
+
+            if population_keys is not None:
+                child_key = generate_schedule_key(child1, context.n_teams)
+                for _ in range(duplicate_retries):
+                    if child_key not in population_keys:
+                        break
+                    child1 = mutate(child1, 1.0, mutation_intensity, context, mutation_rng)
+                    child_key = generate_schedule_key(child1, context.n_teams)
+                population_keys.add(child_key)
+                children_keys.append(child_key)
+
+        children.append(child1)
+
+    return children, children_keys
@@ -0,0 +1,116 @@
+# Avaliação da aptidão da população e geração dos filhos em paralelo, dividindo-as entre processos
+# Os dados do problema ( ProblemContext ) são enviados a cada processo uma única vez, na sua inicialização,
+# e cada tarefa recebe apenas o bloco de Tabelas a ser avaliado, ou os pais e a identificação dos geradores de um bloco de filhos
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from typing import List, Tuple
+import numpy as np
+from problem_context import ProblemContext
+from genetic_algorithm import calculate_population_fitness
+from random_streams import RandomStreams
+from offspring import OFFSPRING_COMPONENTS, generate_offspring
+
+# Contexto do problema e modo de avaliação no processo de trabalho ( definidos por _initialize_worker )
+_worker_context = None
+_worker_full_season = False
+
+def _initialize_worker(context: ProblemContext, full_season: bool = False):
+    global _worker_context, _worker_full_season
+    _worker_context = context
+    _worker_full_season = full_season
+
+def _evaluate_chunk(chunk: np.ndarray) -> np.ndarray:
+    return calculate_population_fitness(chunk, _worker_context, _worker_full_season)
+
+def _generate_offspring_chunk(task: tuple) -> tuple:
+    parent_population, parents, seed, spawn_key, mutation_probability, mutation_intensity, population_keys, duplicate_retries = task
+    streams = RandomStreams(seed, spawn_key, OFFSPRING_COMPONENTS)
+    children, children_keys = generate_offspring(parent_population, parents, _worker_context, mutation_probability, mutation_intensity,
+                                                 streams, population_keys, duplicate_retries)
+    children = np.stack(children)
+    return children, children_keys, calculate_population_fitness(children, _worker_context, _worker_full_season)
+
+class ParallelEvaluator:
+    """
+    Avalia a população e gera os filhos ( cruzamento, mutação e avaliação ) em um conjunto de processos ( concurrent.futures.ProcessPoolExecutor )
+    Os resultados são idênticos aos da execução serial: cada Tabela é avaliada de forma independente e cada bloco de filhos
+    tem os seus próprios geradores de números aleatórios ( offspring.py )
+
+    Atributos:
+        n_workers - Nº de processos
+        chunk_size - Nº de Tabelas por tarefa ( se None, a população é dividida igualmente entre os processos )
+        full_season - Aptidão do Campeonato completo ( turno e returno espelhado )
+    """
+
+    def __init__(self, context: ProblemContext, n_workers: int = None, chunk_size: int = None, full_season: bool = False):
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+        # Com "fork" o contexto é herdado pelos processos, sem serialização
+        start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        self._executor = ProcessPoolExecutor(max_workers=self.n_workers,
+                                             mp_context=multiprocessing.get_context(start_method),
+                                             initializer=_initialize_worker, initargs=(context, full_season))
+
+    def evaluate_population(self, population: np.ndarray) -> np.ndarray:
+        """
+        Calcula a aptidão de cada Tabela da população, dividindo-a em blocos entre os processos
+
+        Parâmetros:
+            population (np.ndarray): Array ( população x rodadas x jogos x 2 ) com os índices das Equipes de cada jogo
+
+        Retorna:
+            np.ndarray: Total de penalidades de cada individuo da população
+        """
+        population = np.asarray(population)
+        chunk_size = self.chunk_size or -(-len(population) // self.n_workers)
+        chunks = [population[start:start + chunk_size] for start in range(0, len(population), chunk_size)]
+
+        return np.concatenate(list(self._executor.map(_evaluate_chunk, chunks)))
+
+    def generate_offspring(self, population: List[np.ndarray], parent_chunks: List[np.ndarray], spawn_keys: List[Tuple[int, ...]], seed: int,
+                           mutation_probability: float, mutation_intensity: float, population_keys: set = None,
+                           duplicate_retries: int = 0) -> Tuple[List[np.ndarray], list, np.ndarray]:
+        """
+        Gera e avalia os filhos de cada bloco de pares de pais ( offspring.generate_offspring ), um bloco por tarefa
+        Cada tarefa recebe apenas os pais do seu bloco
+
+        Parâmetros:
+            population (List[np.ndarray]): População
+            parent_chunks (list): Blocos de pares de pais ( arrays filhos x 2 com os índices dos pais em population )
+            spawn_keys (list): Identificação dos geradores de cada bloco ( offspring.get_offspring_spawn_key )
+            seed (int): Semente dos geradores
+            mutation_probability, mutation_intensity (float): Taxas de mutação
+            population_keys (set): Chaves dos individuos já inseridos ( None = não rejeita repetidos )
+            duplicate_retries (int): Nº máximo de novas mutações de um filho repetido
+
+        Retorna:
+            Tupla com a Lista de filhos, a Lista das suas chaves ( None sem population_keys ) e a aptidão de cada filho
+        """
+        tasks = []
+        for parents, spawn_key in zip(parent_chunks, spawn_keys):
+            # Envia apenas os pais do bloco, com os índices renumerados
+            parent_indices, local_parents = np.unique(parents, return_inverse=True)
+            parent_population = np.stack([population[n] for n in parent_indices.tolist()])
+            tasks.append((parent_population, local_parents.reshape(parents.shape), seed, spawn_key, mutation_probability, mutation_intensity,
+                          population_keys, duplicate_retries))
+
+        children, children_keys, children_fitness = [], [] if population_keys is not None else None, []
+        for chunk_children, chunk_keys, chunk_fitness in self._executor.map(_generate_offspring_chunk, tasks):
+            children += list(chunk_children)
+            if children_keys is not None:
+                children_keys += chunk_keys
+            children_fitness.append(chunk_fitness)
+
+        return children, children_keys, np.concatenate(children_fitness) if children_fitness else np.empty(0)
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,132 @@
+# Dados do problema pré-calculados uma única vez e endereçados pelo índice de cada Equipe
+# Evita as buscas lineares por Código / Cidade dentro dos laços de cálculo da aptidão
+
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Mapping, Tuple
+import numpy as np
+from utils_tco import generate_matrix_distances, generate_teams_distance_traveled, generate_city_n_teams, get_team_city, get_team_name
+
+@dataclass(frozen=True)
+class ProblemContext:
+    """
+    Contexto imutável com os dados das Equipes, Cidades e deslocamentos do Campeonato
+    O índice de cada Equipe é a sua posição na Lista de Equipes ( Código - 1 ), o mesmo usado nas Tabelas codificadas em array
+
+    Atributos:
+        teams - Tupla com os Dicionários de Equipes
+        teams_code - Código de cada Equipe
+        teams_name - Nome de cada Equipe
+        team_index - Dicionário Código da Equipe -> índice
+        cities - Nome de cada Cidade sede
+        teams_city_id - Índice da Cidade sede de cada Equipe
+        same_city - Matriz ( n x n ) indicando se 2 Equipes são da mesma Cidade
+        city_n_teams - Nº de Equipes sediadas em cada Cidade
+        city_ideal_n_games - Nº máximo ideal de jogos por rodada em cada Cidade
+        matrix_distances - Matriz ( n x n ) com as distâncias entre as cidades sede das Equipes
+        teams_distance_traveled - Total dos deslocamentos de cada Equipe como Visitante durante o Campeonato
+        half_total_distance - Metade do total dos deslocamentos, valor ideal p/ cada turno
+    """
+    teams: Tuple[dict, ...]
+    teams_code: Tuple[str, ...]
+    teams_name: Tuple[str, ...]
+    team_index: Mapping[str, int]
+    cities: Tuple[str, ...]
+    teams_city_id: np.ndarray
+    same_city: np.ndarray
+    city_n_teams: np.ndarray
+    city_ideal_n_games: np.ndarray
+    matrix_distances: np.ndarray
+    teams_distance_traveled: np.ndarray
+    half_total_distance: np.ndarray
+
+    @property
+    def n_teams(self) -> int:
+        return len(self.teams)
+
+    @property
+    def n_cities(self) -> int:
+        return len(self.cities)
+
+    @property
+    def n_rounds(self) -> int:
+        return self.n_teams - 1
+
+    @property
+    def round_ngames(self) -> int:
+        return self.n_teams // 2
+
+    @cached_property
+    def same_city_mask(self) -> Tuple[int, ...]:
+        """
+        Máscara de bits de cada Equipe com as demais Equipes da mesma Cidade ( bit i = Equipe de índice i )
+        """
+        return tuple(sum(1 << other for other in np.flatnonzero(row) if other != team) for team, row in enumerate(self.same_city))
+
+    @cached_property
+    def teams_city_list(self) -> Tuple[int, ...]:
+        """
+        Índice da Cidade sede de cada Equipe em tupla Python, p/ acesso rápido em laços escalares
+        """
+        return tuple(self.teams_city_id.tolist())
+
+    @cached_property
+    def city_ideal_n_games_list(self) -> Tuple[int, ...]:
+        """
+        Nº máximo ideal de jogos por rodada de cada Cidade em tupla Python, p/ acesso rápido em laços escalares
+        """
+        return tuple(self.city_ideal_n_games.tolist())
+
+    @cached_property
+    def distance_rows(self) -> Tuple[Tuple[float, ...], ...]:
+        """
+        Matriz de distâncias em tuplas Python, p/ acesso rápido em laços escalares
+        """
+        return tuple(map(tuple, self.matrix_distances.tolist()))
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array = np.array(array)
+    array.flags.writeable = False
+    return array
+
+def generate_problem_context(teams: list, matrix_distances: np.ndarray = None, teams_distance_traveled: dict = None) -> ProblemContext:
+    """
+    Gera o Contexto do problema à partir da Lista de Equipes ( generate_teams_list_by_file )
+
+    Parâmetros:
+        teams (list): Lista de Dicionários de Equipes
+        matrix_distances (np.ndarray): Matriz de distâncias já calculada ( opcional, calculada à partir das Equipes se não informada )
+        teams_distance_traveled (dict): Total dos deslocamentos de cada Equipe já calculado ( opcional, calculado à partir da Matriz se não informado )
+
+    Retorna:
+        ProblemContext com os dados do Campeonato
+    """
+
+    if matrix_distances is None:
+        matrix_distances = generate_matrix_distances(teams)
+
+    if teams_distance_traveled is None:
+        teams_distance_traveled = generate_teams_distance_traveled(matrix_distances)
+    city_n_teams = generate_city_n_teams(teams)
+
+    cities = tuple(city["Cidade"] for city in city_n_teams)
+    city_index = {city: n_city for n_city, city in enumerate(cities)}
+    teams_city_id = np.array([city_index[get_team_city(team)] for team in teams], dtype=np.intp)
+    city_n_teams = np.array([city["QtdTimes"] for city in city_n_teams], dtype=np.intp)
+    total_distance = np.array(list(teams_distance_traveled.values()), dtype=float)
+
+    return ProblemContext(
+        teams=tuple(teams),
+        teams_code=tuple(team["Codigo"] for team in teams),
+        teams_name=tuple(get_team_name(team) for team in teams),
+        team_index=MappingProxyType({team["Codigo"]: n_team for n_team, team in enumerate(teams)}),
+        cities=cities,
+        teams_city_id=_read_only(teams_city_id),
+        same_city=_read_only(teams_city_id[:, None] == teams_city_id[None, :]),
+        city_n_teams=_read_only(city_n_teams),
+        city_ideal_n_games=_read_only((city_n_teams // 2) + (city_n_teams % 2)),
+        matrix_distances=_read_only(matrix_distances),
+        teams_distance_traveled=_read_only(total_distance),
+        half_total_distance=_read_only(total_distance / 2),
+    )
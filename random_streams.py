@@ -0,0 +1,91 @@
+# Geradores de números aleatórios independentes p/ cada componente do Algoritmo Genético
+# Uma única semente gera, via np.random.SeedSequence, um gerador NumPy ( np.random.Generator ) e um gerador Python ( random.Random )
+# p/ cada componente ( população inicial, seleção, cruzamento, mutação, desenho, busca local, diversidade ) e p/ cada ilha / processo
+# Assim a sequência sorteada por um componente não depende de quantos números os demais sortearam, nem da ordem de execução dos processos
+
+import random
+from typing import List, Tuple
+import numpy as np
+
+# Componentes que sorteiam números aleatórios ( cada um recebe os seus próprios geradores )
+COMPONENTS = ("initialization", "selection", "crossover", "mutation", "render", "local_search", "diversity")
+
+class RandomStreams:
+    """
+    Geradores de números aleatórios de cada componente, derivados de uma única semente
+
+    Uso:
+        streams = RandomStreams(seed)
+        order_crossover(parent1, parent2, rng=streams.numpy("crossover"))
+        mutate(solution, mutation_probability, mutation_intensity, context, rng=streams.python("mutation"))
+        island_streams = streams.spawn(n_islands)
+
+    Parâmetros:
+        seed (int): Semente ( None = sorteada pelo sistema operacional, ver o atributo seed )
+        spawn_key (tuple): Identificação dos geradores derivados ( spawn ), vazia nos geradores principais
+        components (tuple): Componentes cujos geradores são criados ( os geradores de cada componente não dependem dos demais )
+    """
+
+    def __init__(self, seed: int = None, spawn_key: Tuple[int, ...] = (), components: Tuple[str, ...] = COMPONENTS):
+        if seed is None:
+            seed = np.random.SeedSequence().entropy
+        self.seed = seed
+        self.spawn_key = tuple(spawn_key)
+
+        self._numpy = {}
+        self._python = {}
+        for component in components:
+            n_component = COMPONENTS.index(component)
+            # Chave ( 0, componente ) p/ os componentes, ( 1, nº ) p/ os geradores derivados e ( 2, geração, bloco ) p/ os blocos de filhos
+            # ( offspring.py ), que portanto nunca coincidem
+            numpy_sequence, python_sequence = np.random.SeedSequence(seed, spawn_key=self.spawn_key + (0, n_component)).spawn(2)
+            self._numpy[component] = np.random.Generator(np.random.PCG64(numpy_sequence))
+            self._python[component] = random.Random(int.from_bytes(python_sequence.generate_state(8).tobytes(), "little"))
+
+    def numpy(self, component: str) -> np.random.Generator:
+        """
+        Retorna o gerador NumPy do componente
+        """
+        return self._numpy[component]
+
+    def python(self, component: str) -> random.Random:
+        """
+        Retorna o gerador Python do componente
+        """
+        return self._python[component]
+
+    def spawn(self, n_children: int) -> List["RandomStreams"]:
+        """
+        Gera os geradores independentes de n_children ilhas / processos ( o resultado depende apenas da semente e do nº do filho )
+        """
+        return [RandomStreams(self.seed, self.spawn_key + (1, n_child)) for n_child in range(n_children)]
+
+    def get_state(self) -> dict:
+        """
+        Retorna o estado de todos os geradores ( dicionário serializável em JSON )
+        """
+        return {
+            "seed": self.seed,
+            "spawn_key": list(self.spawn_key),
+            "numpy": {component: generator.bit_generator.state for component, generator in self._numpy.items()},
+            # ( versão, estado interno ( tupla de 625 inteiros ), gauss_next ) de random.Random.getstate
+            "python": {component: list(generator.getstate()) for component, generator in self._python.items()},
+        }
+
+    def set_state(self, state: dict):
+        """
+        Restaura o estado de todos os geradores, gravado por get_state
+        """
+        for component, generator_state in state["numpy"].items():
+            self._numpy[component].bit_generator.state = generator_state
+        for component, (version, internal_state, gauss_next) in state["python"].items():
+            self._python[component].setstate((version, tuple(internal_state), gauss_next))
+
+    @classmethod
+    def from_state(cls, state: dict) -> "RandomStreams":
+        """
+        Recria os geradores à partir do estado gravado por get_state
+        """
+        streams = cls(state["seed"], state["spawn_key"])
+        streams.set_state(state)
+        return streams
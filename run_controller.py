@@ -0,0 +1,136 @@
+# Controle da execução do Algoritmo Genético: critérios de parada e adaptação das taxas de mutação
+# Critérios de parada: nº de gerações sem melhoria ( patience ), aptidão alvo, tempo máximo de execução e perda de diversidade
+# A probabilidade e a intensidade da mutação aumentam enquanto a melhor aptidão não melhora e voltam aos valores iniciais quando ela melhora
+
+import time
+from typing import Optional
+import numpy as np
+
+# Motivos de encerramento da execução ( SolverResult.stop_reason )
+STOP_REASONS = {
+    "max_generations": "nº máximo de gerações atingido",
+    "observer": "encerrada por um observador",
+    "patience": "sem melhoria da aptidão no nº de gerações informado",
+    "target_fitness": "aptidão alvo atingida",
+    "time_limit": "tempo máximo de execução atingido",
+    "diversity": "perda de diversidade da população",
+}
+
+# Melhoria mínima da aptidão p/ que a geração seja considerada uma melhoria
+MIN_IMPROVEMENT = 1e-6
+
+# Fator de aumento ( estagnação ) e de redução ( melhoria ) das taxas de mutação e os seus valores máximos
+ADAPTATION_FACTOR = 1.5
+MAX_MUTATION_PROBABILITY = 1.0
+MAX_MUTATION_INTENSITY = 0.5
+
+def calculate_fitness_diversity(population_fitness: np.ndarray) -> float:
+    """
+    Mede a diversidade da população pela dispersão da aptidão ( coeficiente de variação, desvio padrão / média, O(P) )
+    Tende a 0 quando a população é formada por cópias do mesmo individuo
+    """
+    population_fitness = np.asarray(population_fitness, dtype=np.float64)
+    mean_fitness = population_fitness.mean()
+    return float(population_fitness.std() / mean_fitness) if mean_fitness else 0.00
+
+class RunController:
+    """
+    Decide, ao final da avaliação de cada geração, se a execução deve ser encerrada e quais taxas de mutação utilizar na próxima geração
+
+    Uso:
+        controller = RunController.from_config(config)
+        stop_reason = controller.update(generation, population_fitness)
+        mutate(..., controller.mutation_probability, controller.mutation_intensity, ...)
+
+    Parâmetros:
+        mutation_probability (float): Probabilidade de mutação inicial
+        mutation_intensity (float): Intensidade da mutação inicial
+        patience (int): Nº de gerações sem melhoria da aptidão p/ encerrar a execução ( None = não encerra )
+        target_fitness (float): Aptidão que encerra a execução quando atingida ( None = não encerra )
+        time_limit (float): Tempo máximo ( segundos ) da execução ( None = sem limite )
+        min_diversity (float): Diversidade ( informada em update ) abaixo da qual a execução é encerrada ( None = não encerra )
+        adaptive_mutation (bool): Adapta as taxas de mutação ao progresso da aptidão
+        adaptation_window (int): Nº de gerações sem melhoria entre os aumentos das taxas de mutação
+    """
+
+    def __init__(self, mutation_probability: float, mutation_intensity: float, patience: int = None, target_fitness: float = None,
+                 time_limit: float = None, min_diversity: float = None, adaptive_mutation: bool = False, adaptation_window: int = 20):
+        self.base_mutation_probability = mutation_probability
+        self.base_mutation_intensity = mutation_intensity
+        self.mutation_probability = mutation_probability
+        self.mutation_intensity = mutation_intensity
+        self.patience = patience
+        self.target_fitness = target_fitness
+        self.time_limit = time_limit
+        self.min_diversity = min_diversity
+        self.adaptive_mutation = adaptive_mutation
+        self.adaptation_window = max(adaptation_window, 1)
+
+        self.best_fitness = None
+        self.last_improvement = 0
+        self.diversity = None
+        self._start = time.perf_counter()
+
+    @classmethod
+    def from_config(cls, config) -> "RunController":
+        """
+        Cria o controle à partir dos parâmetros de execução do Solver ( SolverConfig )
+        """
+        return cls(config.mutation_probability, config.mutation_intensity, config.patience, config.target_fitness, config.time_limit,
+                   config.min_diversity, config.adaptive_mutation, config.adaptation_window)
+
+    def update(self, generation: int, population_fitness: np.ndarray, diversity: float = None) -> Optional[str]:
+        """
+        Registra o resultado da geração, adapta as taxas de mutação e verifica os critérios de parada
+
+        Parâmetros:
+            generation (int): Nº da geração
+            population_fitness (np.ndarray): Aptidão de cada individuo da população
+            diversity (float): Diversidade da população, por exemplo estimate_population_diversity ( None = calculate_fitness_diversity )
+
+        Retorna:
+            Motivo do encerramento ( chave de STOP_REASONS ) ou None p/ continuar a execução
+        """
+        best_fitness = float(np.min(population_fitness))
+        self.diversity = calculate_fitness_diversity(population_fitness) if diversity is None else diversity
+
+        if self.best_fitness is None or best_fitness < self.best_fitness - MIN_IMPROVEMENT:
+            self.best_fitness = best_fitness
+            self.last_improvement = generation
+            if self.adaptive_mutation:
+                self.mutation_probability = max(self.base_mutation_probability, self.mutation_probability / ADAPTATION_FACTOR)
+                self.mutation_intensity = max(self.base_mutation_intensity, self.mutation_intensity / ADAPTATION_FACTOR)
+        elif self.adaptive_mutation and (generation - self.last_improvement) % self.adaptation_window == 0:
+            self.mutation_probability = min(MAX_MUTATION_PROBABILITY, self.mutation_probability * ADAPTATION_FACTOR)
+            self.mutation_intensity = min(MAX_MUTATION_INTENSITY, self.mutation_intensity * ADAPTATION_FACTOR)
+
+        if self.target_fitness is not None and self.best_fitness <= self.target_fitness:
+            return "target_fitness"
+        if self.patience is not None and generation - self.last_improvement >= self.patience:
+            return "patience"
+        if self.min_diversity is not None and self.diversity < self.min_diversity:
+            return "diversity"
+        if self.time_limit is not None and time.perf_counter() - self._start >= self.time_limit:
+            return "time_limit"
+        return None
+
+    def get_state(self) -> dict:
+        """
+        Retorna o estado do controle ( dicionário serializável em JSON, gravado no checkpoint )
+        O tempo máximo de execução vale p/ cada execução, o tempo decorrido não é gravado
+        """
+        return {
+            "best_fitness": self.best_fitness,
+            "last_improvement": self.last_improvement,
+            "mutation_probability": self.mutation_probability,
+            "mutation_intensity": self.mutation_intensity,
+        }
+
+    def set_state(self, state: dict):
+        """
+        Restaura o estado gravado por get_state
+        """
+        self.best_fitness = state["best_fitness"]
+        self.last_improvement = state["last_improvement"]
+        self.mutation_probability = state["mutation_probability"]
+        self.mutation_intensity = state["mutation_intensity"]
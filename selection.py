@@ -0,0 +1,137 @@
+# Seleção dos pais da próxima geração
+# Os pesos de seleção são calculados uma única vez por geração e todos os pais são sorteados de uma só vez ( numpy )
+# Estratégias disponíveis: roleta ( inverso da aptidão ), torneio, ranking linear e amostragem estocástica universal ( SUS )
+
+import numpy as np
+
+def _inverse_fitness_weights(population_fitness: np.ndarray) -> np.ndarray:
+    """
+    Pesos proporcionais ao inverso da aptidão, isto é, individuos melhores adaptados (fitness menor) tem peso maior
+    """
+    return 1 / np.asarray(population_fitness, dtype=np.float64)
+
+def _rank_weights(population_fitness: np.ndarray) -> np.ndarray:
+    """
+    Pesos pelo ranking linear: o melhor individuo tem peso P, o segundo P - 1, ..., o pior 1
+    """
+    population_fitness = np.asarray(population_fitness)
+    n_individuals = len(population_fitness)
+    weights = np.empty(n_individuals, dtype=np.float64)
+    weights[np.argsort(population_fitness, kind="stable")] = np.arange(n_individuals, 0, -1)
+    return weights
+
+def _draw_by_weights(weights: np.ndarray, n_draws: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Sorteia n_draws índices com probabilidade proporcional aos pesos ( tabela acumulada + busca binária )
+    """
+    cumulative_weights = np.cumsum(weights)
+    draws = rng.random(n_draws) * cumulative_weights[-1]
+    return np.minimum(np.searchsorted(cumulative_weights, draws, side="right"), len(weights) - 1)
+
+def roulette_selection(population_fitness: np.ndarray, n_parents: int, tournament_size: int = 2, rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Seleção por roleta: probabilidade de escolha proporcional ao inverso da aptidão ( O(P + n log P) )
+
+    Parâmetros:
+        population_fitness (np.ndarray): Aptidão de cada individuo da população
+        n_parents (int): Nº de pais a serem sorteados
+        tournament_size (int): Não utilizado ( mantém a mesma assinatura das demais estratégias )
+        rng (np.random.Generator): Gerador de números aleatórios ( None = módulo np.random )
+
+    Retorna:
+        np.ndarray: Índices dos pais sorteados
+    """
+    return _draw_by_weights(_inverse_fitness_weights(population_fitness), n_parents, np.random if rng is None else rng)
+
+def rank_selection(population_fitness: np.ndarray, n_parents: int, tournament_size: int = 2, rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Seleção por ranking linear: a probabilidade de escolha depende apenas da posição do individuo, não da escala da aptidão ( O(P log P) )
+
+    Parâmetros:
+        population_fitness (np.ndarray): Aptidão de cada individuo da população
+        n_parents (int): Nº de pais a serem sorteados
+        tournament_size (int): Não utilizado ( mantém a mesma assinatura das demais estratégias )
+        rng (np.random.Generator): Gerador de números aleatórios ( None = módulo np.random )
+
+    Retorna:
+        np.ndarray: Índices dos pais sorteados
+    """
+    return _draw_by_weights(_rank_weights(population_fitness), n_parents, np.random if rng is None else rng)
+
+def tournament_selection(population_fitness: np.ndarray, n_parents: int, tournament_size: int = 2, rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Seleção por torneio: cada pai é o melhor individuo (fitness menor) entre tournament_size individuos sorteados ( O(n x k) )
+
+    Parâmetros:
+        population_fitness (np.ndarray): Aptidão de cada individuo da população
+        n_parents (int): Nº de pais a serem sorteados
+        tournament_size (int): Nº de individuos em cada torneio
+        rng (np.random.Generator): Gerador de números aleatórios ( None = módulo np.random )
+
+    Retorna:
+        np.ndarray: Índices dos pais sorteados
+    """
+    if rng is None:
+        rng = np.random
+
+    # choice( n, size ) tem o mesmo resultado de randint( 0, n, size ) no módulo np.random e também existe em np.random.Generator
+    population_fitness = np.asarray(population_fitness)
+    contestants = rng.choice(len(population_fitness), size=(n_parents, max(tournament_size, 1)))
+    winners = np.argmin(population_fitness[contestants], axis=1)
+    return contestants[np.arange(n_parents), winners]
+
+def sus_selection(population_fitness: np.ndarray, n_parents: int, tournament_size: int = 2, rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Amostragem estocástica universal ( SUS ): um único sorteio posiciona n ponteiros igualmente espaçados sobre a roleta,
+    o que reduz a variância do nº de cópias de cada individuo em relação à roleta ( O(P + n log P) )
+    Os pais sorteados são embaralhados, pois os ponteiros percorrem a população em ordem
+
+    Parâmetros:
+        population_fitness (np.ndarray): Aptidão de cada individuo da população
+        n_parents (int): Nº de pais a serem sorteados
+        tournament_size (int): Não utilizado ( mantém a mesma assinatura das demais estratégias )
+        rng (np.random.Generator): Gerador de números aleatórios ( None = módulo np.random )
+
+    Retorna:
+        np.ndarray: Índices dos pais sorteados
+    """
+    if rng is None:
+        rng = np.random
+
+    # Sem pais a sortear ( por exemplo, Elite do tamanho da população ) não há passo entre os ponteiros
+    if n_parents <= 0:
+        return np.empty(0, dtype=int)
+
+    cumulative_weights = np.cumsum(_inverse_fitness_weights(population_fitness))
+    step = cumulative_weights[-1] / n_parents
+    pointers = (rng.random() + np.arange(n_parents)) * step
+    parents = np.minimum(np.searchsorted(cumulative_weights, pointers, side="right"), len(cumulative_weights) - 1)
+    rng.shuffle(parents)
+    return parents
+
+SELECTION_STRATEGIES = {
+    "roulette": roulette_selection,
+    "tournament": tournament_selection,
+    "rank": rank_selection,
+    "sus": sus_selection,
+}
+
+def select_parents(population_fitness: np.ndarray, n_pairs: int, strategy: str = "roulette", tournament_size: int = 2,
+                   rng: np.random.Generator = None) -> np.ndarray:
+    """
+    Sorteia de uma só vez os pares de pais de todos os filhos da próxima geração
+
+    Parâmetros:
+        population_fitness (np.ndarray): Aptidão de cada individuo da população
+        n_pairs (int): Nº de pares de pais ( nº de filhos a serem gerados )
+        strategy (str): Estratégia de seleção ( "roulette", "tournament", "rank" ou "sus" )
+        tournament_size (int): Nº de individuos em cada torneio ( estratégia "tournament" )
+        rng (np.random.Generator): Gerador de números aleatórios ( None = módulo np.random )
+
+    Retorna:
+        np.ndarray: Array ( n_pairs x 2 ) com os índices dos pais de cada filho
+    """
+    if strategy not in SELECTION_STRATEGIES:
+        raise ValueError(f"Estratégia de seleção inválida: {strategy}")
+
+    return SELECTION_STRATEGIES[strategy](population_fitness, n_pairs * 2, tournament_size, rng).reshape(n_pairs, 2)
@@ -0,0 +1,600 @@
+# Solver da TCO ( Tabela de Campeonato Otimizado ) utilizando Algoritmo Genético, independente de interface gráfica
+# Pode ser importado ( solve ) ou executado pela linha de comando:
+#   python solver.py --teams dados/Times_Brasileirao_2025_Serie_A.csv --max-generations 500 --seed 42 --output tabela.csv
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field, fields, replace
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from genetic_algorithm import mutate, rank_population
+from utils_tco import *
+from problem_context import ProblemContext, generate_problem_context
+from fitness_cache import FitnessCache, generate_schedule_key
+from parallel_evaluation import ParallelEvaluator
+from offspring import generate_offspring, get_offspring_spawn_key, get_offspring_streams, split_parents
+from selection import SELECTION_STRATEGIES, select_parents
+from telemetry import Telemetry
+from checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from random_streams import RandomStreams
+from local_search import local_search
+from initialization import generate_constructive_schedules
+from run_controller import STOP_REASONS, RunController
+from diversity import estimate_population_diversity
+from history import DownsampledSeries, HistoryWriter
+
+@dataclass
+class SolverConfig:
+    """
+    Parâmetros de execução do Solver
+
+    Atributos:
+        teams_file - Arquivo .csv com os dados das Equipes
+        sep - Caractere utilizado para separar as colunas dos Arquivos .csv
+        encoding - Encoding dos Arquivos .csv
+        population_size - Tamanho da população ( None = 20 x nº de Equipes )
+        constructive_fraction - Fração da População Inicial gerada com o nº mínimo de quebras ( 0 = toda aleatória, 1 = toda construtiva )
+        constructive_candidates - Nº de variantes sorteadas p/ cada individuo construtivo ( mais candidatos = melhor aptidão, menos diversidade )
+        max_generations - Nº máximo de gerações
+        full_season - Otimiza o Campeonato completo ( turno e returno espelhado, derivado do turno ) em vez de apenas o turno
+        mutation_probability - Probabilidade de mutação ( inicial, com adaptive_mutation )
+        mutation_intensity - Intensidade da mutação ( inicial, com adaptive_mutation )
+        adaptive_mutation - Aumenta a probabilidade e a intensidade da mutação enquanto a aptidão não melhora ( ver RunController )
+        adaptation_window - Nº de gerações sem melhoria entre os aumentos das taxas de mutação
+        patience - Encerra a execução após este nº de gerações sem melhoria da aptidão ( None = não encerra )
+        target_fitness - Encerra a execução quando a melhor aptidão atinge este valor ( None = não encerra )
+        time_limit - Tempo máximo ( segundos ) de execução ( None = sem limite; com limite a execução não é reproduzível )
+        min_diversity - Encerra a execução quando a diversidade da população ( estimate_population_diversity, 0 a ~0.5 ) fica abaixo deste valor ( None = não encerra )
+        reject_duplicates - Rejeita os filhos idênticos a um individuo já inserido na nova população, aplicando nova mutação
+        duplicate_retries - Nº máximo de novas mutações de um filho repetido ( esgotadas, o filho é mantido )
+        offspring_chunk_size - Nº de filhos por bloco, cada bloco com os seus próprios geradores de números aleatórios ( o resultado não depende
+                               do nº de processos, mas depende do tamanho do bloco )
+        diversity_samples - Nº de pares de individuos sorteados p/ estimar a diversidade ( distância de Hamming entre os mandos de campo )
+        elite_size - Nº de melhores individuos mantidos na geração seguinte ( Elitismo )
+        selection_strategy - Estratégia de seleção dos pais ( "roulette", "tournament", "rank" ou "sus" )
+        tournament_size - Nº de individuos em cada torneio ( estratégia "tournament" )
+        local_search_size - Nº de melhores individuos melhorados pela busca local a cada geração ( 0 = sem busca local )
+        local_search_moves - Nº máximo de movimentos avaliados pela busca local a cada geração ( None = sem limite, 0 = sem busca local )
+        local_search_time - Tempo máximo ( segundos ) da busca local a cada geração ( None = sem limite; com limite a execução não é reproduzível )
+        seed - Semente dos geradores de números aleatórios de cada componente ( None = sorteada, informada em SolverResult.seed )
+        output_file - Arquivo .csv a ser gerado com a melhor Tabela ( None = não gera arquivo )
+        fitness_cache_size - Nº máximo de Tabelas no cache de aptidão
+        parallel_evaluation - Avalia a população e gera os filhos ( cruzamento, mutação e avaliação ) em vários processos
+        n_workers - Nº de processos ( None = nº de CPUs )
+        chunk_size - Nº de Tabelas por tarefa ( None = população dividida igualmente entre os processos )
+        distance_cache_dir - Diretório onde as distâncias entre as cidades são gravadas p/ as próximas execuções ( None = não grava )
+        telemetry_file - Arquivo .csv / .jsonl a ser gerado com a telemetria de cada geração ( None = telemetria desabilitada )
+        history_file - Arquivo .jsonl a ser gerado com o histórico de cada geração, com a melhor Tabela quando ela melhora ( None = não grava )
+        history_points - Nº máximo de pontos da série da melhor aptidão mantida em memória ( SolverResult.fitness_history )
+        checkpoint_file - Arquivo .npz com a situação da execução, gravado periodicamente e ao final ( None = não grava )
+        checkpoint_interval - Nº de gerações entre as gravações do checkpoint
+        resume - Continua a execução à partir do checkpoint_file, se existir ( os parâmetros do Algoritmo Genético são os do checkpoint )
+    """
+    teams_file: str = "dados/Times_Brasileirao_2025_Serie_A.csv"
+    sep: str = ";"
+    encoding: str = "ISO-8859-1"
+    population_size: Optional[int] = None
+    constructive_fraction: float = 0.0
+    constructive_candidates: int = 1
+    max_generations: int = 2000
+    full_season: bool = False
+    mutation_probability: float = 0.5
+    mutation_intensity: float = 0.1
+    adaptive_mutation: bool = False
+    adaptation_window: int = 20
+    patience: Optional[int] = None
+    target_fitness: Optional[float] = None
+    time_limit: Optional[float] = None
+    min_diversity: Optional[float] = None
+    reject_duplicates: bool = False
+    duplicate_retries: int = 3
+    diversity_samples: int = 100
+    offspring_chunk_size: int = 50
+    elite_size: int = 1
+    selection_strategy: str = "roulette"
+    tournament_size: int = 3
+    local_search_size: int = 0
+    local_search_moves: Optional[int] = 1000
+    local_search_time: Optional[float] = None
+    seed: Optional[int] = None
+    output_file: Optional[str] = None
+    fitness_cache_size: int = 100000
+    parallel_evaluation: bool = False
+    n_workers: Optional[int] = None
+    chunk_size: Optional[int] = None
+    distance_cache_dir: Optional[str] = "cache"
+    telemetry_file: Optional[str] = None
+    history_file: Optional[str] = None
+    history_points: int = 1000
+    checkpoint_file: Optional[str] = None
+    checkpoint_interval: int = 50
+    resume: bool = False
+
+@dataclass
+class SolverResult:
+    """
+    Resultado da execução do Solver
+
+    Atributos:
+        context - Contexto com os dados do Campeonato
+        best_solution - Melhor Tabela encontrada ( array rodadas x jogos x 2 )
+        best_fitness - Aptidão da melhor Tabela
+        n_generations - Nº de gerações executadas
+        fitness_history - Série reduzida ( tamanho limitado ) da melhor aptidão de cada geração; o histórico completo é gravado em config.history_file
+        cache_hits / cache_misses - Consultas atendidas / não atendidas pelo cache de aptidão
+        seed - Semente utilizada ( reproduz a execução quando informada em SolverConfig.seed )
+        stop_reason - Motivo do encerramento da execução ( chave de STOP_REASONS )
+        diversity - Diversidade da população na última geração ( estimate_population_diversity )
+    """
+    context: ProblemContext
+    best_solution: np.ndarray
+    best_fitness: float
+    n_generations: int
+    fitness_history: DownsampledSeries = field(default_factory=DownsampledSeries)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    seed: Optional[int] = None
+    stop_reason: Optional[str] = None
+    diversity: Optional[float] = None
+
+# Parâmetros que podem ser alterados ao continuar uma execução ( os demais são lidos do checkpoint )
+RESUME_FIELDS = ("max_generations", "patience", "target_fitness", "time_limit", "min_diversity", "output_file", "fitness_cache_size", "parallel_evaluation", "n_workers", "chunk_size",
+                 "distance_cache_dir", "telemetry_file", "history_file", "checkpoint_file", "checkpoint_interval", "resume")
+
+# Valor mínimo dos parâmetros inteiros ( None, quando permitido, mantém o significado documentado em SolverConfig )
+CONFIG_MIN_VALUES = {"population_size": 1, "elite_size": 0, "tournament_size": 1, "offspring_chunk_size": 1, "duplicate_retries": 0,
+                     "local_search_size": 0, "local_search_moves": 0, "fitness_cache_size": 0, "checkpoint_interval": 1, "n_workers": 1,
+                     "chunk_size": 1}
+
+# Observador chamado ao final da avaliação de cada geração ( a população não é ordenada, a melhor solução está em result ):
+#   observer(generation, population, population_fitness, result) -> retorna False p/ encerrar a execução
+Observer = Callable[[int, List[np.ndarray], np.ndarray, SolverResult], Optional[bool]]
+
+def validate_config(config: SolverConfig):
+    """
+    Verifica os parâmetros de execução, gerando ValueError se algum for inválido
+    """
+    if config.max_generations < 1:
+        raise ValueError(f"O nº máximo de gerações deve ser maior que 0: {config.max_generations}")
+    if not 0 <= config.constructive_fraction <= 1:
+        raise ValueError(f"A fração construtiva da População Inicial deve estar entre 0 e 1: {config.constructive_fraction}")
+    for name, minimum in CONFIG_MIN_VALUES.items():
+        value = getattr(config, name)
+        if value is not None and value < minimum:
+            raise ValueError(f"O parâmetro {name} deve ser maior ou igual a {minimum}: {value}")
+
+def load_problem(config: SolverConfig) -> Tuple[list, ProblemContext]:
+    """
+    Lê o arquivo de Equipes e gera os dados do problema
+
+    Parâmetros:
+        config (SolverConfig): Parâmetros de execução
+
+    Retorna:
+        Tupla com a Lista de Equipes e o Contexto do problema
+    """
+    teams = generate_teams_list_by_file(config.teams_file, config.sep, config.encoding)
+    matrix_distances, teams_distance_traveled = load_matrix_distances(config.teams_file, teams, config.distance_cache_dir)
+    context = generate_problem_context(teams, matrix_distances, teams_distance_traveled)
+
+    return teams, context
+
+def generate_initial_population(config: SolverConfig, teams: list, context: ProblemContext, streams: RandomStreams = None) -> List[np.ndarray]:
+    """
+    Gera a População Inicial: cada Solução é um array ( rodadas x jogos x 2 ) com os índices das Equipes Mandante e Visitante de cada jogo
+    A fração config.constructive_fraction é gerada com o nº mínimo de quebras ( generate_constructive_schedules ), as demais aleatoriamente
+
+    Parâmetros:
+        config (SolverConfig): Parâmetros de execução
+        teams (list): Lista de Dicionários de Equipes
+        context (ProblemContext): Contexto com os dados do Campeonato
+        streams (RandomStreams): Geradores de números aleatórios ( None = módulos random / np.random )
+
+    Retorna:
+        Lista com os individuos da população
+    """
+    population_size = context.n_teams * 20 if config.population_size is None else config.population_size
+    n_constructive = min(max(round(population_size * config.constructive_fraction), 0), population_size)
+    rng = streams.python("initialization") if streams else None
+
+    population = []
+    if n_constructive > 0:
+        population += list(generate_constructive_schedules(context, n_constructive, config.constructive_candidates, config.full_season, rng))
+    if n_constructive < population_size:
+        population += list(generate_random_schedules(teams, population_size - n_constructive, rng))
+
+    return population
+
+def evolve_population(population: List[np.ndarray], population_fitness: np.ndarray, config: SolverConfig, context: ProblemContext,
+                      elite: np.ndarray = None, telemetry: Telemetry = None, streams: RandomStreams = None,
+                      mutation_probability: float = None, mutation_intensity: float = None, generation: int = 0,
+                      evaluator: ParallelEvaluator = None, fitness_cache: FitnessCache = None) -> List[np.ndarray]:
+    """
+    Gera a próxima geração à partir da população avaliada
+        - mantém as melhores soluções ( Elitismo )
+        - sorteia de uma só vez os pais de todos os filhos, pela estratégia de seleção configurada
+        - gera os filhos ( cruzamento seguido ou não de mutação ) em blocos de config.offspring_chunk_size, cada bloco com os seus
+          próprios geradores ( offspring.py ); com evaluator os blocos são gerados e avaliados em paralelo, com o mesmo resultado
+        - com config.reject_duplicates, aplica nova mutação aos filhos idênticos a um individuo já inserido na nova população
+          ( pela chave canônica da Tabela ): dentro de cada bloco e, ao final, entre os blocos
+
+    Parâmetros:
+        population (List[np.ndarray]): População
+        population_fitness (np.ndarray): Aptidão de cada individuo da população
+        config (SolverConfig): Parâmetros de execução
+        context (ProblemContext): Contexto com os dados do Campeonato
+        elite (np.ndarray): Índices dos melhores individuos, em ordem de aptidão ( se não informado, obtido por rank_population )
+        telemetry (Telemetry): Telemetria que mede as etapas de seleção, cruzamento, mutação e geração paralela ( None = não mede )
+        streams (RandomStreams): Geradores de números aleatórios de cada etapa ( None = módulos random / np.random )
+        mutation_probability, mutation_intensity (float): Taxas de mutação ( None = as de config, ver RunController )
+        generation (int): Nº da geração ( identifica os geradores de cada bloco de filhos )
+        evaluator (ParallelEvaluator): Gera e avalia os blocos de filhos em paralelo ( None = geração serial; exige streams )
+        fitness_cache (FitnessCache): Recebe a aptidão dos filhos avaliados em paralelo ( None = não guarda )
+
+    Retorna:
+        Lista com os individuos da nova população
+    """
+    if mutation_probability is None:
+        mutation_probability = config.mutation_probability
+    if mutation_intensity is None:
+        mutation_intensity = config.mutation_intensity
+
+    if telemetry is None:
+        telemetry = Telemetry()
+
+    selection_rng, mutation_rng = None, None
+    if streams is not None:
+        selection_rng, mutation_rng = streams.numpy("selection"), streams.python("mutation")
+
+    if elite is None:
+        with telemetry.stage("sort"):
+            elite = rank_population(population_fitness, config.elite_size)
+
+    # Mantém na nova população as melhores soluções encontradas na geração atual (Elitismo)
+    new_population = [population[n] for n in elite[:max(config.elite_size, 1)].tolist()]
+
+    # Chaves dos individuos já inseridos na nova população
+    population_keys = {generate_schedule_key(season, context.n_teams) for season in new_population} if config.reject_duplicates else None
+
+    # seleção baseada na aptidão, isto é, individuos melhores adaptados (fitness menor) tem maior chance de serem escolhidos
+    with telemetry.stage("selection"):
+        parents = select_parents(population_fitness, len(population) - len(new_population), config.selection_strategy, config.tournament_size,
+                                 selection_rng)
+    parent_chunks = split_parents(parents, config.offspring_chunk_size)
+
+    children_fitness = None
+    if evaluator is not None and streams is not None:
+        with telemetry.stage("offspring"):
+            spawn_keys = [get_offspring_spawn_key(streams, generation, n_chunk) for n_chunk in range(len(parent_chunks))]
+            children, children_keys, children_fitness = evaluator.generate_offspring(population, parent_chunks, spawn_keys, streams.seed,
+                                                                                     mutation_probability, mutation_intensity,
+                                                                                     population_keys, config.duplicate_retries)
+    else:
+        children, children_keys = [], [] if population_keys is not None else None
+        for n_chunk, chunk in enumerate(parent_chunks):
+            chunk_children, chunk_keys = generate_offspring(population, chunk, context, mutation_probability, mutation_intensity,
+                                                            get_offspring_streams(streams, generation, n_chunk), population_keys,
+                                                            config.duplicate_retries, telemetry)
+            children += chunk_children
+            if children_keys is not None:
+                children_keys += chunk_keys
+
+    # Filhos avaliados cuja aptidão continua válida ( não alterados entre os blocos )
+    evaluated = np.ones(len(children), dtype=bool)
+
+    if population_keys is not None:
+        # Filhos repetidos entre blocos diferentes ( cada bloco conhece apenas os seus filhos e a Elite )
+        with telemetry.stage("mutation"):
+            for n_child, child_key in enumerate(children_keys):
+                for _ in range(config.duplicate_retries):
+                    if child_key not in population_keys:
+                        break
+                    children[n_child] = mutate(children[n_child], 1.0, mutation_intensity, context, mutation_rng)
+                    child_key = generate_schedule_key(children[n_child], context.n_teams)
+                    children_keys[n_child] = child_key
+                    evaluated[n_child] = False
+                population_keys.add(child_key)
+
+    if children_fitness is not None and fitness_cache is not None and evaluated.any():
+        with telemetry.stage("fitness"):
+            fitness_cache.store_population(np.stack([child for child, valid in zip(children, evaluated) if valid]), children_fitness[evaluated],
+                                           [key for key, valid in zip(children_keys, evaluated) if valid] if children_keys is not None else None,
+                                           precomputed=True)
+
+    return new_population + children
+
+def improve_population(population: List[np.ndarray], population_fitness: np.ndarray, config: SolverConfig, context: ProblemContext,
+                       fitness_cache: FitnessCache, streams: RandomStreams = None) -> List[int]:
+    """
+    Aplica a busca local aos config.local_search_size melhores individuos da população ( altera a população e a aptidão )
+    O limite de movimentos da geração é dividido entre os individuos sem ser ultrapassado ( o resto da divisão vai p/ os melhores ),
+    o limite de tempo é compartilhado ( os melhores primeiro )
+
+    Parâmetros:
+        population (List[np.ndarray]): População
+        population_fitness (np.ndarray): Aptidão de cada individuo da população
+        config (SolverConfig): Parâmetros de execução
+        context (ProblemContext): Contexto com os dados do Campeonato
+        fitness_cache (FitnessCache): Cache de aptidão ( recebe a aptidão das Tabelas melhoradas )
+        streams (RandomStreams): Geradores de números aleatórios ( None = módulo random )
+
+    Retorna:
+        Lista com os índices dos individuos melhorados
+    """
+    n_individuals = min(config.local_search_size, len(population))
+    if n_individuals <= 0:
+        return []
+
+    deadline = time.perf_counter() + config.local_search_time if config.local_search_time is not None else None
+    rng = streams.python("local_search") if streams else None
+    improved = []
+
+    for n_best, n_individual in enumerate(rank_population(population_fitness, n_individuals)[:n_individuals].tolist()):
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        # Divide o limite de movimentos sem ultrapassá-lo: o resto da divisão vai p/ os melhores, sem movimentos a busca não é executada
+        max_moves = None
+        if config.local_search_moves is not None:
+            max_moves = config.local_search_moves // n_individuals + (1 if n_best < config.local_search_moves % n_individuals else 0)
+            if max_moves == 0:
+                break
+        state = local_search(population[n_individual], context, max_moves, deadline, config.full_season, rng)
+        if state.fitness < population_fitness[n_individual]:
+            population[n_individual] = state.season
+            population_fitness[n_individual] = state.fitness
+            improved.append(n_individual)
+
+    if improved:
+        fitness_cache.store_population(np.stack([population[n_individual] for n_individual in improved]), population_fitness[improved])
+
+    return improved
+
+def get_output_season(config: SolverConfig, season: np.ndarray) -> np.ndarray:
+    """
+    Retorna a Tabela a ser gravada / mostrada: o turno, ou o Campeonato completo ( turno e returno ) com config.full_season
+    """
+    return generate_full_season(season) if config.full_season else season
+
+def write_checkpoint(config: SolverConfig, generation: int, population: List[np.ndarray], fitness_cache: FitnessCache, result: SolverResult,
+                     streams: RandomStreams, controller: RunController):
+    """
+    Grava o checkpoint com a população da próxima geração ( já avaliada, pelo cache de aptidão ) e o estado dos geradores de números aleatórios
+
+    Parâmetros:
+        config (SolverConfig): Parâmetros de execução
+        generation (int): Nº da última geração concluída
+        population (List[np.ndarray]): População da próxima geração
+        fitness_cache (FitnessCache): Cache de aptidão ( a avaliação é reaproveitada na geração seguinte )
+        result (SolverResult): Resultado parcial da execução
+        streams (RandomStreams): Geradores de números aleatórios de cada componente
+        controller (RunController): Controle da execução
+    """
+    population = np.stack(population)
+    population_fitness = fitness_cache.evaluate_population(population)
+
+    save_checkpoint(config.checkpoint_file, Checkpoint(generation, population, population_fitness, asdict(config), streams.get_state(),
+                                                       result.fitness_history.get_state(), fitness_cache.hits, fitness_cache.misses,
+                                                       controller.get_state()))
+
+def resume_config(config: SolverConfig, checkpoint: Checkpoint) -> SolverConfig:
+    """
+    Gera os parâmetros da continuação de uma execução: os do checkpoint, exceto os de RESUME_FIELDS, que são os informados
+    """
+    return replace(SolverConfig(**checkpoint.config), **{name: getattr(config, name) for name in RESUME_FIELDS})
+
+def solve(config: SolverConfig, observers: List[Observer] = (), telemetry: Telemetry = None) -> SolverResult:
+    """
+    Executa o Algoritmo Genético até o nº máximo de gerações, até que algum critério de parada do RunController seja atendido
+    ( gerações sem melhoria, aptidão alvo, tempo máximo, perda de diversidade ) ou até que algum observador solicite o encerramento
+    O motivo do encerramento é informado em SolverResult.stop_reason
+    Com config.resume, continua a execução gravada em config.checkpoint_file exatamente do ponto em que parou
+
+    Parâmetros:
+        config (SolverConfig): Parâmetros de execução
+        observers (list): Observadores chamados a cada geração ( visualização, progresso, etc. )
+        telemetry (Telemetry): Telemetria de cada geração ( se não informada, gravada em config.telemetry_file, se houver )
+
+    Retorna:
+        SolverResult com a melhor Tabela encontrada
+    """
+
+    validate_config(config)
+
+    checkpoint = None
+    if config.resume and config.checkpoint_file and os.path.exists(config.checkpoint_file):
+        checkpoint = load_checkpoint(config.checkpoint_file)
+        config = resume_config(config, checkpoint)
+        if checkpoint.generation >= config.max_generations:
+            raise ValueError(f"O checkpoint já está na geração {checkpoint.generation}, informe um nº máximo de gerações maior")
+
+    # Geradores independentes p/ cada componente, derivados de uma única semente ( gravada na configuração, mesmo se sorteada )
+    if checkpoint is None:
+        streams = RandomStreams(config.seed)
+        config = replace(config, seed=streams.seed)
+    else:
+        streams = RandomStreams.from_state(checkpoint.random_state)
+
+    teams, context = load_problem(config)
+
+    evaluator = ParallelEvaluator(context, config.n_workers, config.chunk_size, config.full_season) if config.parallel_evaluation else None
+    fitness_cache = FitnessCache(context, config.fitness_cache_size, evaluator.evaluate_population if evaluator else None, config.full_season)
+    result = SolverResult(context, None, None, 0, DownsampledSeries(config.history_points), seed=config.seed)
+    controller = RunController.from_config(config)
+    if telemetry is None:
+        telemetry = Telemetry.from_file(config.telemetry_file)
+
+    if checkpoint is None:
+        population = generate_initial_population(config, teams, context, streams)
+        first_generation = 1
+    else:
+        population = list(checkpoint.population)
+        fitness_cache.store_population(checkpoint.population, checkpoint.population_fitness)
+        fitness_cache.hits, fitness_cache.misses = checkpoint.cache_hits, checkpoint.cache_misses
+        if checkpoint.controller_state:
+            controller.set_state(checkpoint.controller_state)
+        result.fitness_history = DownsampledSeries.from_state(checkpoint.fitness_history)
+        first_generation = checkpoint.generation + 1
+
+    # Histórico em arquivo ( na continuação, descarta os registros gravados após o checkpoint )
+    history = HistoryWriter(config.history_file, first_generation - 1 if checkpoint else None) if config.history_file else None
+
+    try:
+        for generation in range(first_generation, config.max_generations + 1):
+
+            # Avalia de uma só vez os individuos que não estão no cache, melhora os melhores pela busca local ( se configurada )
+            # e classifica apenas os melhores ( Elitismo )
+            with telemetry.stage("fitness"):
+                population_fitness = fitness_cache.evaluate_population(np.stack(population))
+            if config.local_search_size:
+                with telemetry.stage("local_search"):
+                    improve_population(population, population_fitness, config, context, fitness_cache, streams)
+            with telemetry.stage("diversity"):
+                result.diversity = estimate_population_diversity(population, config.diversity_samples, streams.numpy("diversity"))
+            with telemetry.stage("sort"):
+                elite = rank_population(population_fitness, config.elite_size)
+
+            result.best_solution = population[elite[0]]
+            result.best_fitness = population_fitness[elite[0]]
+            result.n_generations = generation
+            result.fitness_history.append(generation, float(result.best_fitness))
+            result.cache_hits, result.cache_misses = fitness_cache.hits, fitness_cache.misses
+            if history:
+                with telemetry.stage("io"):
+                    history.write(generation, population_fitness, result.best_solution, result.diversity)
+
+            with telemetry.stage("render"):
+                stop = [observer(generation, population, population_fitness, result) is False for observer in observers]
+            stop_reason = controller.update(generation, population_fitness, result.diversity)
+            if any(stop):
+                stop_reason = "observer"
+            elif stop_reason is None and generation == config.max_generations:
+                stop_reason = "max_generations"
+            if stop_reason is not None:
+                result.stop_reason = stop_reason
+                break
+
+            population = evolve_population(population, population_fitness, config, context, elite, telemetry, streams,
+                                           controller.mutation_probability, controller.mutation_intensity, generation, evaluator, fitness_cache)
+            if config.checkpoint_file and generation % config.checkpoint_interval == 0:
+                with telemetry.stage("io"):
+                    write_checkpoint(config, generation, population, fitness_cache, result, streams, controller)
+            telemetry.end_generation(generation, population_fitness, fitness_cache.hits, fitness_cache.misses, result.diversity)
+
+        with telemetry.stage("io"):
+            if config.output_file:
+                generate_tco_file(decode_season(get_output_season(config, result.best_solution)), config.output_file, config.sep, config.encoding, teams)
+            if config.checkpoint_file:
+                # Gera a próxima geração ( como numa execução sem interrupção ) p/ que a continuação seja idêntica
+                next_population = evolve_population(population, population_fitness, config, context, elite, streams=streams,
+                                                    mutation_probability=controller.mutation_probability,
+                                                    mutation_intensity=controller.mutation_intensity, generation=result.n_generations,
+                                                    evaluator=evaluator, fitness_cache=fitness_cache)
+                write_checkpoint(config, result.n_generations, next_population, fitness_cache, result, streams, controller)
+        telemetry.end_generation(result.n_generations, population_fitness, fitness_cache.hits, fitness_cache.misses, result.diversity)
+    finally:
+        if evaluator:
+            evaluator.close()
+        if history:
+            history.close()
+        telemetry.close()
+
+    return result
+
+def print_generation(generation: int, population: List[np.ndarray], population_fitness: np.ndarray, result: SolverResult):
+    """
+    Observador que mostra no terminal a aptidão da melhor solução de cada geração
+    """
+    print(f"Generation {generation}: Best fitness = {round(result.best_fitness, 2)}")
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Cria o interpretador dos argumentos da linha de comando com os parâmetros de execução do Solver
+    """
+    default = SolverConfig()
+    parser = argparse.ArgumentParser(description="Gera Tabela Otimizada de Jogos de Campeonato Esportivo utilizando Algoritmo Genético")
+    parser.add_argument("--teams", dest="teams_file", default=default.teams_file, help="arquivo .csv com os dados das Equipes")
+    parser.add_argument("--sep", default=default.sep, help="separador das colunas dos arquivos .csv")
+    parser.add_argument("--encoding", default=default.encoding, help="encoding dos arquivos .csv")
+    parser.add_argument("--population-size", type=int, default=default.population_size, help="tamanho da população ( padrão: 20 x nº de Equipes )")
+    parser.add_argument("--constructive-fraction", type=float, default=default.constructive_fraction, help="fração da população inicial gerada com o nº mínimo de quebras")
+    parser.add_argument("--constructive-candidates", type=int, default=default.constructive_candidates, help="nº de variantes sorteadas p/ cada individuo construtivo")
+    parser.add_argument("--max-generations", type=int, default=default.max_generations, help="nº máximo de gerações")
+    parser.add_argument("--full-season", action="store_true", help="otimiza o Campeonato completo ( turno e returno espelhado )")
+    parser.add_argument("--mutation-probability", type=float, default=default.mutation_probability, help="probabilidade de mutação")
+    parser.add_argument("--mutation-intensity", type=float, default=default.mutation_intensity, help="intensidade da mutação")
+    parser.add_argument("--adaptive-mutation", action="store_true", help="adapta as taxas de mutação ao progresso da aptidão")
+    parser.add_argument("--adaptation-window", type=int, default=default.adaptation_window, help="nº de gerações sem melhoria entre os aumentos das taxas de mutação")
+    parser.add_argument("--patience", type=int, default=default.patience, help="encerra após este nº de gerações sem melhoria da aptidão")
+    parser.add_argument("--target-fitness", type=float, default=default.target_fitness, help="encerra quando a melhor aptidão atinge este valor")
+    parser.add_argument("--time-limit", type=float, default=default.time_limit, help="tempo máximo ( segundos ) de execução")
+    parser.add_argument("--min-diversity", type=float, default=default.min_diversity, help="encerra quando a diversidade da população ( distância de Hamming média entre os mandos de campo ) fica abaixo deste valor")
+    parser.add_argument("--reject-duplicates", action="store_true", help="aplica nova mutação aos filhos idênticos a um individuo da nova população")
+    parser.add_argument("--duplicate-retries", type=int, default=default.duplicate_retries, help="nº máximo de novas mutações de um filho repetido")
+    parser.add_argument("--diversity-samples", type=int, default=default.diversity_samples, help="nº de pares de individuos sorteados p/ estimar a diversidade")
+    parser.add_argument("--offspring-chunk-size", type=int, default=default.offspring_chunk_size, help="nº de filhos por bloco ( cada bloco com os seus próprios geradores de números aleatórios )")
+    parser.add_argument("--elite-size", type=int, default=default.elite_size, help="nº de melhores individuos mantidos na geração seguinte")
+    parser.add_argument("--selection", dest="selection_strategy", choices=list(SELECTION_STRATEGIES), default=default.selection_strategy, help="estratégia de seleção dos pais")
+    parser.add_argument("--tournament-size", type=int, default=default.tournament_size, help="nº de individuos em cada torneio ( --selection tournament )")
+    parser.add_argument("--local-search", dest="local_search_size", type=int, default=default.local_search_size, help="nº de melhores individuos melhorados pela busca local a cada geração ( 0 = sem busca local )")
+    parser.add_argument("--local-search-moves", type=int, default=default.local_search_moves, help="nº máximo de movimentos avaliados pela busca local a cada geração")
+    parser.add_argument("--local-search-time", type=float, default=default.local_search_time, help="tempo máximo ( segundos ) da busca local a cada geração")
+    parser.add_argument("--seed", type=int, default=default.seed, help="semente dos geradores de números aleatórios")
+    parser.add_argument("--output", dest="output_file", default=default.output_file, help="arquivo .csv a ser gerado com a melhor Tabela")
+    parser.add_argument("--cache-size", dest="fitness_cache_size", type=int, default=default.fitness_cache_size, help="nº máximo de Tabelas no cache de aptidão")
+    parser.add_argument("--parallel", dest="parallel_evaluation", action="store_true", help="avalia a população e gera os filhos em vários processos")
+    parser.add_argument("--workers", dest="n_workers", type=int, default=default.n_workers, help="nº de processos ( padrão: nº de CPUs )")
+    parser.add_argument("--chunk-size", type=int, default=default.chunk_size, help="nº de Tabelas por tarefa na avaliação paralela")
+    parser.add_argument("--distance-cache-dir", default=default.distance_cache_dir, help="diretório onde as distâncias entre as cidades são gravadas ( vazio = não grava )")
+    parser.add_argument("--telemetry", dest="telemetry_file", default=default.telemetry_file, help="arquivo .csv / .jsonl a ser gerado com a telemetria de cada geração")
+    parser.add_argument("--history", dest="history_file", default=default.history_file, help="arquivo .jsonl a ser gerado com o histórico de cada geração")
+    parser.add_argument("--history-points", type=int, default=default.history_points, help="nº máximo de pontos da série da melhor aptidão mantida em memória")
+    parser.add_argument("--checkpoint", dest="checkpoint_file", default=default.checkpoint_file, help="arquivo .npz com a situação da execução ( gravado periodicamente e ao final )")
+    parser.add_argument("--checkpoint-interval", type=int, default=default.checkpoint_interval, help="nº de gerações entre as gravações do checkpoint")
+    parser.add_argument("--resume", action="store_true", help="continua a execução gravada no arquivo --checkpoint")
+    parser.add_argument("--quiet", action="store_true", help="não mostra o progresso de cada geração")
+
+    return parser
+
+def config_from_args(args: dict) -> SolverConfig:
+    """
+    Gera os parâmetros de execução do Solver à partir dos argumentos interpretados ( os demais argumentos são ignorados )
+    """
+    return SolverConfig(**{config_field.name: args[config_field.name] for config_field in fields(SolverConfig) if config_field.name in args})
+
+def parse_args(argv: List[str] = None) -> Tuple[SolverConfig, bool]:
+    """
+    Converte os argumentos da linha de comando nos parâmetros de execução do Solver
+
+    Retorna:
+        Tupla com os parâmetros de execução e a indicação de execução silenciosa ( --quiet )
+    """
+    parser = build_parser()
+    args = vars(parser.parse_args(argv))
+    config = config_from_args(args)
+    try:
+        validate_config(config)
+    except ValueError as error:
+        parser.error(str(error))
+
+    return config, args["quiet"]
+
+def main(argv: List[str] = None) -> int:
+    config, quiet = parse_args(argv)
+    observers = [] if quiet else [print_generation]
+
+    result = solve(config, observers)
+
+    print(f"Best fitness = {result.best_fitness:.2f} after {result.n_generations} generations")
+    print(f"Stop reason: {result.stop_reason} ( {STOP_REASONS[result.stop_reason]} )")
+    print(f"Diversity = {result.diversity:.4f}")
+    print(f"Fitness cache: {result.cache_hits} hits, {result.cache_misses} misses")
+    print(f"Seed = {result.seed}")
+    if config.output_file:
+        print(f"Tabela gravada em {config.output_file}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,147 +1,85 @@
 # Gera Tabela Otimizada de Jogos de Campeonato Esportivo utilizando Algoritmo Genético
+# Versão com visualização da evolução no Pygame ( p/ execução sem interface gráfica utilize solver.py )
 
-import pygame
-from pygame.locals import *
-import random
-import itertools
-from genetic_algorithm import mutate, order_crossover,  calculate_fitness, sort_population
-from utils_tco import *
-from draw_functions import draw_plot, draw_team_games
 import sys
-import numpy as np
+from solver import SolverConfig, solve, print_generation, get_output_season
+from run_controller import STOP_REASONS
+from utils_tco import *
+from draw_functions import PygameObserver
+from random_streams import RandomStreams
 
 # Define os valores das constantes
 # pygame
 WIDTH, HEIGHT = 800, 450
 FPS = 30
+REDRAW_GENERATIONS = 1 # Nº mínimo de gerações entre os desenhos
+REDRAW_INTERVAL_MS = 250 # Tempo mínimo ( milissegundos ) entre os desenhos
 
-# Define as cores a serem usada no pygam
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
-BLUE = (0, 0, 255)
-
-# Inicializa o problema
-
-# Lê o arquivo como os dados das Equipes Participantes do Campeonato Esportivo e gera uma lista de dicionários
+# Arquivo com os dados das Equipes Participantes do Campeonato Esportivo
 arq = "dados/Times_Brasileirao_2025_Serie_A.csv"
 sep = ";"
 encoding = "ISO-8859-1"
-teams = generate_teams_list_by_file(arq, sep, encoding)
-
-# Gera uma Matriz com os deslocamentos necessários p/ a realização de cada jogo ( distância entre as cidades sede das Equipes envolvidas no jogo)
-matrix_distances = generate_matrix_distances(teams)
 
-# Somatório das distâncias a serem percorridas por cada Equipe ( pois toda Equipe irá visitar as outras uma vez )
-# Levando em conta apenas a viagem de ida
-# sum_total_distance = np.sum(matrix_distances)
-# print(f"Soma Total de Deslocamentos: {sum_total_distance:.2f} km\n")
-
-# Gera uma Lista com o Código de cada Equipe e o respectivo valor total dos deslocamentos em Km desta Equipe como Visitante durante o Campeonato
-teams_distance_traveled = generate_teams_distance_traveled(matrix_distances)
-
-# Gera uma lista com o nome de cada Cidade e o nº de equipes participantes do Campeonato sediadas nela
-city_n_teams = generate_city_n_teams(teams)
-
-# Gera uma lista com os códigos de todos os possíveis jogos
-possible_games = generate_possible_games(teams)
+# Arquivo a ser gerado com a melhor solução encontrada
+tco_file = "dados/Tabela_Brasileirao_2025_Serie_A_Otimizada.csv"
 
 # Constantes do Algoritmo Genético
-N_TEAMS = len(teams)
-POPULATION_SIZE = N_TEAMS * 20
-N_GENERATIONS = None
+FULL_SEASON = False # Otimiza o Campeonato completo ( turno e returno espelhado ) em vez de apenas o turno
+POPULATION_SIZE = None # None = 20 x nº de Equipes
+CONSTRUCTIVE_FRACTION = 0.5 # Fração da população inicial gerada com o nº mínimo de quebras ( o restante é aleatório, p/ diversidade )
+CONSTRUCTIVE_CANDIDATES = 4 # Nº de variantes sorteadas p/ cada individuo construtivo ( mais candidatos = melhor aptidão, menos diversidade )
 N_MAX_GENERATIONS = 2000
 MUTATION_PROBABILITY = 0.5
 MUTATION_ITENSITY = 0.1
-
-# Cria a População Inicial de Soluções ( TCO - Tabela de Campeonato Otimizado )
-# Cada Solução é uma sequência de jogos ( Cromossomo ), onde cada jogo é representado por um código de 4 digítos ( Gene )
-# Cada código de jogo contém o código da Equipe Mandante e da Visitante
-# Portanto, os jogos de ida e de volta terão códigos distintos
-population = generate_random_season_games(teams, POPULATION_SIZE)
-
-best_fitness_values = []
-best_solutions = []
-
-# Inicializa o Pygame
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("TCO Solver using Pygame")
-clock = pygame.time.Clock()
-generation_counter = itertools.count(start=1)  # Start the counter at 1
-
-# Loop principal 
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_q:
-                running = False
-
-    generation = next(generation_counter)
-
-    screen.fill(WHITE)
-
-    # Gera um Lista com o fitness (aptidão) de cada individuo 
-    population_fitness = [calculate_fitness(individual, teams, matrix_distances, city_n_teams, teams_distance_traveled) for individual in population]
-
-    # Ordena a população de acordo com a sua aptidão (fitness)
-    population, population_fitness = sort_population(
-        population,  population_fitness)
-
-    # Calcula o fitness (aptidão) do melhor individuo (Tabela com o menor número de penalidades)
-    best_fitness = calculate_fitness(population[0], teams, matrix_distances, city_n_teams, teams_distance_traveled)
-    best_solution = population[0]
-
-    # Armazena a melhor solução e seu respectivo fitness em listas distintas
-    best_fitness_values.append(best_fitness)
-    best_solutions.append(best_solution)
-
-    # Mostra o gráfico com a evolução do valor de fitness da melhor solução X o nº da geração
-    draw_plot(screen, list(range(len(best_fitness_values))),
-              best_fitness_values, y_label="Fitness - Sum of Penalties (points)")
-    
-    # Mostra a sequência de jogos um dos times (escolhido aleatoriamente) extraída da Tabela da melhor solução encontrada na respectiva geração
-    draw_team_games(screen, best_solution, teams, BLACK, BLUE)
-
-    print(f"Generation {generation}: Best fitness = {round(best_fitness, 2)}")
-
-    if generation == N_MAX_GENERATIONS:
-        break
-
-    # Mantém na nova população a melhor solução encontrada na geração atual (Elitismo)
-    new_population = [population[0]]
-
-    while len(new_population) < POPULATION_SIZE:
-
-        # seleção baseada na probabilidade de aptidão, isto é, individuos melhores adaptados (fitness menor) tem maior chance de serem escolhidos
-        probability = 1 / np.array(population_fitness)
-        parent1, parent2 = random.choices(population, weights=probability, k=2)
-
-        # cria novo individuo à partir do cruzamento dos 2 indivíduos escolhidos anteriormente
-        child1 = order_crossover(parent1, parent2, possible_games)
-
-        # realiza ou não mutação no novo individuo
-        child1 = mutate(child1, MUTATION_PROBABILITY, MUTATION_ITENSITY, teams) 
-
-        new_population.append(child1)
-
-    population = new_population
-
-    pygame.display.flip()
-    clock.tick(FPS)
-
-# grava a melhor solução encontrada em um arquivo
-tco_file = "dados/Tabela_Brasileirao_2025_Serie_A_Otimizada.csv"
-sep = ";"
-encoding = "ISO-8859-1"
-generate_tco_file(best_solution, tco_file, sep, encoding, teams)
-
-# mostra os jogos da melhor solução encontrada no terminal
-print_list_games_by_round(best_solution, teams)
+ADAPTIVE_MUTATION = True # Aumenta a probabilidade e a intensidade da mutação enquanto a aptidão não melhora
+PATIENCE = 200 # Encerra após este nº de gerações sem melhoria da aptidão ( None = não encerra )
+TARGET_FITNESS = None # Encerra quando a melhor aptidão atinge este valor ( None = não encerra )
+TIME_LIMIT = None # Tempo máximo ( segundos ) de execução ( None = sem limite )
+MIN_DIVERSITY = None # Encerra quando a diversidade da população ( distância de Hamming média entre os mandos de campo, 0 a ~0.5 ) fica abaixo deste valor ( None = não encerra )
+REJECT_DUPLICATES = True # Aplica nova mutação aos filhos idênticos a um individuo já inserido na nova população
+ELITE_SIZE = 1 # Nº de melhores individuos mantidos na geração seguinte
+SELECTION_STRATEGY = "roulette" # "roulette", "tournament", "rank" ou "sus"
+TOURNAMENT_SIZE = 3
+LOCAL_SEARCH_SIZE = 2 # Nº de melhores individuos melhorados pela busca local a cada geração ( 0 = sem busca local )
+LOCAL_SEARCH_MOVES = 1000 # Nº máximo de movimentos avaliados pela busca local a cada geração
+LOCAL_SEARCH_TIME = None # Tempo máximo ( segundos ) da busca local a cada geração ( None = sem limite )
+SEED = 42 # Semente dos geradores de números aleatórios ( mesma semente = mesma Tabela; None = Tabela diferente a cada execução )
+FITNESS_CACHE_SIZE = 100000
+PARALLEL_EVALUATION = False # Avalia a população em vários processos
+N_WORKERS = None # Nº de processos ( None = nº de CPUs )
+CHUNK_SIZE = None # Nº de Tabelas por tarefa ( None = população dividida igualmente entre os processos )
+CHECKPOINT_FILE = None # Arquivo .npz com a situação da execução, p/ continuar após interrupção ( None = não grava )
+CHECKPOINT_INTERVAL = 50 # Nº de gerações entre as gravações do checkpoint
+RESUME = False # Continua a execução gravada em CHECKPOINT_FILE
+TELEMETRY_FILE = None # Arquivo .csv / .jsonl com o tempo de cada etapa e as estatísticas de cada geração ( None = desabilitada )
+HISTORY_FILE = None # Arquivo .jsonl com o histórico de cada geração e a melhor Tabela quando ela melhora ( None = não grava )
+
+config = SolverConfig(teams_file=arq, sep=sep, encoding=encoding, population_size=POPULATION_SIZE,
+                      constructive_fraction=CONSTRUCTIVE_FRACTION, constructive_candidates=CONSTRUCTIVE_CANDIDATES,
+                      max_generations=N_MAX_GENERATIONS, full_season=FULL_SEASON, mutation_probability=MUTATION_PROBABILITY,
+                      mutation_intensity=MUTATION_ITENSITY, adaptive_mutation=ADAPTIVE_MUTATION, patience=PATIENCE,
+                      target_fitness=TARGET_FITNESS, time_limit=TIME_LIMIT, min_diversity=MIN_DIVERSITY,
+                      reject_duplicates=REJECT_DUPLICATES, elite_size=ELITE_SIZE, selection_strategy=SELECTION_STRATEGY,
+                      tournament_size=TOURNAMENT_SIZE, local_search_size=LOCAL_SEARCH_SIZE,
+                      local_search_moves=LOCAL_SEARCH_MOVES, local_search_time=LOCAL_SEARCH_TIME, seed=SEED, output_file=tco_file, fitness_cache_size=FITNESS_CACHE_SIZE,
+                      parallel_evaluation=PARALLEL_EVALUATION, n_workers=N_WORKERS, chunk_size=CHUNK_SIZE,
+                      telemetry_file=TELEMETRY_FILE, history_file=HISTORY_FILE, checkpoint_file=CHECKPOINT_FILE,
+                      checkpoint_interval=CHECKPOINT_INTERVAL, resume=RESUME)
+
+# Executa o Algoritmo Genético mostrando a evolução no Pygame
+# O programa para na geração N_MAX_GENERATIONS, ao atender um dos critérios de parada ( PATIENCE, TARGET_FITNESS, TIME_LIMIT, MIN_DIVERSITY ),
+# ou a qualquer momento pressionando a tecla 'q'
+# O time mostrado na janela é sorteado por um gerador próprio, que não altera a sequência aleatória do Algoritmo Genético
+pygame_observer = PygameObserver(WIDTH, HEIGHT, FPS, REDRAW_GENERATIONS, REDRAW_INTERVAL_MS, RandomStreams(SEED).python("render"))
+result = solve(config, [print_generation, pygame_observer])
+
+print(f"Fitness cache: {result.cache_hits} hits, {result.cache_misses} misses")
+print(f"Seed = {result.seed}")
+print(f"Stop reason: {result.stop_reason} ( {STOP_REASONS[result.stop_reason]} ) after {result.n_generations} generations")
+
+# mostra os jogos da melhor solução encontrada no terminal ( a solução também é gravada em tco_file )
+print_list_games_by_round(decode_season(get_output_season(config, result.best_solution)), list(result.context.teams))
 
 # exit software
-pygame.quit()
-sys.exit()
\ No newline at end of file
+pygame_observer.close()
+sys.exit()
@@ -0,0 +1,179 @@
+# Telemetria da execução do Algoritmo Genético
+# Registra o tempo e o nº de chamadas de cada etapa da geração ( aptidão, busca local, diversidade, ordenação, seleção, cruzamento, mutação,
+# geração paralela dos filhos, desenho, gravação ),
+# o aproveitamento do cache de aptidão, as estatísticas de aptidão e a diversidade da população, enviando um registro por geração
+# a um arquivo .csv / .jsonl ou a funções informadas
+# Quando desabilitada ( sem destinos ) as etapas não são medidas e o custo se resume a uma chamada de método
+
+import csv
+import json
+import time
+from typing import Callable, List
+import numpy as np
+
+# Etapas medidas em cada geração
+STAGES = ("fitness", "local_search", "diversity", "sort", "selection", "crossover", "mutation", "offspring", "render", "io")
+
+class _Stage:
+    """
+    Mede o tempo de uma etapa ( gerenciador de contexto reutilizado a cada chamada )
+    """
+
+    def __init__(self):
+        self.time = 0.00
+        self.calls = 0
+        self._start = 0.00
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.time += time.perf_counter() - self._start
+        self.calls += 1
+
+class _NullStage:
+    """
+    Etapa da telemetria desabilitada ( não mede nada )
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+_NULL_STAGE = _NullStage()
+
+class CsvTelemetryWriter:
+    """
+    Grava os registros da telemetria num arquivo .csv ( as colunas são definidas pelo primeiro registro )
+    """
+
+    def __init__(self, arq: str):
+        self._file = open(arq, "w", newline="", encoding="utf-8")
+        self._writer = None
+
+    def __call__(self, record: dict):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(record))
+            self._writer.writeheader()
+        self._writer.writerow(record)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+class JsonlTelemetryWriter:
+    """
+    Grava os registros da telemetria num arquivo .jsonl ( um objeto JSON por linha )
+    """
+
+    def __init__(self, arq: str):
+        self._file = open(arq, "w", encoding="utf-8")
+
+    def __call__(self, record: dict):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def generate_telemetry_writer(arq: str):
+    """
+    Cria o gravador da telemetria de acordo com a extensão do arquivo ( .csv ou .jsonl )
+    """
+    if arq.endswith(".csv"):
+        return CsvTelemetryWriter(arq)
+    if arq.endswith(".jsonl") or arq.endswith(".json"):
+        return JsonlTelemetryWriter(arq)
+    raise ValueError(f"Formato de arquivo de telemetria inválido: {arq} ( utilize .csv ou .jsonl )")
+
+class Telemetry:
+    """
+    Coleta a telemetria de cada geração e envia o registro aos destinos informados
+
+    Uso:
+        with telemetry.stage("crossover"):
+            ...
+        telemetry.end_generation(generation, population_fitness, cache_hits, cache_misses, diversity)
+
+    Cada registro contém:
+        generation, time_s ( tempo total desde o registro anterior ), <etapa>_time_s e <etapa>_calls de cada etapa,
+        cache_hits, cache_misses e cache_hit_rate da geração, population_size, best_fitness, mean_fitness, std_fitness e diversity
+
+    Parâmetros:
+        sinks (list): Funções que recebem cada registro ( dict ), por exemplo CsvTelemetryWriter / JsonlTelemetryWriter
+    """
+
+    def __init__(self, sinks: List[Callable[[dict], None]] = ()):
+        self.sinks = list(sinks)
+        self.enabled = bool(self.sinks)
+        self._stages = {stage: _Stage() for stage in STAGES}
+        self._start = time.perf_counter()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @classmethod
+    def from_file(cls, arq: str = None) -> "Telemetry":
+        """
+        Cria a telemetria gravando no arquivo informado ( None = desabilitada )
+        """
+        return cls([generate_telemetry_writer(arq)] if arq else [])
+
+    def stage(self, name: str):
+        """
+        Retorna o gerenciador de contexto que mede a etapa informada
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._stages[name]
+
+    def end_generation(self, generation: int, population_fitness: np.ndarray, cache_hits: int = 0, cache_misses: int = 0, diversity: float = None):
+        """
+        Fecha o registro da geração, envia-o aos destinos e reinicia as medições
+
+        Parâmetros:
+            generation (int): Nº da geração
+            population_fitness (np.ndarray): Aptidão de cada individuo da população
+            cache_hits, cache_misses (int): Totais acumulados de consultas ao cache de aptidão
+            diversity (float): Diversidade da população ( estimate_population_diversity, None = não medida )
+        """
+        if not self.enabled:
+            return
+
+        now = time.perf_counter()
+        population_fitness = np.asarray(population_fitness)
+        generation_hits = cache_hits - self._cache_hits
+        generation_misses = cache_misses - self._cache_misses
+        n_queries = generation_hits + generation_misses
+
+        record = {"generation": generation, "time_s": now - self._start}
+        for name, stage in self._stages.items():
+            record[f"{name}_time_s"] = stage.time
+            record[f"{name}_calls"] = stage.calls
+            stage.time, stage.calls = 0.00, 0
+        record.update({
+            "cache_hits": generation_hits,
+            "cache_misses": generation_misses,
+            "cache_hit_rate": generation_hits / n_queries if n_queries else 0.00,
+            "population_size": len(population_fitness),
+            "best_fitness": float(population_fitness.min()),
+            "mean_fitness": float(population_fitness.mean()),
+            "std_fitness": float(population_fitness.std()),
+            "diversity": diversity,
+        })
+
+        self._start = now
+        self._cache_hits, self._cache_misses = cache_hits, cache_misses
+
+        for sink in self.sinks:
+            sink(record)
+
+    def close(self):
+        """
+        Fecha os destinos que possuem o método close ( arquivos )
+        """
+        for sink in self.sinks:
+            if hasattr(sink, "close"):
+                sink.close()
@@ -3,7 +3,9 @@
 
 import pandas as pd
 import numpy as np
+import hashlib
 import math
+import os
 import random
 import re
 from collections import Counter
@@ -12,7 +14,7 @@ def generate_teams_list_by_file(arq: str, sep: str, encoding: str):
     """
     Lê um arquivo em formato .csv e cria uma Lista de Dicionários contendo dados de cada equipe do Campeonato
     Campos obrigatórios que devem constar no Arquivo:
-      Codigo - Contendo até 2 digítos numéricos )
+      Codigo - Número da Equipe, de 1 ao nº de Equipes ( normalizado c/ zeros à esquerda p/ get_code_len digítos )
       Cidade - Nome da Cidade sede do team)
       Latitude - Latitude de Localização da Cidade)
       Longitude - Longitude de Localização da Cidade)
@@ -31,36 +33,55 @@ def generate_teams_list_by_file(arq: str, sep: str, encoding: str):
 
     # Converter para uma lista de dicionários
     teams = df.to_dict(orient="records")
+
+    # Todos os Códigos com a mesma quantidade de digítos ( 2 até 99 Equipes )
+    code_len = get_code_len(len(teams))
+    for team in teams:
+        team["Codigo"] = f"{int(team['Codigo']):0{code_len}}"
+
     return teams
 
+def get_code_len(n_teams: int) -> int:
+    """
+    Informa a quantidade de digítos do Código das Equipes de um Campeonato ( no mínimo 2 )
+
+    Parâmetros:
+        n_teams (int): Quantidade de Equipes participantes do Campeonato
+
+    Retorna:
+        int: Quantidade de digítos de cada Código ( cada jogo é representado por 2 Códigos )
+    """
+    return max(2, len(str(n_teams)))
+
 def generate_matrix_distances(teams: list):
     '''
     Gera uma Matriz com os deslocamentos necessários p/ a realização de cada jogo 
     Deslocamento calculado pela distância entre as cidades sede das Equipes envolvidas no jogo
+    As distâncias de todos os pares de Equipes são calculadas de uma só vez ( fórmula de Haversine vetorizada com o NumPy )
 
     Parâmetros:
         teams - Lista com os dados das Equipes participantes do Campeonato
 
     Retorna:
-        Matriz com os deslocamentos necessários p/ a realização de cada jogo entre as equipes participantes do Campeonato
+        Matriz ( n x n ) com os deslocamentos necessários p/ a realização de cada jogo entre as equipes participantes do Campeonato
     '''
-    
-    # Criar matriz ( n x n )
-    n = len(teams)
-    matrix_distances = np.zeros((20, 20))
-    
-    # Preencher a matriz com distâncias entre cidades
-    for i in range(n):
-        for j in range(n):
-            # Coordenadas das cidades
-            city1 = (teams[i]['Latitude'], teams[i]['Longitude'])
-            city2 = (teams[j]['Latitude'], teams[j]['Longitude'])
 
-            # Calcular distância
-            distance = calculate_distance(city1, city2)
+    # Raio médio da Terra em km
+    R = 6371.0
+
+    # Coordenadas das cidades em radianos
+    latitude = np.radians(np.array([team['Latitude'] for team in teams], dtype=float))
+    longitude = np.radians(np.array([team['Longitude'] for team in teams], dtype=float))
 
-            matrix_distances[i, j] = distance
+    # Diferença das coordenadas entre todos os pares de cidades ( n x n )
+    dlat = latitude[None, :] - latitude[:, None]
+    dlon = longitude[None, :] - longitude[:, None]
 
+    # Fórmula de Haversine
+    a = np.sin(dlat / 2)**2 + np.cos(latitude)[:, None] * np.cos(latitude)[None, :] * np.sin(dlon / 2)**2
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    matrix_distances = R * c
     return matrix_distances
     
 def generate_teams_distance_traveled(matrix_distances: list):
@@ -74,22 +95,56 @@ def generate_teams_distance_traveled(matrix_distances: list):
         Lista com o Código de cada Equipe e respectivo valor total dos deslocamentos em Km
     '''
 
+    matrix_distances = np.asarray(matrix_distances)
     n_teams = len(matrix_distances)
 
-    # Inicializa um dicionário para armazenar a distância percorrida por cada equipe
-    teams_distance_traveled = {f"{i:02}": 0 for i in range(1, (n_teams+1))}
+    # Soma da distância percorrida por cada equipe como visitante ( todos os adversários, exceto ela mesma )
+    total_distances = matrix_distances.sum(axis=1) - np.diagonal(matrix_distances)
 
-    # Calcular a distância percorrida por cada equipe nos jogos fora de casa
-    for team in range(n_teams):
-        for opponent in range(n_teams):
-            if team != opponent:
-                # Convertendo índice numérico para string de dois dígitos
-                team_key = f"{team+1:02}"
-                # Somando a distância percorrida como visitante
-                teams_distance_traveled[team_key] += matrix_distances[team][opponent]
+    # Dicionário com a distância percorrida por cada equipe, pelo Código ( índice + 1 com get_code_len dígitos )
+    code_len = get_code_len(n_teams)
+    teams_distance_traveled = {f"{team+1:0{code_len}}": total_distance for team, total_distance in enumerate(total_distances.tolist())}
 
     return teams_distance_traveled
 
+def load_matrix_distances(arq: str, teams: list, cache_dir: str = "cache"):
+    '''
+    Obtém a Matriz de distâncias e o total dos deslocamentos de cada Equipe, reutilizando os valores gravados em disco
+    O arquivo em disco é identificado pelo hash do conteúdo do arquivo de Equipes, portanto qualquer alteração neste arquivo gera novos valores
+
+    Parâmetros:
+        arq - path do Arquivo de Equipes ( o mesmo lido por generate_teams_list_by_file )
+        teams - Lista com os dados das Equipes participantes do Campeonato
+        cache_dir - Diretório dos arquivos gravados ( None = não utiliza o disco )
+
+    Retorna:
+        Tupla com a Matriz de distâncias e a Lista com o Código de cada Equipe e respectivo valor total dos deslocamentos em Km
+    '''
+
+    cache_file = None
+    if cache_dir:
+        with open(arq, "rb") as teams_file:
+            teams_hash = hashlib.sha256(teams_file.read()).hexdigest()
+        cache_file = os.path.join(cache_dir, f"distances_{teams_hash}.npz")
+        if os.path.exists(cache_file):
+            with np.load(cache_file) as cache:
+                matrix_distances = cache["matrix_distances"]
+                total_distances = cache["teams_distance_traveled"]
+            code_len = get_code_len(len(total_distances))
+            teams_distance_traveled = {f"{team+1:0{code_len}}": total_distance for team, total_distance in enumerate(total_distances.tolist())}
+            return matrix_distances, teams_distance_traveled
+
+    matrix_distances = generate_matrix_distances(teams)
+    teams_distance_traveled = generate_teams_distance_traveled(matrix_distances)
+
+    if cache_file:
+        # Grava num arquivo temporário e renomeia, p/ não deixar arquivo incompleto em caso de interrupção
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_file = cache_file + f".{os.getpid()}.tmp.npz"
+        np.savez(temp_file, matrix_distances=matrix_distances, teams_distance_traveled=np.array(list(teams_distance_traveled.values())))
+        os.replace(temp_file, cache_file)
+
+    return matrix_distances, teams_distance_traveled
 
 def generate_city_n_teams(teams: list):
     """
@@ -110,7 +165,7 @@ def generate_city_n_teams(teams: list):
     
     return city_n_teams
 
-def generate_season_games(teams: list):
+def generate_season_games(teams: list, rng: random.Random = None):
     '''
     Gera os jogos de um turno do Campeonato, com cada time jogando contra todos os outros uma vez.
     A função embaralha os times e os jogos para gerar uma tabela diferente a cada execução.
@@ -119,19 +174,23 @@ def generate_season_games(teams: list):
     
     Parâmetros:
         teams (list): Lista de Dicionários de Equipes
+        rng (random.Random): Gerador de números aleatórios ( None = módulo random )
 
     Retorna:
         Lista dividida em rodadas, sendo cada rodada um string contendo os jogos
-        Cada Rodada é representada por uma sequência de jogos, e cada jogo um sub-string de 4 digitos
-        Sendo os 2 primeiros digitos o Código da Equipe Mandante e os 2 últimos o Código da Equipe Visitante
+        Cada Rodada é representada por uma sequência de jogos, e cada jogo um sub-string de 2 Códigos ( get_code_len digitos cada )
+        Sendo o primeiro Código o da Equipe Mandante e o último o da Equipe Visitante
     '''
     
     n_teams = len(teams)
     if n_teams % 2 != 0:
         raise ValueError("O número de times deve ser par!")
     
+    if rng is None:
+        rng = random
+
     list_teams_code = [teams[i]["Codigo"] for i in range(n_teams)]
-    random.shuffle(list_teams_code) # Embaralha os times para uma tabela diferente a cada execução
+    rng.shuffle(list_teams_code) # Embaralha os times para uma tabela diferente a cada execução
 
     n_rounds = n_teams - 1
     season_all_games = {i+1: [] for i in range(n_rounds)}
@@ -166,10 +225,10 @@ def generate_season_games(teams: list):
 
     return season_games
 
-def generate_random_season_games(teams: list, population_size: int) -> list:
+def generate_random_season_games(teams: list, population_size: int, rng: random.Random = None) -> list:
     """
     Gera uma Lista de Tabelas de Jogos de um Turno do Campeonato de forma aleatória
-    Cada Tabela é uma Lista de rodadas, sendo cada rodada formada por um string de tamanho fixo ( (n_teams/2) * 4) contendo uma sequência de jogos 
+    Cada Tabela é uma Lista de rodadas, sendo cada rodada formada por um string de tamanho fixo ( n_teams * get_code_len ) contendo uma sequência de jogos 
     Restrições básicas:
         - Não é permitida o repetição de jogos entre as mesmas equipes por Turno, independente de quem seja o Mandante
         - Todas as equipes devem possuir jogo em cada rodada e apenas um jogo
@@ -177,6 +236,7 @@ def generate_random_season_games(teams: list, population_size: int) -> list:
     Parâmetros:
         n_teams (int): Quantidade de Equipes participantes do Campeonato
         population_size (int): O tamanho da população, i.e., o número de Tabelas a serem criadas
+        rng (random.Random): Gerador de números aleatórios ( None = módulo random )
 
     Retorna:
         Lista de Tabelas de Jogos
@@ -185,26 +245,135 @@ def generate_random_season_games(teams: list, population_size: int) -> list:
     random_season_games = []
 
     for n_population in range(population_size):
-        season_games = generate_season_games(teams)
+        season_games = generate_season_games(teams, rng)
         random_season_games.append(season_games)
 
     return random_season_games
 
+def generate_random_schedules(teams: list, population_size: int, rng: random.Random = None) -> np.ndarray:
+    """
+    Gera uma População de Tabelas de Jogos de um Turno do Campeonato de forma aleatória, já no formato compacto em array
+    Segue as mesmas restrições básicas de generate_random_season_games
+
+    Parâmetros:
+        teams (list): Lista de Dicionários de Equipes
+        population_size (int): O tamanho da população, i.e., o número de Tabelas a serem criadas
+        rng (random.Random): Gerador de números aleatórios ( None = módulo random )
+
+    Retorna:
+        Array ( população x rodadas x jogos x 2 ) com os índices das Equipes
+    """
+
+    random_season_games = generate_random_season_games(teams, population_size, rng)
+    code_len = get_code_len(len(teams))
+
+    return np.stack([encode_season(season_games, code_len) for season_games in random_season_games])
+
 def generate_list_games(seq_games: str, piece_len: int = 4) -> list:
     """
     Gera uma Lista de jogos à partir de um string com uma sequência de jogos
     
     Parâmetros:
-        seq_games: String com uma sequência de jogos, o tamanho deste string deve ser múltiplo de 4, pois cada jogo é representado por 4 digítos
+        seq_games: String com uma sequência de jogos, o tamanho deste string deve ser múltiplo de piece_len
+        piece_len: Quantidade de digítos de cada jogo ( 2 x get_code_len, 4 até 99 Equipes )
 
     Retorna:
-        Lista com os Jogos codificados , jogo é representado por 4 digítos
+        Lista com os Jogos codificados , jogo é representado por piece_len digítos
     """
     
     list_games = [seq_games[i:i+piece_len] for i in range(0, len(seq_games), piece_len)]
-    
+
     return list_games
 
+def get_schedule_dtype(n_teams: int):
+    """
+    Informa o menor tipo inteiro capaz de armazenar os índices das Equipes de um Campeonato
+
+    Parâmetros:
+        n_teams (int): Quantidade de Equipes participantes do Campeonato
+
+    Retorna:
+        Tipo inteiro do NumPy ( int8 até 127 equipes, int16 acima disso )
+    """
+
+    if n_teams <= np.iinfo(np.int8).max:
+        return np.int8
+    return np.int16
+
+def infer_code_len(seq_games: str) -> int:
+    """
+    Deduz a quantidade de digítos do Código das Equipes à partir de uma rodada completa ( todas as Equipes jogam )
+    É a única quantidade c tal que a rodada tem len / c Equipes e get_code_len( len / c ) == c
+
+    Parâmetros:
+        seq_games (str): String com os jogos de uma rodada
+
+    Retorna:
+        int: Quantidade de digítos de cada Código
+    """
+    for code_len in range(2, len(seq_games) + 1):
+        if len(seq_games) % code_len == 0 and get_code_len(len(seq_games) // code_len) == code_len:
+            return code_len
+    raise ValueError(f"Rodada com tamanho inválido: {len(seq_games)}")
+
+def encode_season(season: list, code_len: int = None) -> np.ndarray:
+    """
+    Converte uma Tabela no formato de strings ( uma string por rodada, 2 Códigos por jogo ) para o formato compacto em array
+    O índice de cada Equipe é o seu Código menos 1, o mesmo critério usado na Matriz de distâncias
+
+    Parâmetros:
+        season (list): Lista de rodadas, sendo cada rodada um string contendo os jogos
+        code_len (int): Quantidade de digítos do Código de cada Equipe ( None = deduzida do tamanho das rodadas )
+
+    Retorna:
+        Array ( rodadas x jogos x 2 ) com os índices das Equipes, sendo [..., 0] o Mandante e [..., 1] o Visitante
+    """
+
+    if code_len is None:
+        code_len = infer_code_len(season[0])
+    game_len = code_len * 2
+    n_rounds = len(season)
+    round_ngames = len(season[0]) // game_len
+    codes = [int(seq_games[i:i+code_len]) - 1 for seq_games in season for i in range(0, len(seq_games), code_len)]
+
+    schedule = np.array(codes, dtype=np.int16).reshape(n_rounds, round_ngames, 2)
+
+    return schedule.astype(get_schedule_dtype(round_ngames * 2), copy=False)
+
+def decode_season(schedule: np.ndarray, code_len: int = None) -> list:
+    """
+    Converte uma Tabela no formato compacto em array para o formato de strings ( uma string por rodada )
+
+    Parâmetros:
+        schedule (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes
+        code_len (int): Quantidade de digítos do Código de cada Equipe ( None = get_code_len do nº de Equipes )
+
+    Retorna:
+        Lista dividida em rodadas, sendo cada rodada um string contendo os jogos
+    """
+    if code_len is None:
+        code_len = get_code_len(schedule.shape[1] * 2)
+
+    season = []
+    for round_games in schedule.tolist():
+        season.append("".join(f"{home + 1:0{code_len}}{away + 1:0{code_len}}" for home, away in round_games))
+
+    return season
+
+def generate_full_season(schedule: np.ndarray) -> np.ndarray:
+    """
+    Gera a Tabela do Campeonato completo ( turno e returno ) à partir da Tabela do turno
+    O returno é espelhado: a rodada n do returno repete os jogos da rodada n do turno com os mandos de campo invertidos
+    Apenas o turno é guardado nas soluções, o returno é sempre derivado
+
+    Parâmetros:
+        schedule (np.ndarray): Array ( rodadas x jogos x 2 ) com os índices das Equipes do turno
+
+    Retorna:
+        Array ( 2 x rodadas x jogos x 2 ) com os índices das Equipes do turno e do returno
+    """
+    return np.concatenate((schedule, schedule[..., ::-1]))
+
 def generate_possible_games(teams = list):
     """
     Gera uma Lista contendo os códigos de todos os jogos possíveis do Campeonato
@@ -216,6 +385,7 @@ def generate_possible_games(teams = list):
         Lista com todos os jogos possíveis do Campeonato
     """
     n = len(teams)
+    code_len = get_code_len(n)
     possible_games = []
     
     # Preencher a lista de jogos possíveis
@@ -224,10 +394,10 @@ def generate_possible_games(teams = list):
             if i == j:
                 continue
             # Gera os códigos das Equipes que participarão do jogo
-            team_code1 = str((i + 1)).zfill(2)
-            team_code2 = str((j + 1)).zfill(2)
+            team_code1 = str((i + 1)).zfill(code_len)
+            team_code2 = str((j + 1)).zfill(code_len)
             # Gera o código do jogo entre as Equipes
-            # Sendo a equipe Mandante a aparece primeiro ( 2 primeiras posições ) e portanto a Visante ( 2 últimas posiçoes )
+            # Sendo a equipe Mandante a aparece primeiro ( primeiro Código ) e portanto a Visante ( último Código )
             # Teremos então códigos distintos p/ o jogo de ida e de volta
             game = team_code1 +  team_code2
 
@@ -238,7 +408,8 @@ def generate_possible_games(teams = list):
 
 def generate_season_table_by_file(arq: str, sep: str, encoding: str, teams: list):
     """
-    Lê um arquivo em formato .csv com a Tabela de jogos do primeiro turno de um Campeonato e gera uma Lista com estes jogos de maneira codificada
+    Lê um arquivo em formato .csv com a Tabela de jogos de um Campeonato ( turno ou turno e returno ) e gera uma Lista com estes jogos de maneira codificada
+    O nº de rodadas é o da última rodada informada no arquivo
     Campos obrigatórios que devem constar no Arquivo:
       Num_Jogo - Número do Jogo
       Num_Rodada - Número da Rodada
@@ -253,8 +424,8 @@ def generate_season_table_by_file(arq: str, sep: str, encoding: str, teams: list
 
     Retorna:
         Lista dividida em rodadas, sendo cada rodada um string contendo os jogos
-        Cada Rodada é representada por uma sequência de jogos, e cada jogo um sub-string de 4 digitos
-        Sendo os 2 primeiros digitos o Código da Equipe Mandante e os 2 últimos o Código da Equipe Visitante
+        Cada Rodada é representada por uma sequência de jogos, e cada jogo um sub-string de 2 Códigos ( get_code_len digitos cada )
+        Sendo o primeiro Código o da Equipe Mandante e o último o da Equipe Visitante
     """
 
     # Ler o arquivo CSV
@@ -263,7 +434,7 @@ def generate_season_table_by_file(arq: str, sep: str, encoding: str, teams: list
     # Converter para uma lista de dicionários
     games = df.to_dict(orient="records")
 
-    nrounds = len(teams) - 1
+    nrounds = max(game["Num_Rodada"] for game in games)
     season_games = ['' for _ in range(nrounds)]
 
     # Cria uma Lista de rodadas, sendo cada rodada representado por um string com uma sequência de jogos
@@ -283,7 +454,7 @@ def generate_tco_file(tco: list, arq: str, sep: str, encoding: str, teams: list)
     Gera um arquivo em formato .csv com a Tabela Otimizada de jogos de um Campeonato
 
     Parâmetros:
-        tco - Lista com todas as rodadas do primeiro turno do Campeonato
+        tco - Lista com todas as rodadas do Campeonato ( turno ou turno e returno )
         arq - path completo do Arquivo a ser gerado
         delimitador - Caractere a ser utilizado para separar as colunas do Arquivo .csv
         encoding - Encoding do arquivo 
@@ -295,16 +466,18 @@ def generate_tco_file(tco: list, arq: str, sep: str, encoding: str, teams: list)
         tco_file_csv.write("Num_Jogo" + sep + "Num_Rodada" + sep + "Mandante" + sep + "Visitante\n")
     
         n_game = 0
+        code_len = get_code_len(len(teams))
+        teams_by_code = {team["Codigo"]: team for team in teams}
 
         # Escrevendo os dados
         for n_round, seq_games in enumerate(tco, start=1):
-            list_games = generate_list_games(seq_games, 4)
+            list_games = generate_list_games(seq_games, code_len * 2)
             for game in list_games:
-                team1_code = game[:2]
-                team2_code = game[2:]
-                team1 = search_team_by_code(teams, team1_code)
+                team1_code = game[:code_len]
+                team2_code = game[code_len:]
+                team1 = teams_by_code[team1_code]
                 team1_name = team1["Nome do Time"]
-                team2 = search_team_by_code(teams, team2_code)
+                team2 = teams_by_code[team2_code]
                 team2_name = team2["Nome do Time"]
                 n_game += 1
                 tco_file_csv.write(str(n_game) + sep + str(n_round) + sep +  team1_name + sep + team2_name + "\n")
@@ -360,48 +533,42 @@ def calculate_penalty_last_home(team1_last_home: int, team2_last_home: int) -> f
 
     return penalty
 
-def calculate_penalty_last_opponent(teams: list, team1_city: str, team1_last_opponent: str, team2_city: str, team2_last_opponent: str) -> float:
+def calculate_penalty_last_opponent(context, team1_index: int, team1_last_opponent: int, team2_index: int, team2_last_opponent: int) -> float:
     """
     Calcula a penalidade verificando se na rodada anterior alguma das equipes enfrentou uma equipe da mesma cidade (clássico) e nesta rodada enfrenta outra equipe da mesma cidada
 
     Parâmetros:
-        teams (list): Lista de Dicionários de Equipes
-        team1_city (str) - Nome da Cidade do time Mandante
-        team1_last_opponent (str) - Código do adversário na rodada anterior do time Mandante
-        team2_city (str) - Nome da Cidade do time Visitante
-        team2_last_opponent (str) - Código do adversário na rodada anterior do time Visitante
+        context (ProblemContext): Contexto com os dados do Campeonato
+        team1_index (int) - Índice do time Mandante
+        team1_last_opponent (int) - Índice do adversário na rodada anterior do time Mandante ( -1 se não houver )
+        team2_index (int) - Índice do time Visitante
+        team2_last_opponent (int) - Índice do adversário na rodada anterior do time Visitante ( -1 se não houver )
         
     Retorna:
         float: Penalidade caso a situação ideal não foi encontrada
     """
 
     penalty = 0.00
+    same_city = context.same_city
     
-    if team1_city == team2_city:
-        if team1_last_opponent != '':
-            team1_last_opponent_city = get_team_city(search_team_by_code(teams, team1_last_opponent))
-        else:
-            team1_last_opponent_city = ''
-        if team1_last_opponent_city == team1_city:
+    if same_city[team1_index, team2_index]:
+        if team1_last_opponent >= 0 and same_city[team1_index, team1_last_opponent]:
             penalty += 1000
-        if team2_last_opponent != '':
-            team2_last_opponent_city = get_team_city(search_team_by_code(teams, team2_last_opponent))
-        else:
-            team2_last_opponent_city = '' 
-        if team2_last_opponent_city == team2_city:
+        if team2_last_opponent >= 0 and same_city[team2_index, team2_last_opponent]:
             penalty += 1000
     
     return penalty
     
-def calculate_penalty_ideal_city_round_n_games(team1_city: str, city_round_n_games: list) -> float:
+def calculate_penalty_ideal_city_round_n_games(context, team1_city_id: int, city_round_n_games: list) -> float:
     """
     Calcula a penalidade verificando a quantidade de jogos na rodada que acontecem na mesma cidade
     O ideal seria que a quantidade de jogos não ultrapasse o valor referente a metade do nº de times da Cidade
     Se o nº de times da cidade for impar soma-se 1 a divisão por inteiro do nº de times por 2
 
     Parâmetros:
-        team1_city (str) - Nome da Cidade do time Mandante
-        city_round_n_games (list) - Lista com o Nome de cadade Cidade, o total de equipes sediadas nela e a quantidade de jogos já contabilizados na rodada
+        context (ProblemContext): Contexto com os dados do Campeonato
+        team1_city_id (int) - Índice da Cidade do time Mandante
+        city_round_n_games (list) - Contadores ( um por Cidade ) da quantidade de jogos já contabilizados na rodada, atualizado pela função
         
     Retorna:
         float: Penalidade caso a situação ideal não foi encontrada
@@ -409,42 +576,28 @@ def calculate_penalty_ideal_city_round_n_games(team1_city: str, city_round_n_gam
 
     penalty = 0
 
-    for city in city_round_n_games:
-        if city["Cidade"] == team1_city:
-            city_n_teams = city["QtdTimes"]
-            if city_n_teams  > 1:
-                ideal_n_games = ( city_n_teams // 2 ) + (city_n_teams % 2)
-                city["JogosRodada"] += 1
-                city_round_n_games = city["JogosRodada"]
-                if city_round_n_games > ideal_n_games:
-                    penalty += 300
-            break
+    if context.city_n_teams[team1_city_id] > 1:
+        city_round_n_games[team1_city_id] += 1
+        if city_round_n_games[team1_city_id] > context.city_ideal_n_games[team1_city_id]:
+            penalty += 300
 
     return penalty
 
-def calculate_penalty_balanced_travel(teams_distance_traveled: list, teams_season_distance_traveled: list):
+def calculate_penalty_balanced_travel(context, teams_season_distance_traveled: np.ndarray):
     """
     Calcula a penalidade verificando a diferença entre a distância percorrida por cada equipe no turno e a metade da distância que esta equipe irá percorrer durante todo o campeonato
     A finalidade com isto é que a maioria dos times tenham a quantidade total de deslocamentos balanceadas por turno
 
     Parâmetros:
-        teams_distance_traveled (list) - Lista com o Código de cada Equipe e o total de deslocamentos (Km) que ela irá percorrer durante todo o campeonato
-        teams_season_distance_traveled (list) - Lista com o Código de cada Equipe e o total de deslocamentos (Km) que ela irá percorrer durante o primeiro turno do campeonato
+        context (ProblemContext): Contexto com os dados do Campeonato, inclusive a metade do total de deslocamentos de cada Equipe
+        teams_season_distance_traveled (np.ndarray) - Total de deslocamentos (Km) de cada Equipe ( pelo índice ) durante o primeiro turno do campeonato
     Retorna:
         float: Penalidade caso a situação ideal não foi encontrada
     """
 
-    penalty = 0.00
-
-    for team_code, total_distance in teams_distance_traveled.items():
-        half_total_distance = total_distance / 2
-        team_season_distance_traveled = teams_season_distance_traveled[team_code]
-        dif = half_total_distance - team_season_distance_traveled
-        if dif < 0:
-            dif = -dif
-        penalty += dif
+    penalty = np.abs(context.half_total_distance - teams_season_distance_traveled).sum()
     
-    return penalty
+    return float(penalty)
 
 def search_team_by_code(teams: list, team_code: str):
     '''
@@ -524,7 +677,7 @@ def game_inserted(seq_games: str, game: str):
 
     Parâmetros:
         seq_games - Sequência de jogos codificados
-        game - Código do jogo a ser procurado
+        game - Código do jogo a ser procurado ( o seu tamanho define o tamanho de cada jogo na sequência )
         
     Retorna:
         Boolean
@@ -532,8 +685,9 @@ def game_inserted(seq_games: str, game: str):
     
     game_inserted = False
 
-    for i in range(0, len(seq_games), 4):
-        current_game = seq_games[i:i + 4]
+    game_len = len(game)
+    for i in range(0, len(seq_games), game_len):
+        current_game = seq_games[i:i + game_len]
         if current_game == game:
             game_inserted = True
             break
@@ -547,7 +701,7 @@ def team_inserted(current_round: str, team_code1: str, team_code2: str):
     
     Parâmetros:
         current_round (str): String com os jogos já programados p/ a rodada
-        team_code1 (str): Código da Equipe 1
+        team_code1 (str): Código da Equipe 1 ( o seu tamanho define o tamanho de cada Código na rodada )
         team_code2 (str): Código da Equipe 2
         
     Retorna:
@@ -560,8 +714,9 @@ def team_inserted(current_round: str, team_code1: str, team_code2: str):
     current_round_size = len(current_round)
     team_inserted = False
 
-    for i in range(0, current_round_size, 2):
-        code = current_round[i:i + 2]
+    code_len = len(team_code1)
+    for i in range(0, current_round_size, code_len):
+        code = current_round[i:i + code_len]
         if code == team_code1 or code == team_code2:
             team_inserted = True
             break
@@ -574,17 +729,17 @@ def change_game(seq_games: str, game: str, new_game: str):
     
     Parâmetros:
         seq_games (str): String com os jogos codificados
-        game (str): Código do Jogo a ter mando trocado
+        game (str): Código do Jogo a ter mando trocado ( o seu tamanho define o tamanho de cada jogo na sequência )
         new_game (str): Novo Código do Jogo
         
     Retorna:
         String com a nova sequência dos jogos
     """
     
-    if len(game) != 4 or len(new_game) != 4:
+    if len(game) != len(new_game) or len(game) % 2 != 0:
         return seq_games
     
-    list_games = generate_list_games(seq_games, 4)
+    list_games = generate_list_games(seq_games, len(game))
     
     try:
         index = list_games.index(game)  # Encontra a posição do jogo procurado
@@ -613,19 +768,22 @@ def remove_game(list_games: list, game: str):
 
 def print_list_games_by_round(season: list, teams:list):
     """
-    Imprime todos os jogos do Turno do Campeonato por Rodada
+    Imprime todos os jogos do Campeonato ( turno ou turno e returno ) por Rodada
     
     Parâmetros:
         list_games (list): Lista com os jogos codificados
         teams - Lista com os dados das Equipes participantes do Campeonato
     """
     
+    code_len = get_code_len(len(teams))
+    teams_by_code = {team["Codigo"]: team for team in teams}
+
     for i, current_round in enumerate(season, start=1):
         print(f"\nRodada {i}:")
         games = []
-        for j in range(0, len(current_round), 4):
-            team1 = search_team_by_code(teams, current_round[j:j+2])
-            team2 = search_team_by_code(teams, current_round[j+2:j+4])
+        for j in range(0, len(current_round), code_len * 2):
+            team1 = teams_by_code[current_round[j:j+code_len]]
+            team2 = teams_by_code[current_round[j+code_len:j+code_len*2]]
             games.append(get_team_name(team1) + " x " + get_team_name(team2))
 
         for n_game, game in enumerate(games):